@@ -1,14 +1,38 @@
+import asyncio
+import json
+import os
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
 from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import StaticPool, create_engine
-from sqlalchemy.orm import sessionmaker
+from fastapi.websockets import WebSocketState
+from sqlalchemy import StaticPool, create_engine, event
+from sqlalchemy.orm import close_all_sessions, sessionmaker
 
-from src.database import Base, get_db
+from src.database import Base, get_db, is_sqlite, sync_database_url
+from src.games.infrastructure.state import game_state_engine
 from src.main import app
+from src.rooms.infrastructure.websocket import room_list_broadcaster
+
+# Por defecto los tests corren sobre SQLite en memoria; con TEST_DATABASE_URL se pueden
+# correr sobre otro backend, por ejemplo postgresql://postgres@localhost/switcher_test
+test_database_url = os.environ.get("TEST_DATABASE_URL", "sqlite:///:memory:")
+
+if is_sqlite(test_database_url):
+    engine = create_engine(test_database_url, connect_args={"check_same_thread": False}, poolclass=StaticPool)
+else:
+    engine = create_engine(sync_database_url(test_database_url))
+
+    # Los fixtures insertan filas sin respetar el orden de las claves foráneas (SQLite no las verifica),
+    # así que en PostgreSQL se desactivan los triggers de integridad referencial para los tests.
+    @event.listens_for(engine, "connect")
+    def _disable_foreign_key_checks(dbapi_connection, connection_record):
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute("SET session_replication_role = replica")
+        dbapi_connection.commit()
 
-engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
 
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -30,17 +54,66 @@ def mock_mi_funcion():
         yield mock_func
 
 
+@pytest.fixture(autouse=True)
+def reset_room_list_broadcaster():
+    # Cada test empieza sin un envío pendiente ni un intervalo en curso de los tests anteriores
+    room_list_broadcaster.clean_up()
+    yield room_list_broadcaster
+    room_list_broadcaster.clean_up()
+
+
 @pytest.fixture(scope="function")
 def test_db():
+    # El estado en memoria de las partidas corresponde a la base de datos del test anterior
+    game_state_engine.clean_up()
     Base.metadata.create_all(bind=engine)
     db = TestingSessionLocal()
     try:
         yield db
     finally:
         db.close()
+        close_all_sessions()
         Base.metadata.drop_all(bind=engine)
 
 
 @pytest.fixture(scope="function")
 def client():
     return TestClient(app)
+
+
+@contextmanager
+def count_queries():
+    """Cuenta las sentencias SQL ejecutadas sobre el engine de tests"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+class FakeWebSocket:
+    """Cliente de websocket para los tests de los administradores de conexiones:
+    guarda los mensajes recibidos y, opcionalmente, tarda `delay` segundos en recibir cada uno
+    """
+
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.client_state = WebSocketState.CONNECTED
+        self.sent: List[Dict[str, Any]] = []
+        self.close_code: Optional[int] = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(text))
+
+    async def close(self, code=1000, reason=None):
+        self.close_code = code
+        self.client_state = WebSocketState.DISCONNECTED
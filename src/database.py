@@ -1,13 +1,98 @@
 import os
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 sqlite_file_url = "../database.sqlite"
 base_dir = os.path.dirname(os.path.realpath(__file__))
-database_url = f"sqlite:///{os.path.join(base_dir, sqlite_file_url)}"
+default_database_url = f"sqlite:///{os.path.join(base_dir, sqlite_file_url)}"
 
-engine = create_engine(database_url, echo=False, pool_size=100, max_overflow=100)
+# SQLite admite un único escritor a la vez, así que un pool grande no agrega throughput de escritura.
+# El pool base cubre los hilos que acceden a la base de datos; el overflow cubre las sesiones que
+# quedan abiertas mientras dura una conexión de websocket.
+DB_POOL_SIZE = int(os.environ.get("DATABASE_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.environ.get("DATABASE_MAX_OVERFLOW", 90))
+DB_POOL_TIMEOUT = int(os.environ.get("DATABASE_POOL_TIMEOUT", 30))
+
+SQLITE_BUSY_TIMEOUT_MS = 5000
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+SQLITE_CACHE_SIZE_KIB = 64 * 1024
+
+
+def set_sqlite_pragmas(
+    engine: Engine,
+    busy_timeout: int = SQLITE_BUSY_TIMEOUT_MS,
+    mmap_size: int = SQLITE_MMAP_SIZE,
+    cache_size: int = SQLITE_CACHE_SIZE_KIB,
+) -> None:
+    """Configura cada conexión nueva del engine:
+
+    - `journal_mode=WAL`: los lectores no bloquean al escritor ni el escritor a los lectores
+    - `synchronous=NORMAL`: con WAL solo se sincroniza a disco en los checkpoints
+    - `busy_timeout`: espera (en ms) a que se libere el lock en lugar de fallar con "database is locked"
+    - `mmap_size` y `cache_size`: lecturas por memoria mapeada y cache de páginas (en KiB) por conexión
+    """
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={int(busy_timeout)}")
+        cursor.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        cursor.execute(f"PRAGMA cache_size=-{int(cache_size)}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+
+def create_sqlite_engine(
+    url: str,
+    pool_size: int = DB_POOL_SIZE,
+    max_overflow: int = DB_MAX_OVERFLOW,
+    busy_timeout: int = SQLITE_BUSY_TIMEOUT_MS,
+    mmap_size: int = SQLITE_MMAP_SIZE,
+    cache_size: int = SQLITE_CACHE_SIZE_KIB,
+    **kwargs: Any,
+) -> Engine:
+    """Crea un engine para una base de datos SQLite en archivo con los pragmas de `set_sqlite_pragmas`"""
+    engine = create_engine(url, pool_size=pool_size, max_overflow=max_overflow, **kwargs)
+    set_sqlite_pragmas(engine, busy_timeout, mmap_size, cache_size)
+    return engine
+
+
+def is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def sync_database_url(url: str) -> str:
+    """URL con el driver sincrónico de cada backend (psycopg para PostgreSQL)"""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "postgresql":
+        parsed = parsed.set(drivername="postgresql+psycopg")
+    return parsed.render_as_string(hide_password=False)
+
+
+def create_database_engine(
+    url: str, pool_size: int = DB_POOL_SIZE, max_overflow: int = DB_MAX_OVERFLOW, **kwargs: Any
+) -> Engine:
+    """Crea el engine del backend indicado por la URL (SQLite en archivo o PostgreSQL)"""
+    if is_sqlite(url):
+        return create_sqlite_engine(url, pool_size=pool_size, max_overflow=max_overflow, **kwargs)
+    return create_engine(
+        sync_database_url(url),
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_pre_ping=True,
+        **kwargs,
+    )
+
+
+database_url = os.environ.get("DATABASE_URL", default_database_url)
+
+engine = create_database_engine(database_url, echo=False)
 
 
 SessionLocal = sessionmaker(bind=engine)
@@ -15,7 +100,19 @@ SessionLocal = sessionmaker(bind=engine)
 Base = declarative_base()
 
 
+def create_missing_indexes(bind: Engine) -> None:
+    """Crea los índices declarados en los modelos que todavía no existen en una base ya creada
+    (`create_all` solo crea los índices de las tablas nuevas)
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+
+
 def get_db():
+    # No hay una sesión asíncrona: los servicios ejecutan el acceso a la base de datos con `run_blocking`
+    # (src/shared/executor.py), que no frena el event loop y comparte los repositorios y el estado en
+    # memoria de las partidas (`GameStateStore`), atado a los eventos de commit de la sesión sincrónica.
     db = SessionLocal()
     try:
         yield db
@@ -1,10 +1,10 @@
-import asyncio
 import datetime
-import time
+from functools import partial
 from typing import List, Optional
 
-from fastapi import BackgroundTasks, WebSocket
+from fastapi import WebSocket
 
+from src.games.application.timer import turn_timer
 from src.games.domain.models import BoardPiecePosition, GameID, MovementCardRequest
 from src.games.domain.repository import GameRepositoryWS
 from src.games.domain.service import GameServiceDomain
@@ -14,6 +14,7 @@ from src.players.domain.repository import PlayerRepository
 from src.players.domain.service import RepositoryValidators as PlayerRepositoryValidators
 from src.rooms.domain.repository import RoomRepositoryWS
 from src.rooms.domain.service import RepositoryValidators as RoomRepositoryValidators
+from src.shared.executor import run_blocking
 
 
 class GameService:
@@ -33,28 +34,20 @@ class GameService:
 
         self.recently_unblocked_cards: List[int] = []
 
-    async def _set_turn_timer(
-        self, gameID: int, playerID: int, total_seconds: int, background_tasks: BackgroundTasks
-    ) -> None:
+    async def _set_turn_timer(self, gameID: int, playerID: int, total_seconds: int) -> None:
         timestamp = datetime.datetime.now() + datetime.timedelta(seconds=total_seconds)
         self.game_repository.set_timestamp_next_turn(gameID, timestamp)
-        background_tasks.add_task(self._run_timer, playerID, gameID, timestamp, background_tasks)
+        turn_timer.schedule(gameID, timestamp, partial(self._run_timer, playerID, gameID, timestamp))
 
-    async def _run_timer(
-        self, playerID: int, gameID: int, timestamp: datetime.datetime, background_tasks: BackgroundTasks
-    ) -> None:
+    async def _run_timer(self, playerID: int, gameID: int, timestamp: datetime.datetime) -> None:
+        """Saltea el turno al vencer el timer, si el turno no cambió desde que se programó"""
         try:
-            while datetime.datetime.now() < timestamp:
-                if self.game_repository.get_current_timestamp_next_turn(gameID) == timestamp:
-                    await asyncio.sleep(0.5)
-                else:
-                    break
             if self.game_repository.get_current_timestamp_next_turn(gameID) == timestamp:
-                await self.skip_turn(playerID, gameID, background_tasks, auto=True)
+                await self.skip_turn(playerID, gameID, auto=True)
         except AttributeError:
             pass
 
-    async def start_game(self, roomID: int, playerID: PlayerID, background_tasks: BackgroundTasks) -> GameID:
+    async def start_game(self, roomID: int, playerID: PlayerID) -> GameID:
         await self.player_domain_service.validate_player_exists(playerID.playerID)
         await self.room_domain_service.validate_room_exists(roomID)
         self.room_domain_service.validate_player_is_owner(playerID.playerID, roomID)
@@ -62,38 +55,36 @@ class GameService:
 
         board = GameServiceDomain.create_board()
 
-        response = self.game_repository.create(roomID, board)
+        response = await run_blocking(self.game_repository.create, roomID, board)
         gameID = response.gameID
 
-        self.game_repository.create_figure_cards(gameID)
-        self.game_repository.create_movement_cards(gameID)
+        await run_blocking(self.game_repository.create_figure_cards, gameID)
+        await run_blocking(self.game_repository.create_movement_cards, gameID)
 
         if self.room_repository is None:
             raise ValueError("RoomRepository is required to start a game")
         game_service_domain = GameServiceDomain(self.game_repository, self.room_repository)
 
-        first_turnID = game_service_domain.set_game_turn_order(gameID)
-        await self._set_turn_timer(gameID, first_turnID, 120, background_tasks)
+        first_turnID = await run_blocking(game_service_domain.set_game_turn_order, gameID)
+        await self._set_turn_timer(gameID, first_turnID, 120)
         await self.room_repository.broadcast_status_room_list()
         await self.room_repository.broadcast_start_game(roomID, gameID)
 
         return response
 
-    async def skip_turn(
-        self, playerID: int, gameID: int, background_tasks: BackgroundTasks, auto: bool = False
-    ) -> None:
+    async def skip_turn(self, playerID: int, gameID: int, auto: bool = False) -> None:
         await self.player_domain_service.validate_player_exists(playerID)
         await self.game_domain_service.validate_game_exists(gameID)
         await self.game_domain_service.is_player_in_game(playerID, gameID)
         self.game_domain_service.validate_is_player_turn(playerID, gameID)
-        posEnabledToPlay = self.game_repository.skip(gameID)
-        self.game_repository.clean_partial_movements(gameID)
-        self.game_repository.replacement_movement_card(gameID, playerID)
-        self.game_repository.replacement_figure_card(gameID, playerID)
+        posEnabledToPlay = await run_blocking(self.game_repository.skip, gameID)
+        await run_blocking(self.game_repository.clean_partial_movements, gameID)
+        await run_blocking(self.game_repository.replacement_movement_card, gameID, playerID)
+        await run_blocking(self.game_repository.replacement_figure_card, gameID, playerID)
 
         await self.game_repository.send_log_turn_skip(gameID, playerID, auto)
         next_turn = self.room_domain_service.room_repository.get_turn(gameID, posEnabledToPlay)
-        await self._set_turn_timer(gameID, next_turn, 120, background_tasks)
+        await self._set_turn_timer(gameID, next_turn, 120)
 
         await self.game_repository.broadcast_status_game(gameID)
 
@@ -114,7 +105,8 @@ class GameService:
         self.game_domain_service.validate_movement_card(request)
         self.game_domain_service.validate_card_is_partial_movement(gameID, request.cardID)
         await self.game_repository.send_log_play_movement_card(gameID, request.playerID, request.cardID)
-        self.game_repository.play_movement(
+        await run_blocking(
+            self.game_repository.play_movement,
             gameID,
             card_id=request.cardID,
             originX=request.origin.posX,
@@ -131,7 +123,7 @@ class GameService:
         await self.game_domain_service.is_player_in_game(playerID, gameID)
         self.game_domain_service.partial_movement_exists(gameID)
         await self.game_repository.send_log_cancel_movement_card(gameID, playerID)
-        self.game_repository.delete_partial_movement(gameID)
+        await run_blocking(self.game_repository.delete_partial_movement, gameID)
         await self.game_repository.broadcast_status_game(gameID)
 
     async def leave_game(self, gameID: int, playerID: int) -> None:
@@ -139,13 +131,14 @@ class GameService:
         await self.game_domain_service.validate_game_exists(gameID)
         await self.game_domain_service.is_player_in_game(playerID, gameID)
 
-        self.game_repository.set_player_inactive(playerID, gameID)
+        await run_blocking(self.game_repository.set_player_inactive, playerID, gameID)
         await self.game_repository.remove_player(playerID, gameID)
 
         active_players = self.game_repository.get_active_players(gameID)
         if len(active_players) == 1:
             await self.game_repository.broadcast_end_game(gameID, active_players[0].playerID)
-            self.game_repository.delete_and_clean(gameID)
+            await run_blocking(self.game_repository.delete_and_clean, gameID)
+            turn_timer.cancel(gameID)
         else:
             await self.game_repository.send_log_player_leave_game(gameID, playerID)
             await self.game_repository.broadcast_status_game(gameID)
@@ -168,9 +161,9 @@ class GameService:
         self.game_domain_service.validate_target_has_three_cards(gameID, targetID)
 
         await self.game_repository.send_log_block_figure(gameID, playerID, targetID, cardID)
-        self.game_repository.block_managment(gameID, cardID, figure)
-        self.game_repository.desvinculate_partial_movement_cards(gameID)
-        self.game_repository.set_partial_movements_to_empty(gameID)
+        await run_blocking(self.game_repository.block_managment, gameID, cardID, figure)
+        await run_blocking(self.game_repository.desvinculate_partial_movement_cards, gameID)
+        await run_blocking(self.game_repository.set_partial_movements_to_empty, gameID)
 
         await self.game_repository.broadcast_status_game(gameID)
 
@@ -188,10 +181,10 @@ class GameService:
         self.game_domain_service.validate_figure_border_validity(gameID, figure)
 
         await self.game_repository.send_log_play_figure(gameID, playerID, figureID)
-        self.game_repository.play_figure(gameID, figureID, figure)
+        await run_blocking(self.game_repository.play_figure, gameID, figureID, figure)
 
-        self.game_repository.desvinculate_partial_movement_cards(gameID)
-        self.game_repository.set_partial_movements_to_empty(gameID)
+        await run_blocking(self.game_repository.desvinculate_partial_movement_cards, gameID)
+        await run_blocking(self.game_repository.set_partial_movements_to_empty, gameID)
 
         blockedcardID = self.game_repository.get_blocked_card(gameID, playerID)
 
@@ -199,10 +192,11 @@ class GameService:
             self.game_repository.set_was_blocked_false(blockedcardID)
 
         if blockedcardID is not None and self.game_repository.is_blocked_and_last_card(gameID, blockedcardID):
-            self.game_repository.unblock_managment(gameID, blockedcardID)
+            await run_blocking(self.game_repository.unblock_managment, gameID, blockedcardID)
 
         if self.game_repository.figure_card_count(gameID, playerID) == 0:
             await self.game_repository.broadcast_end_game(gameID, playerID)
-            self.game_repository.delete_and_clean(gameID)
+            await run_blocking(self.game_repository.delete_and_clean, gameID)
+            turn_timer.cancel(gameID)
         else:
             await self.game_repository.broadcast_status_game(gameID)
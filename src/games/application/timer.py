@@ -0,0 +1,57 @@
+import asyncio
+import datetime
+from typing import Any, Callable, Coroutine, Dict, Optional, Set, Tuple
+
+TimerCallback = Callable[[], Coroutine[Any, Any, None]]
+
+
+class TurnTimerScheduler:
+    """Vencimientos de los turnos de todas las partidas.
+
+    Cada partida tiene a lo sumo un vencimiento, registrado en el reloj del event loop
+    (`loop.call_at`), por lo que no hay consultas periódicas a la base de datos mientras corre el turno.
+    Programar un nuevo vencimiento reemplaza al anterior de la partida, y el callback
+    se ejecuta una única vez cuando el vencimiento se cumple.
+    """
+
+    def __init__(self):
+        self.timers: Dict[int, Tuple[datetime.datetime, asyncio.TimerHandle]] = {}
+        self.running: Set[asyncio.Task[None]] = set()
+
+    def schedule(self, gameID: int, deadline: datetime.datetime, callback: TimerCallback) -> None:
+        """Programa (o reprograma) el vencimiento del turno de una partida.
+
+        Args:
+            gameID: ID de la partida
+            deadline: Momento en el que vence el turno
+            callback: Corrutina a ejecutar al vencer el turno
+        """
+        self.cancel(gameID)
+        loop = asyncio.get_running_loop()
+        delay = max((deadline - datetime.datetime.now()).total_seconds(), 0)
+        handle = loop.call_at(loop.time() + delay, self._fire, gameID, callback)
+        self.timers[gameID] = (deadline, handle)
+
+    def cancel(self, gameID: int) -> None:
+        timer = self.timers.pop(gameID, None)
+        if timer is not None:
+            timer[1].cancel()
+
+    def get_deadline(self, gameID: int) -> Optional[datetime.datetime]:
+        timer = self.timers.get(gameID)
+        return timer[0] if timer is not None else None
+
+    def clean_up(self) -> None:
+        """Cancela todos los vencimientos pendientes"""
+        for _, handle in self.timers.values():
+            handle.cancel()
+        self.timers.clear()
+
+    def _fire(self, gameID: int, callback: TimerCallback) -> None:
+        self.timers.pop(gameID, None)
+        task: asyncio.Task[None] = asyncio.get_running_loop().create_task(callback())
+        self.running.add(task)
+        task.add_done_callback(self.running.discard)
+
+
+turn_timer = TurnTimerScheduler()
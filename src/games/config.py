@@ -1,11 +1,20 @@
+import os
+
 COLORS = ["R", "G", "B", "Y"]
 
+BOARD_SIZE = 6
+
 WHITE_CARDS_AMOUNT = [18 * 2, 12 * 3, 9 * 4]
 
 BLUE_CARDS_AMOUNT = [7 * 2, 4 * 3, 3 * 4]
 
 MOVEMENT_CARDS_AMOUNT = [24, 16, 12]
 
+# Cantidad máxima de tableros cuyas figuras se guardan en la cache (ver `FigureCache`)
+FIGURES_CACHE_SIZE = int(os.environ.get("FIGURES_CACHE_SIZE", 4096))
+
+TIMER_RECOVERY_BATCH_SIZE = 32
+
 
 WHITE_CARDS = [f"fig{str(i).zfill(2)}" for i in range(1, 19)]
 BLUE_CARDS = [f"fige{str(i).zfill(2)}" for i in range(1, 8)]
@@ -0,0 +1,73 @@
+import json
+from typing import Any, Iterable, Iterator, Union
+
+from src.games.config import BOARD_SIZE, COLORS
+
+
+class Board:
+    """Tablero de 6x6 guardado como 36 bytes con el código de color de cada celda.
+
+    La celda (posX, posY) está en el índice `posX * 6 + posY`, el mismo orden en el que
+    se crean las piezas del tablero. En la base de datos se guarda como un texto de 36 caracteres.
+    """
+
+    __slots__ = ("cells",)
+
+    def __init__(self, cells: Union[bytes, bytearray, str] = b""):
+        self.cells = bytearray(cells.encode("ascii") if isinstance(cells, str) else cells)
+
+    @classmethod
+    def from_colors(cls, colors: Iterable[str]) -> "Board":
+        return cls("".join(colors))
+
+    @staticmethod
+    def is_compact(raw: Any) -> bool:
+        return isinstance(raw, str) and len(raw) == BOARD_SIZE * BOARD_SIZE and all(c in COLORS for c in raw)
+
+    @classmethod
+    def decode(cls, raw: Any) -> "Board":
+        """Decodifica un tablero guardado en formato compacto o en el formato anterior
+        (lista JSON de piezas `{"posX", "posY", "color"}`, posiblemente serializada más de una vez).
+        Las piezas del formato anterior se ubican según su posición, sin importar el orden de la lista.
+
+        Raises:
+            ValueError: Si la partida no tiene un tablero guardado
+        """
+        if raw is None:
+            raise ValueError("La partida no tiene un tablero guardado")
+        value = raw
+        while isinstance(value, str):
+            if cls.is_compact(value):
+                return cls(value)
+            value = json.loads(value)
+        pieces = sorted(value, key=lambda piece: (piece["posX"], piece["posY"]))
+        return cls.from_colors(piece["color"] for piece in pieces)
+
+    def encode(self) -> str:
+        return self.cells.decode("ascii")
+
+    def get(self, posX: int, posY: int) -> str:
+        return chr(self.cells[posX * BOARD_SIZE + posY])
+
+    def set(self, posX: int, posY: int, color: str) -> None:
+        self.cells[posX * BOARD_SIZE + posY] = ord(color)
+
+    def swap(self, originX: int, originY: int, destinationX: int, destinationY: int) -> None:
+        origin = originX * BOARD_SIZE + originY
+        destination = destinationX * BOARD_SIZE + destinationY
+        self.cells[origin], self.cells[destination] = self.cells[destination], self.cells[origin]
+
+    def copy(self) -> "Board":
+        return Board(self.cells)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __iter__(self) -> Iterator[str]:
+        return (chr(code) for code in self.cells)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Board) and self.cells == other.cells
+
+    def __repr__(self) -> str:
+        return f"<Board({self.encode()})>"
@@ -0,0 +1,280 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+
+from src.games.config import BOARD_SIZE, COLORS, FIGURE_CARDS_FORM
+
+Cell = Tuple[int, int]
+
+
+class FigurePlacement(NamedTuple):
+    """Ubicación concreta de una rotación de figura sobre el tablero.
+
+    Las celdas se guardan como (posX, posY) y las máscaras usan el bit `posX * 6 + posY`,
+    el mismo índice que ocupa cada pieza en la lista del tablero.
+    """
+
+    figure_type: str
+    cells: Tuple[Cell, ...]
+    mask: int
+    border: int
+
+
+def cell_bit(posX: int, posY: int) -> int:
+    return 1 << (posX * BOARD_SIZE + posY)
+
+
+def neighbors_mask(posX: int, posY: int) -> int:
+    """Máscara de las celdas vecinas (en 4 direcciones) de una celda, dentro del tablero"""
+    mask = 0
+    for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+        nx, ny = posX + dx, posY + dy
+        if 0 <= nx < BOARD_SIZE and 0 <= ny < BOARD_SIZE:
+            mask |= cell_bit(nx, ny)
+    return mask
+
+
+def _build_placements() -> List[FigurePlacement]:
+    """Precalcula todas las ubicaciones de todas las rotaciones de cada figura,
+    junto con la máscara de su borde (vecinos en 4 direcciones que no forman parte de la figura).
+
+    El orden es el mismo en el que el antiguo barrido por convolución encontraba las figuras
+    (tipo de figura, rotación, fila y columna), y se descartan las ubicaciones repetidas
+    que producen las figuras con simetría rotacional.
+    """
+    placements: List[FigurePlacement] = []
+    seen = set()
+
+    for figure_type, form in FIGURE_CARDS_FORM.items():
+        for k in range(4):
+            shape = np.rot90(form, k)
+            shape_height, shape_width = shape.shape
+
+            for y in range(BOARD_SIZE - shape_height + 1):
+                for x in range(BOARD_SIZE - shape_width + 1):
+                    cells = tuple(
+                        (x + shape_x, y + shape_y)
+                        for shape_y in range(shape_height)
+                        for shape_x in range(shape_width)
+                        if shape[shape_y, shape_x] == 1
+                    )
+                    if cells in seen:
+                        continue
+                    seen.add(cells)
+
+                    mask = 0
+                    for posX, posY in cells:
+                        mask |= cell_bit(posX, posY)
+
+                    border = 0
+                    for posX, posY in cells:
+                        border |= neighbors_mask(posX, posY)
+                    border &= ~mask
+
+                    placements.append(FigurePlacement(figure_type, cells, mask, border))
+
+    return placements
+
+
+FIGURE_PLACEMENTS: List[FigurePlacement] = _build_placements()
+
+
+def _build_placements_by_cell() -> List[List[int]]:
+    """Para cada celda, los índices de las ubicaciones cuya figura o borde la contienen"""
+    placements_by_cell: List[List[int]] = [[] for _ in range(BOARD_SIZE * BOARD_SIZE)]
+    for index, placement in enumerate(FIGURE_PLACEMENTS):
+        touched = placement.mask | placement.border
+        for bit in range(BOARD_SIZE * BOARD_SIZE):
+            if touched >> bit & 1:
+                placements_by_cell[bit].append(index)
+    return placements_by_cell
+
+
+PLACEMENTS_BY_CELL: List[List[int]] = _build_placements_by_cell()
+
+
+def color_masks_from_cells(cells: Iterable[Tuple[int, int, str]]) -> Dict[str, int]:
+    """Codifica el tablero como una máscara de 36 bits por color.
+
+    Args:
+        cells: Tuplas (posX, posY, color) de cada pieza del tablero
+    """
+    masks = {color: 0 for color in COLORS}
+    for posX, posY, color in cells:
+        if color in masks:
+            masks[color] |= cell_bit(posX, posY)
+    return masks
+
+
+def has_same_color_neighbor(color_masks: Dict[str, int], cells: Iterable[Cell]) -> bool:
+    """Indica si alguna pieza de la figura tiene una vecina del mismo color que no forma parte de la figura
+
+    Args:
+        color_masks: Máscara de 36 bits por color
+        cells: Celdas (posX, posY) de la figura
+    """
+    cells = list(cells)
+    mask = 0
+    for posX, posY in cells:
+        mask |= cell_bit(posX, posY)
+
+    for posX, posY in cells:
+        outside = neighbors_mask(posX, posY) & ~mask
+        for color_mask in color_masks.values():
+            if color_mask & cell_bit(posX, posY) and color_mask & outside:
+                return True
+    return False
+
+
+def find_figures(color_masks: Dict[str, int], prohibitedColor: Optional[str] = None) -> List[FigurePlacement]:
+    """Busca todas las figuras formadas en el tablero, ignorando las del color prohibido.
+
+    Args:
+        color_masks: Máscara de 36 bits por color
+        prohibitedColor: Color prohibido de la partida
+    """
+    found: List[FigurePlacement] = []
+    for color in COLORS:
+        if color == prohibitedColor:
+            continue
+        color_mask = color_masks.get(color, 0)
+        if not color_mask:
+            continue
+        for placement in FIGURE_PLACEMENTS:
+            if color_mask & placement.mask == placement.mask and not color_mask & placement.border:
+                found.append(placement)
+    return found
+
+
+class IncrementalFigureDetector:
+    """Mantiene, por partida, las ubicaciones de figuras válidas de cada color.
+
+    Al detectar sobre un tablero nuevo se compara contra las máscaras guardadas de la partida:
+    solo se reevalúan, para los colores que cambiaron, las ubicaciones cuya figura o borde toca
+    alguna de las celdas modificadas (las dos celdas de un movimiento). Si la partida no se conoce
+    todavía se hace la búsqueda completa.
+
+    Se usa desde varios hilos a la vez: el estado guardado de una partida nunca se modifica,
+    cada detección arma conjuntos nuevos y reemplaza la entrada completa bajo `lock`.
+    """
+
+    def __init__(self):
+        self.games: Dict[int, Tuple[Dict[str, int], Dict[str, FrozenSet[int]]]] = {}
+        self.lock = threading.Lock()
+
+    def forget(self, gameID: int) -> None:
+        """Descarta el estado guardado de una partida"""
+        with self.lock:
+            self.games.pop(gameID, None)
+
+    def clean_up(self) -> None:
+        """Descarta el estado guardado de todas las partidas"""
+        with self.lock:
+            self.games.clear()
+
+    def detect(
+        self, gameID: int, color_masks: Dict[str, int], prohibitedColor: Optional[str] = None
+    ) -> List[FigurePlacement]:
+        """Devuelve las figuras formadas en el tablero de la partida, en el mismo orden que `find_figures`.
+
+        Args:
+            gameID: ID de la partida
+            color_masks: Máscara de 36 bits por color del tablero actual
+            prohibitedColor: Color prohibido de la partida
+        """
+        with self.lock:
+            known = self.games.get(gameID)
+
+        if known is not None:
+            previous_masks, previous_valid = known
+            valid = {}
+            for color in COLORS:
+                changed = previous_masks.get(color, 0) ^ color_masks.get(color, 0)
+                if changed:
+                    valid[color] = self._update_color(previous_valid[color], color_masks.get(color, 0), changed)
+                else:
+                    valid[color] = previous_valid[color]
+        else:
+            valid = {color: self._full_scan(color_masks.get(color, 0)) for color in COLORS}
+
+        with self.lock:
+            self.games[gameID] = (dict(color_masks), valid)
+
+        return [
+            FIGURE_PLACEMENTS[index] for color in COLORS if color != prohibitedColor for index in sorted(valid[color])
+        ]
+
+    @staticmethod
+    def _full_scan(color_mask: int) -> FrozenSet[int]:
+        return frozenset(
+            index
+            for index, placement in enumerate(FIGURE_PLACEMENTS)
+            if color_mask & placement.mask == placement.mask and not color_mask & placement.border
+        )
+
+    @staticmethod
+    def _update_color(previous: FrozenSet[int], color_mask: int, changed: int) -> FrozenSet[int]:
+        candidates: Set[int] = set()
+        while changed:
+            low_bit = changed & -changed
+            candidates.update(PLACEMENTS_BY_CELL[low_bit.bit_length() - 1])
+            changed ^= low_bit
+
+        valid = set(previous)
+        for index in candidates:
+            placement = FIGURE_PLACEMENTS[index]
+            if color_mask & placement.mask == placement.mask and not color_mask & placement.border:
+                valid.add(index)
+            else:
+                valid.discard(index)
+        return frozenset(valid)
+
+
+class FigureCache:
+    """Cache LRU acotado de las figuras disponibles por estado del tablero.
+
+    La clave es la huella del tablero (las máscaras de cada color) junto al color prohibido,
+    por lo que tableros que se repiten (movimientos cancelados, turnos salteados) no se recalculan.
+    Se consulta desde los hilos del pool de tareas bloqueantes, por eso todo acceso se hace bajo `lock`.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.entries: OrderedDict[Tuple[Tuple[int, ...], Optional[str]], Tuple[FigurePlacement, ...]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(color_masks: Dict[str, int]) -> Tuple[int, ...]:
+        return tuple(color_masks.get(color, 0) for color in COLORS)
+
+    def get(self, color_masks: Dict[str, int], prohibitedColor: Optional[str]) -> Optional[Tuple[FigurePlacement, ...]]:
+        key = (self.fingerprint(color_masks), prohibitedColor)
+        with self.lock:
+            figures = self.entries.get(key)
+            if figures is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return figures
+
+    def put(self, color_masks: Dict[str, int], prohibitedColor: Optional[str], figures: List[FigurePlacement]) -> None:
+        if self.max_size <= 0:
+            return
+        key = (self.fingerprint(color_masks), prohibitedColor)
+        with self.lock:
+            self.entries[key] = tuple(figures)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clean_up(self) -> None:
+        """Vacía el cache y reinicia los contadores"""
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import List, Optional
 
 from pydantic import BaseModel, field_validator
@@ -85,6 +86,12 @@ class GamePublicInfo(Game):
     timer: float
 
 
+class TurnDeadline(BaseModel):
+    gameID: int
+    playerID: int
+    timestamp: datetime
+
+
 class Winner(BaseModel):
     winnerID: int
     username: str
@@ -1,10 +1,10 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import List, Optional
 
-import numpy as np
 from fastapi.websockets import WebSocket
 
+from src.games.domain.board import Board
 from src.games.domain.models import (
     BoardPiece,
     BoardPiecePosition,
@@ -12,6 +12,7 @@ from src.games.domain.models import (
     Game,
     GameID,
     GamePublicInfo,
+    TurnDeadline,
 )
 from src.games.domain.models import MovementCard as MovementCardDomain
 from src.players.domain.models import Player as PlayerDomain
@@ -19,7 +20,7 @@ from src.players.domain.models import Player as PlayerDomain
 
 class GameRepository(ABC):
     @abstractmethod
-    def create(self, roomID: int, board: List[Dict[str, Union[int, str]]]) -> GameID:
+    def create(self, roomID: int, board: Board) -> GameID:
         pass
 
     @abstractmethod
@@ -34,6 +35,10 @@ class GameRepository(ABC):
     def get(self, gameID: int) -> Optional[Game]:
         pass
 
+    @abstractmethod
+    def exists(self, gameID: int) -> bool:
+        pass
+
     @abstractmethod
     def delete(self, gameID: int) -> None:
         pass
@@ -46,6 +51,10 @@ class GameRepository(ABC):
     def is_player_in_game(self, playerID: int, gameID: int) -> bool:
         pass
 
+    @abstractmethod
+    def is_active_player_in_game(self, playerID: int, gameID: int) -> bool:
+        pass
+
     @abstractmethod
     def get_public_info(self, gameID: int, playerID: int) -> GamePublicInfo:
         pass
@@ -109,7 +118,7 @@ class GameRepository(ABC):
         pass
 
     @abstractmethod
-    def check_border_validity(self, positions: List[BoardPiecePosition], layer: np.ndarray) -> bool:
+    def get_compact_board(self, gameID: int) -> Board:
         pass
 
     @abstractmethod
@@ -197,6 +206,10 @@ class GameRepository(ABC):
     def set_timestamp_next_turn(self, gameID: int, timestamp: datetime) -> None:
         pass
 
+    @abstractmethod
+    def get_pending_turn_deadlines(self) -> List[TurnDeadline]:
+        pass
+
 
 class GameRepositoryWS(GameRepository):
     @abstractmethod
@@ -1,11 +1,13 @@
 import random
-from typing import Dict, List, Optional, Union
+from typing import List, Optional
 
 import numpy as np
 from fastapi import BackgroundTasks, FastAPI, HTTPException
 from fastapi.websockets import WebSocket, WebSocketDisconnect
 
-from src.games.config import COLORS, FIGURE_CARDS_FORM
+from src.games.config import BOARD_SIZE, COLORS, FIGURE_CARDS_FORM
+from src.games.domain.board import Board
+from src.games.domain.figures import color_masks_from_cells, has_same_color_neighbor
 from src.games.domain.models import MovementCardRequest
 from src.games.domain.repository import BoardPiecePosition, GameRepository
 from src.rooms.domain.repository import RoomRepository
@@ -57,7 +59,7 @@ class RepositoryValidators:
         raise HTTPException(status_code=403, detail="La carta esta bloqueada.")
 
     async def validate_game_exists(self, gameID: int, websocket: Optional[WebSocket] = None):
-        if self.game_repository.get(gameID) is not None:
+        if self.game_repository.exists(gameID):
             return
         if websocket is None:
             raise HTTPException(status_code=404, detail="El juego no existe.")
@@ -71,10 +73,7 @@ class RepositoryValidators:
         raise HTTPException(status_code=403, detail="El jugador tiene menos de tres cartas de figura.")
 
     async def is_player_in_game(self, playerID: int, gameID: int, websocket: Optional[WebSocket] = None):
-        player_in_game = self.game_repository.is_player_in_game(playerID, gameID)
-        player_active = self.game_repository.is_player_active(playerID, gameID)
-
-        if player_in_game and player_active:
+        if self.game_repository.is_active_player_in_game(playerID, gameID):
             return
         if websocket is None:
             raise HTTPException(status_code=403, detail="El jugador no se encuentra en el juego.")
@@ -101,9 +100,9 @@ class RepositoryValidators:
             raise HTTPException(status_code=403, detail="La figura no puede estar vacía.")
 
     def validate_figure_matches_board(self, gameID: int, figure: List[BoardPiecePosition]):
-        board = self.game_repository.get_board(gameID)
+        board = self.game_repository.get_compact_board(gameID)
 
-        color_figure = [board[piece.posX * 6 + piece.posY].color for piece in figure]
+        color_figure = [board.get(piece.posX, piece.posY) for piece in figure]
         if len(set(color_figure)) != 1:
             raise HTTPException(status_code=403, detail="La figura debe ser del mismo color.")
 
@@ -136,14 +135,10 @@ class RepositoryValidators:
         raise HTTPException(status_code=403, detail="La figura no coincide con la carta.")
 
     def validate_figure_border_validity(self, gameID: int, figure: List[BoardPiecePosition]):
-        board = self.game_repository.get_board(gameID)
-
-        board_matrix = np.empty((6, 6), dtype=object)
+        board = self.game_repository.get_compact_board(gameID)
 
-        for piece in board:
-            board_matrix[piece.posY][piece.posX] = piece.color
-
-        if not self.game_repository.check_border_validity(figure, board_matrix):
+        color_masks = color_masks_from_cells((*divmod(index, BOARD_SIZE), color) for index, color in enumerate(board))
+        if has_same_color_neighbor(color_masks, [(piece.posX, piece.posY) for piece in figure]):
             raise HTTPException(status_code=403, detail="La figura tiene una ficha adyacente del mismo color.")
 
     def validate_is_blocked_and_the_last_card(self, gameID: int, cardID: int):
@@ -266,9 +261,9 @@ class RepositoryValidators:
 
     def validate_prohibited_color(self, gameID: int, figure: List[BoardPiecePosition]):
         prohibited_color = self.game_repository.get_prohibited_color(gameID)
-        board = self.game_repository.get_board(gameID)
+        board = self.game_repository.get_compact_board(gameID)
 
-        if board[figure[0].posX * 6 + figure[0].posY].color == prohibited_color:
+        if board.get(figure[0].posX, figure[0].posY) == prohibited_color:
             raise HTTPException(status_code=403, detail="La figura no puede ser del color prohibido.")
 
 
@@ -278,20 +273,11 @@ class GameServiceDomain:
         self.room_repository = room_repository
 
     @staticmethod
-    def create_board() -> List[Dict[str, Union[int, str]]]:
+    def create_board() -> Board:
         color_pool = 9 * COLORS
         random.shuffle(color_pool)
 
-        board = []
-        for i in range(6):
-            for j in range(6):
-                token: Dict[str, Union[int, str]] = {}
-                token["posX"] = i
-                token["posY"] = j
-                token["color"] = color_pool.pop()
-                board.append(token)
-
-        return board
+        return Board.from_colors(color_pool)
 
     def set_game_turn_order(self, gameID: int) -> int:
         players = self.game_repository.get_players(gameID)
@@ -0,0 +1,62 @@
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+# (tipo de entrada, ID de la partida o de la carta)
+CacheKey = Tuple[str, int]
+
+_MISSING = object()
+
+
+class RequestCache:
+    """Cache de lecturas del repositorio con el alcance de una sesión (una request).
+
+    Cada entidad o vista derivada (partida, tablero, jugadores, carta de figura) se carga a lo sumo
+    una vez mientras la sesión no escriba en la base de datos. Las entradas se descartan cuando la
+    sesión hace flush o termina su transacción (commit, rollback o close), y los métodos que modifican
+    el estado en memoria de una partida invalidan explícitamente las entradas de esa partida.
+    """
+
+    def __init__(self):
+        self.entries: Dict[CacheKey, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def for_session(cls, db_session: Session) -> "RequestCache":
+        cache = db_session.info.get("request_cache")
+        if cache is None:
+            cache = cls()
+            db_session.info["request_cache"] = cache
+        return cache
+
+    def get_or_load(self, key: CacheKey, loader: Callable[[], T]) -> T:
+        value = self.entries.get(key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = loader()
+        self.entries[key] = value
+        return value
+
+    def invalidate_game(self, gameID: int) -> None:
+        """Descarta las entradas derivadas de una partida"""
+        for key in [key for key in self.entries if key[1] == gameID and key[0] != "figure_card"]:
+            del self.entries[key]
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
+@event.listens_for(Session, "after_flush")
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+@event.listens_for(Session, "after_transaction_end")
+def _clear_request_cache(session: Session, *args) -> None:
+    cache = session.info.get("request_cache")
+    if cache is not None:
+        cache.clear()
@@ -0,0 +1,57 @@
+from sqlalchemy import inspect, text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from src.games.domain.board import Board
+from src.games.infrastructure.models import Game as GameDB
+from src.games.infrastructure.state import decode_json
+
+
+def migrate_legacy_boards(db_session: Session) -> int:
+    """Convierte al formato compacto los tableros guardados como lista JSON de piezas
+
+    Returns:
+        int: Cantidad de partidas migradas
+    """
+    migrated = [
+        {"gameID": gameID, "board": Board.decode(board).encode()}
+        for gameID, board in db_session.query(GameDB.gameID, GameDB.board).filter(GameDB.board.isnot(None))
+        if not Board.is_compact(board)
+    ]
+    if migrated:
+        db_session.execute(update(GameDB), migrated)
+
+    db_session.commit()
+    return len(migrated)
+
+
+def migrate_legacy_last_movements(db_session: Session) -> int:
+    """Convierte en lista JSON los movimientos parciales guardados como texto JSON
+
+    Returns:
+        int: Cantidad de partidas migradas
+    """
+    migrated = [
+        {"gameID": gameID, "lastMovements": decode_json(last_movements), "version": version + 1}
+        for gameID, last_movements, version in db_session.query(GameDB.gameID, GameDB.lastMovements, GameDB.version)
+        if isinstance(last_movements, str)
+    ]
+    if migrated:
+        db_session.execute(update(GameDB), migrated)
+
+    db_session.commit()
+    return len(migrated)
+
+
+def add_game_version_column(bind: Engine) -> bool:
+    """Agrega la columna `version` a la tabla de partidas de una base creada antes de que existiera
+    (`create_all` no modifica las tablas existentes)
+
+    Returns:
+        bool: Si se agregó la columna
+    """
+    if "version" in {column["name"] for column in inspect(bind).get_columns(GameDB.__tablename__)}:
+        return False
+    with bind.begin() as connection:
+        connection.execute(text(f"ALTER TABLE {GameDB.__tablename__} ADD COLUMN version INTEGER NOT NULL DEFAULT 0"))
+    return True
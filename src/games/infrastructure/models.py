@@ -1,4 +1,5 @@
-from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, Index, Integer, String, false, true
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from src.database import Base
@@ -9,12 +10,14 @@ class Game(Base):
 
     gameID = Column(Integer, primary_key=True)
     roomID = Column(ForeignKey("rooms.roomID"), nullable=False, unique=True)
-    board = Column(JSON)
-    lastMovements = Column(JSON, nullable=True)
+    board = Column(String)
+    lastMovements = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
     prohibitedColor = Column(String, nullable=True)
     room = relationship("Room", back_populates="game")
     posEnabledToPlay = Column(Integer, default=1)
     timestamp_next_turn = Column(DateTime, nullable=True)
+    # Aumenta con cada escritura de `board` y `lastMovements` (ver `GameStateStore.write`)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
 
     figureDeck = relationship("FigureCard", back_populates="game")
     movementDeck = relationship("MovementCard", back_populates="game")
@@ -38,6 +41,19 @@ class FigureCard(Base):
     player = relationship("Player", back_populates="cardsFigure")
     game = relationship("Game", back_populates="figureDeck")
 
+    __table_args__ = (
+        # Mano y mazo de cada jugador (isPlayable separa las cartas en mano de las del mazo)
+        Index("ix_figure_cards_game_player_playable", "gameID", "playerID", "isPlayable"),
+        # Cartas bloqueadas: son pocas, así que alcanza con un índice parcial
+        Index(
+            "ix_figure_cards_blocked",
+            "gameID",
+            "playerID",
+            sqlite_where=isBlocked.is_(true()),
+            postgresql_where=isBlocked.is_(true()),
+        ),
+    )
+
     def __repr__(self):
         return f"<FigureCard(cardID={self.cardID}, type={self.type}, isBlocked={self.isBlocked})>"
 
@@ -55,5 +71,17 @@ class MovementCard(Base):
     player = relationship("Player", back_populates="movementCards")
     game = relationship("Game", back_populates="movementDeck")
 
+    __table_args__ = (
+        # Cartas en mano de cada jugador
+        Index("ix_movement_cards_game_player", "gameID", "playerID"),
+        # Mazo para robar: cartas sin dueño que no fueron descartadas
+        Index(
+            "ix_movement_cards_deck",
+            "gameID",
+            sqlite_where=playerID.is_(None) & isDiscarded.is_(false()),
+            postgresql_where=playerID.is_(None) & isDiscarded.is_(false()),
+        ),
+    )
+
     def __repr__(self):
         return f"<MovementCard(cardID={self.cardID}, type={self.type}, isDiscarded={self.isDiscarded})>"
@@ -1,26 +1,24 @@
-import json
 import random
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
-import numpy as np
 from fastapi.websockets import WebSocket
-from scipy.signal import convolve2d
 from sqlalchemy.orm import Session
-from sqlalchemy.sql.expression import func
+from sqlalchemy.sql.expression import func, literal_column
 
 from src.games.config import (
     BLUE_CARDS,
     BLUE_CARDS_AMOUNT,
-    COLORS,
-    FIGURE_CARDS_FORM,
     FIGURE_CARDS_NAMES,
+    FIGURES_CACHE_SIZE,
     MOVEMENT_CARDS,
     MOVEMENT_CARDS_AMOUNT,
     MOVEMENT_CARDS_NAMES,
     WHITE_CARDS,
     WHITE_CARDS_AMOUNT,
 )
+from src.games.domain.board import Board
+from src.games.domain.figures import FigureCache, IncrementalFigureDetector, color_masks_from_cells, find_figures
 from src.games.domain.models import (
     BoardPiece,
     BoardPiecePosition,
@@ -31,34 +29,42 @@ from src.games.domain.models import (
     MovementCard,
     PlayerPublicInfo,
     Position,
+    TurnDeadline,
     Winner,
 )
 from src.games.domain.models import (
     MovementCard as MovementCardDomain,
 )
 from src.games.domain.repository import GameRepository, GameRepositoryWS
+from src.games.infrastructure.cache import RequestCache
 from src.games.infrastructure.models import FigureCard as FigureCardDB
 from src.games.infrastructure.models import Game as GameDB
 from src.games.infrastructure.models import MovementCard as MovementCardDB
+from src.games.infrastructure.state import GameState, GameStateStore, PartialMovement
 from src.games.infrastructure.websocket import MessageType, ws_manager_game
 from src.players.infrastructure.models import Player as PlayerDB
 from src.rooms.infrastructure.models import PlayerRoom as PlayerRoomDB
 from src.rooms.infrastructure.models import Room as RoomDB
-from src.rooms.infrastructure.repository import SQLAlchemyRepository as RoomRepository
+from src.shared.executor import run_blocking
+
+figure_detector = IncrementalFigureDetector()
+figure_cache = FigureCache(FIGURES_CACHE_SIZE)
 
 
 class SQLAlchemyRepository(GameRepository):
     def __init__(self, db_session: Session):
         self.db_session = db_session
+        self.game_states = GameStateStore.for_session(db_session)
+        self.cache = RequestCache.for_session(db_session)
 
-    def create(self, roomID: int, new_board: list) -> GameID:
-        board_json = json.dumps(new_board)
-
-        new_game = GameDB(board=board_json, lastMovements={}, prohibitedColor=None, roomID=roomID)
+    def create(self, roomID: int, new_board: Board) -> GameID:
+        new_game = GameDB(board=new_board.encode(), lastMovements=[], prohibitedColor=None, roomID=roomID)
 
         self.db_session.add(new_game)
         self.db_session.commit()
         self.db_session.refresh(new_game)
+        # SQLite puede reutilizar el ID de una partida borrada: se descarta cualquier estado previo con ese ID
+        self.game_states.forget(new_game.gameID)
 
         return GameID(gameID=new_game.gameID)
 
@@ -212,15 +218,21 @@ class SQLAlchemyRepository(GameRepository):
         game = self.db_session.get(GameDB, gameID)
         self.db_session.delete(game)
         self.db_session.commit()
+        self.game_states.forget(gameID)
+        figure_detector.forget(gameID)
+
+    def exists(self, gameID: int) -> bool:
+        return self.db_session.query(literal_column("1")).filter(GameDB.gameID == gameID).first() is not None
 
     def get(self, gameID: int) -> Optional[Game]:
+        return self.cache.get_or_load(("game", gameID), lambda: self.load_game(gameID))
+
+    def load_game(self, gameID: int) -> Optional[Game]:
         game = self.db_session.get(GameDB, gameID)
 
         if game is None:
             return None
 
-        room_repository = RoomRepository(self.db_session)
-        room_repository.get_players(game.roomID)
         return Game(
             gameID=game.gameID,
             board=self.get_board(gameID),
@@ -229,50 +241,53 @@ class SQLAlchemyRepository(GameRepository):
             players=self.get_players(gameID),
         )
 
-    def get_board(self, gameID: int) -> List[BoardPiece]:
-        game = self.db_session.get(GameDB, gameID)
-        if game is None:
+    def get_state(self, gameID: int) -> GameState:
+        state = self.game_states.get(gameID)
+        if state is None:
             raise ValueError(f"Game with ID {gameID} not found")
-        board_json = json.loads(game.board)
+        return state
+
+    def get_state_for_update(self, gameID: int) -> GameState:
+        state = self.game_states.get_for_update(gameID)
+        if state is None:
+            raise ValueError(f"Game with ID {gameID} not found")
+        return state
+
+    def mark_dirty(self, state: GameState) -> None:
+        self.game_states.mark_dirty(state)
+        self.cache.invalidate_game(state.gameID)
+
+    def get_compact_board(self, gameID: int) -> Board:
+        return self.get_state(gameID).board
+
+    def get_board(self, gameID: int) -> List[BoardPiece]:
+        return self.cache.get_or_load(("board", gameID), lambda: self.load_board(gameID))
+
+    def load_board(self, gameID: int) -> List[BoardPiece]:
+        state = self.get_state(gameID)
+        partial_positions = state.partial_positions()
         board: List[BoardPiece] = []
-        for piece_db in board_json:
-            is_partial = self.is_piece_partial(gameID, piece_db["posX"], piece_db["posY"])
-            piece = BoardPiece(
-                posX=piece_db["posX"], posY=piece_db["posY"], color=piece_db["color"], isPartial=is_partial
-            )
-            board.append(piece)
+        for index, color in enumerate(state.board):
+            posX, posY = divmod(index, 6)
+            board.append(BoardPiece(posX=posX, posY=posY, color=color, isPartial=(posX, posY) in partial_positions))
         return board
 
-    def board_piece_to_dict(self, piece):
-        return {"posX": piece.posX, "posY": piece.posY, "color": piece.color}
-
     def play_movement(
         self, gameID: int, card_id: int, originX: int, originY: int, destinationX: int, destinationY: int
     ) -> None:
-        game = self.db_session.get(GameDB, gameID)
-        if game is None:
-            raise ValueError(f"Game with ID {gameID} not found")
-        board = self.get_board(gameID)
-        origin_piece = next(piece for piece in board if piece.posX == originX and piece.posY == originY)
-        destination_piece = next(piece for piece in board if piece.posX == destinationX and piece.posY == destinationY)
-        aux = origin_piece.color
-        origin_piece.color = destination_piece.color
-        destination_piece.color = aux
-
-        last_movements = json.loads(game.lastMovements) if game.lastMovements else []
-
-        last_movements.append(
-            {
-                "CardID": card_id,
-                "origin": self.board_piece_to_dict(origin_piece),
-                "destination": self.board_piece_to_dict(destination_piece),
-                "Order": len(last_movements) + 1,
-            }
+        state = self.get_state_for_update(gameID)
+        state.board.swap(originX, originY, destinationX, destinationY)
+        state.last_movements.append(
+            PartialMovement(
+                cardID=card_id,
+                originX=originX,
+                originY=originY,
+                destinationX=destinationX,
+                destinationY=destinationY,
+                order=len(state.last_movements) + 1,
+            )
         )
-
-        game.lastMovements = json.dumps(last_movements)
-
-        game.board = json.dumps([self.board_piece_to_dict(piece) for piece in board])
+        self.mark_dirty(state)
         self.db_session.commit()
 
     def has_three_cards(self, gameID: int, playerID: int) -> bool:
@@ -284,39 +299,18 @@ class SQLAlchemyRepository(GameRepository):
         return len(cards) == 3
 
     def partial_movement_exists(self, gameID: int) -> bool:
-        game = self.db_session.get(GameDB, gameID)
-        if game is None:
-            raise ValueError(f"Game with ID {gameID} not found")
-        return len(json.loads(game.lastMovements)) > 0
+        return len(self.get_state(gameID).last_movements) > 0
 
     def delete_partial_movement(self, gameID: int) -> None:
-        game = self.db_session.get(GameDB, gameID)
-        if game is None:
-            raise ValueError(f"Game with ID {gameID} not found")
-
-        last_movements = json.loads(game.lastMovements) if game.lastMovements else []
-        if len(last_movements) == 0:
+        state = self.get_state_for_update(gameID)
+        if len(state.last_movements) == 0:
             return
 
-        last_movement = last_movements[-1]
-        last_movement_origin = last_movement["origin"]
-        last_movement_destination = last_movement["destination"]
-        board = self.get_board(gameID)
-        origin_piece = next(
-            piece
-            for piece in board
-            if piece.posX == last_movement_origin["posX"] and piece.posY == last_movement_origin["posY"]
-        )
-        destination_piece = next(
-            piece
-            for piece in board
-            if piece.posX == last_movement_destination["posX"] and piece.posY == last_movement_destination["posY"]
+        last_movement = state.last_movements.pop()
+        state.board.swap(
+            last_movement.originX, last_movement.originY, last_movement.destinationX, last_movement.destinationY
         )
-        aux = origin_piece.color
-        origin_piece.color = destination_piece.color
-        destination_piece.color = aux
-        game.lastMovements = json.dumps(last_movements[:-1])
-        game.board = json.dumps([self.board_piece_to_dict(piece) for piece in board])
+        self.mark_dirty(state)
         self.db_session.commit()
 
     def has_movement_card(self, playerID: int, cardID: int) -> bool:
@@ -336,60 +330,68 @@ class SQLAlchemyRepository(GameRepository):
         return player.position == game.posEnabledToPlay
 
     def is_piece_partial(self, gameID: int, posX: int, posY: int) -> bool:
-        game = self.db_session.get(GameDB, gameID)
-        last_movements = json.loads(game.lastMovements) if game.lastMovements else []
-        for movement in last_movements:
-            if movement["origin"]["posX"] == posX and movement["origin"]["posY"] == posY:
-                return True
-            if movement["destination"]["posX"] == posX and movement["destination"]["posY"] == posY:
-                return True
-        return False
+        return (posX, posY) in self.get_state(gameID).partial_positions()
 
     def get_players(self, gameID: int) -> List[PlayerPublicInfo]:
+        return self.cache.get_or_load(("players", gameID), lambda: self.load_players(gameID))
+
+    def load_players(self, gameID: int) -> List[PlayerPublicInfo]:
+        """Obtiene los jugadores de la partida con sus cartas de figura.
+
+        Los jugadores (con su nombre, posición y actividad) se cargan en una única consulta
+        y las cartas de figura de toda la partida en otra, que luego se reparten por jugador.
+        """
         game = self.db_session.get(GameDB, gameID)
         if game is None:
             raise ValueError(f"Game with ID {gameID} not found")
-        roomID = game.roomID
-
-        db_players = self.db_session.query(PlayerRoomDB).filter(PlayerRoomDB.roomID == roomID).all()
-        players = []
-
-        for player in db_players:
-            username = self.db_session.get(PlayerDB, player.playerID).username
-            amount_non_playable, playable_cards_figure = self.get_player_figure_cards(gameID, player.playerID)
 
-            players.append(
-                PlayerPublicInfo(
-                    playerID=player.playerID,
-                    username=username,
-                    position=player.position,
-                    isActive=player.isActive,
-                    sizeDeckFigure=amount_non_playable,
-                    cardsFigure=playable_cards_figure,
-                )
+        roster = (
+            self.db_session.query(
+                PlayerRoomDB.playerID, PlayerDB.username, PlayerRoomDB.position, PlayerRoomDB.isActive
             )
-        return players
-
-    def get_player_figure_cards(self, gameID: int, playerID: int) -> Tuple[int, List[FigureCard]]:
-        figure_cards = self.db_session.query(FigureCardDB).filter(
-            FigureCardDB.gameID == gameID, FigureCardDB.playerID == playerID
+            .join(PlayerDB, PlayerDB.playerID == PlayerRoomDB.playerID)
+            .filter(PlayerRoomDB.roomID == game.roomID)
+            .all()
         )
-        amount_non_playable = figure_cards.filter(FigureCardDB.isPlayable.is_(False)).count()
 
-        playable_cards: List[FigureCard] = []
+        amount_non_playable: Dict[int, int] = {}
+        playable_cards: Dict[int, List[FigureCard]] = {}
+        figure_cards = (
+            self.db_session.query(
+                FigureCardDB.cardID,
+                FigureCardDB.type,
+                FigureCardDB.isBlocked,
+                FigureCardDB.isPlayable,
+                FigureCardDB.playerID,
+            )
+            .filter(FigureCardDB.gameID == gameID)
+            .order_by(FigureCardDB.cardID)
+        )
         for card in figure_cards:
             if card.isPlayable:
-                playable_cards.append(
+                playable_cards.setdefault(card.playerID, []).append(
                     FigureCard(
                         type=card.type,
                         cardID=card.cardID,
                         isBlocked=card.isBlocked,
-                        gameID=card.gameID,
+                        gameID=gameID,
                         playerID=card.playerID,
                     )
                 )
-
-        return amount_non_playable, playable_cards
+            else:
+                amount_non_playable[card.playerID] = amount_non_playable.get(card.playerID, 0) + 1
+
+        return [
+            PlayerPublicInfo(
+                playerID=player.playerID,
+                username=player.username,
+                position=player.position,
+                isActive=player.isActive,
+                sizeDeckFigure=amount_non_playable.get(player.playerID, 0),
+                cardsFigure=playable_cards.get(player.playerID, []),
+            )
+            for player in roster
+        ]
 
     def get_player_movement_cards(self, gameID: int, playerID: int) -> List[MovementCard]:
         cards_db = self.db_session.query(MovementCardDB).filter(
@@ -403,43 +405,39 @@ class SQLAlchemyRepository(GameRepository):
         return cards
 
     def clean_partial_movements(self, gameID: int) -> None:
-        game = self.db_session.get(GameDB, gameID)
-        last_movements = json.loads(game.lastMovements) if game.lastMovements else []
-        board = self.get_board(gameID)
-        last_movements.sort(key=lambda x: x["Order"], reverse=True)
-        for movement in last_movements:
-            origin = movement["origin"]
-            destination = movement["destination"]
-            origin_piece = next(
-                piece for piece in board if piece.posX == origin["posX"] and piece.posY == origin["posY"]
-            )
-            destination_piece = next(
-                piece for piece in board if piece.posX == destination["posX"] and piece.posY == destination["posY"]
-            )
-            aux = origin_piece.color
-            origin_piece.color = destination_piece.color
-            destination_piece.color = aux
-        game.board = json.dumps([self.board_piece_to_dict(piece) for piece in board])
-        game.lastMovements = json.dumps([])
+        state = self.get_state_for_update(gameID)
+        for movement in sorted(state.last_movements, key=lambda x: x.order, reverse=True):
+            state.board.swap(movement.originX, movement.originY, movement.destinationX, movement.destinationY)
+        state.last_movements = []
+        self.mark_dirty(state)
         self.db_session.commit()
 
     def set_partial_movements_to_empty(self, gameID: int) -> None:
-        game = self.db_session.get(GameDB, gameID)
-        game.lastMovements = json.dumps([])
+        state = self.get_state_for_update(gameID)
+        state.last_movements = []
+        self.mark_dirty(state)
         self.db_session.commit()
 
     def was_card_used_in_partial_movement(self, gameID: int, cardID: int) -> bool:
-        game = self.db_session.get(GameDB, gameID)
-        last_movements = json.loads(game.lastMovements) if game.lastMovements else []
-        for movement in last_movements:
-            if movement["CardID"] == cardID:
-                return True
-        return False
+        return any(movement.cardID == cardID for movement in self.get_state(gameID).last_movements)
 
     def is_player_in_game(self, playerID, gameID):
         players = self.get_players(gameID)
         return playerID in [player.playerID for player in players]
 
+    def is_active_player_in_game(self, playerID: int, gameID: int) -> bool:
+        return (
+            self.db_session.query(literal_column("1"))
+            .filter(
+                GameDB.gameID == gameID,
+                PlayerRoomDB.roomID == GameDB.roomID,
+                PlayerRoomDB.playerID == playerID,
+                PlayerRoomDB.isActive.is_(True),
+            )
+            .first()
+            is not None
+        )
+
     def get_current_turn(self, gameID: int) -> int:
         game = self.get(gameID)
         if game is None:
@@ -459,14 +457,18 @@ class SQLAlchemyRepository(GameRepository):
         return player_position
 
     def get_public_info(self, gameID: int, playerID: int) -> GamePublicInfo:
-        game = self.get(gameID)
-        if game is None:
-            raise ValueError(f"Game with ID {gameID} not found")
-
         player = self.db_session.get(PlayerDB, playerID)
         if player is None:
             raise ValueError(f"Player with ID {playerID} not found")
 
+        return self.get_shared_public_info(gameID)
+
+    def get_shared_public_info(self, gameID: int) -> GamePublicInfo:
+        """Arma el estado de la partida común a todos los jugadores (tablero, figuras, jugadores y timer)"""
+        game = self.get(gameID)
+        if game is None:
+            raise ValueError(f"Game with ID {gameID} not found")
+
         timestamp = self.db_session.get(GameDB, gameID).timestamp_next_turn
         if timestamp is None:
             timestamp = datetime.now()
@@ -474,104 +476,65 @@ class SQLAlchemyRepository(GameRepository):
         return GamePublicInfo(
             gameID=game.gameID,
             board=game.board,
-            figuresToUse=self.get_available_figures(game.prohibitedColor, self.get_board(gameID)),
+            figuresToUse=self.get_available_figures(game.prohibitedColor, game.board, gameID),
             prohibitedColor=game.prohibitedColor,
             posEnabledToPlay=game.posEnabledToPlay,
             players=game.players,
             timer=timedelta.total_seconds(timestamp - datetime.now()),
         )
 
+    def get_movement_cards_by_player(self, gameID: int) -> Dict[int, List[MovementCard]]:
+        used_cards = {movement.cardID for movement in self.get_state(gameID).last_movements}
+
+        cards_db = (
+            self.db_session.query(MovementCardDB)
+            .filter(MovementCardDB.gameID == gameID, MovementCardDB.playerID.isnot(None))
+            .order_by(MovementCardDB.cardID)
+        )
+        cards: Dict[int, List[MovementCard]] = {}
+        for card in cards_db:
+            cards.setdefault(card.playerID, []).append(
+                MovementCard(type=card.type, cardID=card.cardID, isUsed=card.cardID in used_cards)
+            )
+
+        return cards
+
     def add_movement_cards_to_public_info(self, gameID: int, playerID: int, game: GamePublicInfo):
-        game_json = game.model_dump()
+        return self.personalize_public_info(game.model_dump(), self.get_movement_cards_by_player(gameID), playerID)
 
+    def personalize_public_info(
+        self, game_json: dict, movement_cards: Dict[int, List[MovementCard]], playerID: int
+    ) -> dict:
+        """Agrega al estado común las cartas de movimiento visibles para el jugador:
+        las propias completas y, de los demás, solo las usadas en movimientos parciales.
+        """
+        players = []
         for player in game_json["players"]:
-            player["sizeDeckFigure"], _ = self.get_player_figure_cards(gameID, player["playerID"])
+            cards = movement_cards.get(player["playerID"], [])
             if player["playerID"] == playerID:
-                player["cardsMovement"] = []
-                for card in self.get_player_movement_cards(gameID, playerID):
-                    player["cardsMovement"].append(card.model_dump())
+                cards_movement = [card.model_dump() for card in cards]
             else:
-                cards_db = self.db_session.query(MovementCardDB).filter(
-                    MovementCardDB.gameID == gameID, MovementCardDB.playerID == player["playerID"]
-                )
-                cards = []
-                for card in cards_db:
-                    isUsed = self.was_card_used_in_partial_movement(gameID, card.cardID)
-                    if isUsed:
-                        cards.append(MovementCard(type=card.type, cardID=card.cardID, isUsed=isUsed).model_dump())
-                    else:
-                        cards.append(None)
+                cards_movement = [card.model_dump() if card.isUsed else None for card in cards]
+            players.append({**player, "cardsMovement": cards_movement})
 
-                player["cardsMovement"] = cards
-
-        return game_json
+        return {**game_json, "players": players}
 
     def get_available_figures(
-        self, prohibitedColor: Optional[str], board: List[BoardPiece]
+        self, prohibitedColor: Optional[str], board: List[BoardPiece], gameID: Optional[int] = None
     ) -> List[List[BoardPiecePosition]]:
-        board_matrix = np.empty((6, 6), dtype=object)
-
-        for piece in board:
-            board_matrix[piece.posY][piece.posX] = piece.color
-
-        prohibitedColor = prohibitedColor or ""
-
-        color_layers = self.create_color_layers(board_matrix, prohibitedColor)
-
-        all_figures = []
-        rotated_figures = {
-            figure_type: [np.rot90(shape, k) for k in range(4)] for figure_type, shape in FIGURE_CARDS_FORM.items()
-        }
+        color_masks = color_masks_from_cells((piece.posX, piece.posY, piece.color) for piece in board)
 
-        seen_figures = set()
-
-        for color, layer in color_layers.items():
-            for figure_type, rotations in rotated_figures.items():
-                for rotated_figure in rotations:
-                    figures_found = self.match_figure_in_layer(rotated_figure, layer)
-
-                    for figure in figures_found:
-                        figure_tuple = tuple((pos.posX, pos.posY) for pos in figure)
-
-                        if figure_tuple not in seen_figures:
-                            seen_figures.add(figure_tuple)
-                            all_figures.append(figure)
-
-        return all_figures
-
-    def create_color_layers(self, board_matrix: np.ndarray, prohibitedColor: str) -> dict:
-        return {color: (board_matrix == color).astype(int) for color in COLORS if color != prohibitedColor}
-
-    def match_figure_in_layer(self, shape: np.ndarray, layer: np.ndarray) -> List[List[BoardPiecePosition]]:
-        matched_figures = []
-        shape_height, shape_width = shape.shape
-
-        result = convolve2d(layer, shape[::-1, ::-1], mode="valid")
-
-        for y, x in zip(*np.where(result == shape.sum())):
-            matched_positions = [
-                BoardPiecePosition(posX=x + shape_x, posY=y + shape_y)
-                for shape_y in range(shape_height)
-                for shape_x in range(shape_width)
-                if shape[shape_y, shape_x] == 1
-            ]
-
-            if self.check_border_validity(matched_positions, layer):
-                matched_figures.append(matched_positions)
-
-        return matched_figures
-
-    def check_border_validity(self, positions: List[BoardPiecePosition], layer: np.ndarray) -> bool:
-        position_set = {(pos.posX, pos.posY) for pos in positions}
-        for pos in positions:
-            x, y = pos.posX, pos.posY
-            adjacent_positions = [(x + dx, y + dy) for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]]
+        placements = figure_cache.get(color_masks, prohibitedColor)
+        if placements is None:
+            if gameID is None:
+                placements = find_figures(color_masks, prohibitedColor)
+            else:
+                placements = figure_detector.detect(gameID, color_masks, prohibitedColor)
+            figure_cache.put(color_masks, prohibitedColor, placements)
 
-            for nx, ny in adjacent_positions:
-                if 0 <= nx < 6 and 0 <= ny < 6 and (nx, ny) not in position_set:
-                    if layer[ny, nx] == layer[y, x]:
-                        return False
-        return True
+        return [
+            [BoardPiecePosition(posX=posX, posY=posY) for posX, posY in placement.cells] for placement in placements
+        ]
 
     def set_player_inactive(self, playerID: int, gameID: int) -> None:
         game = self.db_session.get(GameDB, gameID)
@@ -623,6 +586,8 @@ class SQLAlchemyRepository(GameRepository):
         self.db_session.delete(game)
         self.db_session.delete(room)
         self.db_session.commit()
+        self.game_states.forget(gameID)
+        figure_detector.forget(gameID)
 
     def play_figure(self, gameID: int, figureID: int, figure: List[BoardPiecePosition]) -> None:
         figure_card = self.db_session.query(FigureCardDB).filter_by(cardID=figureID).first()
@@ -634,10 +599,7 @@ class SQLAlchemyRepository(GameRepository):
             self.db_session.commit()
 
     def get_color_from_position(self, gameID: int, posX: int, posY: int) -> str:
-        game = self.db_session.get(GameDB, gameID)
-        board = json.loads(game.board)
-        piece = next(piece for piece in board if piece["posX"] == posX and piece["posY"] == posY)
-        return piece["color"]
+        return self.get_state(gameID).board.get(posX, posY)
 
     def change_color_prohibited(self, gameID: int, color: str) -> None:
         game = self.db_session.get(GameDB, gameID)
@@ -645,6 +607,9 @@ class SQLAlchemyRepository(GameRepository):
         self.db_session.commit()
 
     def get_figure_card(self, figureCardID: int) -> Optional[FigureCard]:
+        return self.cache.get_or_load(("figure_card", figureCardID), lambda: self.load_figure_card(figureCardID))
+
+    def load_figure_card(self, figureCardID: int) -> Optional[FigureCard]:
         card = self.db_session.get(FigureCardDB, figureCardID)
         if card is None:
             return None
@@ -653,10 +618,8 @@ class SQLAlchemyRepository(GameRepository):
         )
 
     def desvinculate_partial_movement_cards(self, gameID):
-        game = self.db_session.get(GameDB, gameID)
-        last_movements = json.loads(game.lastMovements) if game.lastMovements else []
-        for movement in last_movements:
-            card = self.db_session.get(MovementCardDB, movement["CardID"])
+        for movement in self.get_state(gameID).last_movements:
+            card = self.db_session.get(MovementCardDB, movement.cardID)
             card.playerID = None
             card.isDiscarded = True
         self.db_session.commit()
@@ -776,6 +739,25 @@ class SQLAlchemyRepository(GameRepository):
         game.timestamp_next_turn = timestamp
         self.db_session.commit()
 
+    def get_pending_turn_deadlines(self) -> List[TurnDeadline]:
+        """Obtiene, en una única consulta, el vencimiento del turno en curso de cada partida
+        junto al jugador que tiene el turno
+        """
+        deadlines = (
+            self.db_session.query(GameDB.gameID, PlayerRoomDB.playerID, GameDB.timestamp_next_turn)
+            .join(
+                PlayerRoomDB,
+                (PlayerRoomDB.roomID == GameDB.roomID) & (PlayerRoomDB.position == GameDB.posEnabledToPlay),
+            )
+            .filter(GameDB.timestamp_next_turn.is_not(None))
+            .order_by(GameDB.timestamp_next_turn)
+            .all()
+        )
+        return [
+            TurnDeadline(gameID=gameID, playerID=playerID, timestamp=timestamp)
+            for gameID, playerID, timestamp in deadlines
+        ]
+
 
 class WebSocketRepository(GameRepositoryWS, SQLAlchemyRepository):
     async def setup_connection_game(self, playerID: int, gameID: int, websocket: WebSocket) -> None:
@@ -799,11 +781,12 @@ class WebSocketRepository(GameRepositoryWS, SQLAlchemyRepository):
         Args:
             gameID (int): ID del juego
         """
-        players = self.get_players(gameID)
-        for player in players:
-            game = self.get_public_info(gameID, player.playerID)
-            game_json = self.add_movement_cards_to_public_info(gameID, player.playerID, game)
-            await ws_manager_game.send_personal_message_by_id(MessageType.STATUS, game_json, player.playerID, gameID)
+        game = await run_blocking(self.get_shared_public_info, gameID)
+        game_json = game.model_dump()
+        movement_cards = await run_blocking(self.get_movement_cards_by_player, gameID)
+        for player in game.players:
+            player_json = self.personalize_public_info(game_json, movement_cards, player.playerID)
+            await ws_manager_game.send_personal_message_by_id(MessageType.STATUS, player_json, player.playerID, gameID)
 
     async def broadcast_end_game(self, gameID: int, winnerID: int) -> None:
         """Envia un mensaje de fin de juego a todos los jugadores
@@ -831,17 +814,12 @@ class WebSocketRepository(GameRepositoryWS, SQLAlchemyRepository):
         await ws_manager_game.broadcast(MessageType.MSG, data, gameID)
 
     async def send_log_cancel_movement_card(self, gameID: int, playerID: int) -> None:
-        game = self.db_session.get(GameDB, gameID)
-
-        if game is None:
-            raise ValueError(f"Game with ID {gameID} not found")
-
-        last_movements = json.loads(game.lastMovements) if game.lastMovements else []
+        last_movements = self.get_state(gameID).last_movements
 
         if len(last_movements) == 0:
             return
 
-        card = self.get_movement_card(last_movements[-1]["CardID"])
+        card = self.get_movement_card(last_movements[-1].cardID)
         card_name = MOVEMENT_CARDS_NAMES[card.type]
         player = self.db_session.get(PlayerDB, playerID)
         player_name = player.username
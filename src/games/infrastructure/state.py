@@ -0,0 +1,290 @@
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session, SessionTransaction
+from sqlalchemy.orm.exc import StaleDataError
+
+from src.games.domain.board import Board
+from src.games.infrastructure.models import Game as GameDB
+
+
+@dataclass
+class PartialMovement:
+    cardID: int
+    originX: int
+    originY: int
+    destinationX: int
+    destinationY: int
+    order: int
+
+
+@dataclass
+class GameState:
+    """Estado de una partida decodificado en estructuras tipadas"""
+
+    gameID: int
+    board: Board
+    last_movements: List[PartialMovement] = field(default_factory=list)
+    version: int = 0
+    dirty: bool = False
+
+    def partial_positions(self) -> Set[Tuple[int, int]]:
+        """Posiciones (posX, posY) afectadas por los movimientos parciales"""
+        positions: Set[Tuple[int, int]] = set()
+        for movement in self.last_movements:
+            positions.add((movement.originX, movement.originY))
+            positions.add((movement.destinationX, movement.destinationY))
+        return positions
+
+    def copy(self) -> "GameState":
+        """Copia que se puede modificar sin afectar al original (los movimientos no se modifican, solo se reemplazan)"""
+        return GameState(
+            gameID=self.gameID,
+            board=self.board.copy(),
+            last_movements=list(self.last_movements),
+            version=self.version,
+        )
+
+    def encode_board(self) -> str:
+        return self.board.encode()
+
+    def encode_last_movements(self) -> List[Dict[str, Any]]:
+        """Movimientos parciales como lista JSON; la columna los serializa (JSONB en PostgreSQL)"""
+        return [
+            {
+                "CardID": movement.cardID,
+                "origin": self._encode_piece(movement.originX, movement.originY),
+                "destination": self._encode_piece(movement.destinationX, movement.destinationY),
+                "Order": movement.order,
+            }
+            for movement in self.last_movements
+        ]
+
+    def _encode_piece(self, posX: int, posY: int) -> Dict[str, Any]:
+        return {"posX": posX, "posY": posY, "color": self.board.get(posX, posY)}
+
+
+def decode_json(raw: Any) -> Any:
+    """Decodifica una columna JSON que puede estar guardada como texto JSON (una o más veces),
+    como en las filas escritas antes de guardar los movimientos como lista (ver `migrate_legacy_last_movements`)
+    """
+    value = raw
+    while isinstance(value, str):
+        value = json.loads(value)
+    return value
+
+
+def load_game_state(gameID: int, game: GameDB) -> GameState:
+    last_movements_json = decode_json(game.lastMovements) or []
+
+    return GameState(
+        gameID=gameID,
+        board=Board.decode(game.board),
+        last_movements=[
+            PartialMovement(
+                cardID=movement["CardID"],
+                originX=movement["origin"]["posX"],
+                originY=movement["origin"]["posY"],
+                destinationX=movement["destination"]["posX"],
+                destinationY=movement["destination"]["posY"],
+                order=movement["Order"],
+            )
+            for movement in last_movements_json
+        ],
+        version=int(game.version),
+    )
+
+
+class GameStateEngine:
+    """Estado decodificado de las partidas, compartido por todas las requests del proceso.
+
+    Cada fila de `games` tiene un número de versión que aumenta con cada escritura del tablero y de los
+    movimientos parciales. El engine guarda la última versión decodificada de cada partida y la reutiliza
+    mientras la fila conserve esa versión; si otra request u otro proceso la modificó, se vuelve a decodificar.
+
+    Las escrituras se hacen en la misma transacción que el resto de la acción (ver `GameStateStore`),
+    comparando la versión leída con la de la fila: si la fila cambió mientras tanto, la escritura falla con
+    `StaleDataError` y se deshace la transacción completa, en lugar de pisar la otra escritura. Dentro del
+    proceso, las modificaciones de una misma partida se hacen de a una, con un lock por partida.
+    """
+
+    def __init__(self) -> None:
+        self.states: Dict[int, GameState] = {}
+        self.game_locks: Dict[int, threading.Lock] = {}
+        self.lock = threading.Lock()
+        self.loads = 0
+
+    def checkout(self, db_session: Session, gameID: int, refresh: bool = False) -> Optional[GameState]:
+        """Devuelve una copia del estado vigente de la partida para usarla en la sesión.
+        Lee la fila de la partida y la decodifica solo si su versión no es la que está en memoria
+
+        Args:
+            db_session (Session): Sesión de la request
+            gameID (int): ID de la partida
+            refresh (bool): Vuelve a leer la fila aunque la sesión ya la tenga cargada
+        """
+        game = db_session.get(GameDB, gameID, populate_existing=refresh)
+        if game is None:
+            self.forget(gameID)
+            return None
+
+        with self.lock:
+            state = self.states.get(gameID)
+        if state is None or state.version != game.version:
+            state = load_game_state(gameID, game)
+            self.publish(state)
+            with self.lock:
+                self.loads += 1
+        return state.copy()
+
+    def publish(self, state: GameState) -> None:
+        """Guarda un estado leído o escrito en la base de datos, salvo que ya haya uno más nuevo"""
+        with self.lock:
+            current = self.states.get(state.gameID)
+            if current is None or current.version <= state.version:
+                self.states[state.gameID] = state
+
+    def game_lock(self, gameID: int) -> threading.Lock:
+        """Lock que serializa las modificaciones de una partida dentro del proceso"""
+        with self.lock:
+            return self.game_locks.setdefault(gameID, threading.Lock())
+
+    def forget(self, gameID: int) -> None:
+        """Descarta el estado decodificado de una partida"""
+        with self.lock:
+            self.states.pop(gameID, None)
+
+    def clean_up(self) -> None:
+        """Descarta todos los estados decodificados"""
+        with self.lock:
+            self.states.clear()
+            self.game_locks.clear()
+            self.loads = 0
+
+
+game_state_engine = GameStateEngine()
+
+
+class GameStateStore:
+    """Estados de partida usados en una sesión, sobre el estado en memoria de `GameStateEngine`.
+
+    Cada partida se toma del engine una sola vez por sesión. Para modificarla se usa `get_for_update`,
+    que toma el lock de la partida hasta que termina la transacción y vuelve a leerla. Antes del commit
+    los estados modificados se escriben en sus filas, con una sentencia por partida que solo actualiza
+    la fila si conserva la versión leída; luego del commit se publican en el engine. Si la sesión hace
+    rollback se descartan.
+    """
+
+    def __init__(self, db_session: Session, engine: GameStateEngine = game_state_engine):
+        self.db_session = db_session
+        self.engine = engine
+        self.states: Dict[int, GameState] = {}
+        self.locks: Dict[int, threading.Lock] = {}
+
+    @classmethod
+    def for_session(cls, db_session: Session) -> "GameStateStore":
+        store = db_session.info.get("game_states")
+        if store is None:
+            store = cls(db_session)
+            db_session.info["game_states"] = store
+        return store
+
+    def get(self, gameID: int) -> Optional[GameState]:
+        state = self.states.get(gameID)
+        if state is None:
+            state = self.engine.checkout(self.db_session, gameID)
+            if state is None:
+                return None
+            self.states[gameID] = state
+        return state
+
+    def get_for_update(self, gameID: int) -> Optional[GameState]:
+        """Toma la partida para modificarla: espera el lock de la partida, que se mantiene hasta el fin
+        de la transacción, y la vuelve a leer para partir de la última versión escrita
+        """
+        if gameID not in self.locks:
+            lock = self.engine.game_lock(gameID)
+            lock.acquire()
+            self.locks[gameID] = lock
+            state = self.engine.checkout(self.db_session, gameID, refresh=True)
+            if state is None:
+                self.locks.pop(gameID).release()
+                return None
+            self.states[gameID] = state
+        return self.states[gameID]
+
+    def mark_dirty(self, state: GameState) -> None:
+        state.dirty = True
+
+    def forget(self, gameID: int) -> None:
+        self.states.pop(gameID, None)
+        self.engine.forget(gameID)
+
+    def clear(self) -> None:
+        self.states.clear()
+
+    def release(self) -> None:
+        for lock in self.locks.values():
+            lock.release()
+        self.locks.clear()
+
+    def write(self) -> None:
+        """Escribe los estados modificados en sus filas, si ninguna otra transacción las cambió desde que se leyeron
+
+        Raises:
+            StaleDataError: Si la fila de alguna partida ya no tiene la versión leída
+        """
+        for state in self.states.values():
+            if not state.dirty:
+                continue
+            result = self.db_session.execute(
+                update(GameDB)
+                .where(GameDB.gameID == state.gameID, GameDB.version == state.version)
+                .values(
+                    board=state.encode_board(),
+                    lastMovements=state.encode_last_movements(),
+                    version=state.version + 1,
+                )
+            )
+            if result.rowcount != 1:
+                raise StaleDataError(f"La partida {state.gameID} fue modificada por otra transacción")
+
+    def commit(self) -> None:
+        """Publica en el engine los estados escritos en la transacción"""
+        for state in self.states.values():
+            if state.dirty:
+                state.dirty = False
+                state.version += 1
+                self.engine.publish(state)
+        self.states.clear()
+
+
+@event.listens_for(Session, "before_commit")
+def _write_game_states(session: Session) -> None:
+    store = session.info.get("game_states")
+    if store is not None:
+        store.write()
+
+
+@event.listens_for(Session, "after_commit")
+def _commit_game_states(session: Session) -> None:
+    store = session.info.get("game_states")
+    if store is not None:
+        store.commit()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_game_states(session: Session) -> None:
+    store = session.info.get("game_states")
+    if store is not None:
+        store.clear()
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _release_game_locks(session: Session, transaction: SessionTransaction) -> None:
+    store = session.info.get("game_states")
+    if store is not None and transaction.parent is None:
+        store.release()
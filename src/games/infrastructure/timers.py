@@ -0,0 +1,56 @@
+import asyncio
+import datetime
+from functools import partial
+
+from sqlalchemy.orm import sessionmaker
+
+from src.games.application.service import GameService
+from src.games.application.timer import turn_timer
+from src.games.config import TIMER_RECOVERY_BATCH_SIZE
+from src.games.infrastructure.repository import WebSocketRepository as GameRepository
+from src.players.infrastructure.repository import SQLAlchemyRepository as PlayerRepository
+from src.rooms.infrastructure.repository import WebSocketRepository as RoomRepository
+
+
+async def run_recovered_timer(
+    session_factory: sessionmaker,
+    slots: asyncio.Semaphore,
+    playerID: int,
+    gameID: int,
+    timestamp: datetime.datetime,
+) -> None:
+    """Ejecuta el vencimiento de un turno recuperado con una sesión propia,
+    limitando cuántos vencimientos recuperados se procesan a la vez
+    """
+    async with slots:
+        with session_factory() as db_session:
+            game_service = GameService(
+                GameRepository(db_session), PlayerRepository(db_session), RoomRepository(db_session)
+            )
+            await game_service._run_timer(playerID, gameID, timestamp)
+
+
+def restore_turn_timers(session_factory: sessionmaker) -> int:
+    """Vuelve a programar los timers de turno de todas las partidas en curso a partir de
+    `timestamp_next_turn`. Los turnos ya vencidos se disparan de inmediato, de a
+    `TIMER_RECOVERY_BATCH_SIZE` por vez.
+
+    Args:
+        session_factory: Fábrica de sesiones de la base de datos
+
+    Returns:
+        int: Cantidad de timers programados
+    """
+    with session_factory() as db_session:
+        deadlines = GameRepository(db_session).get_pending_turn_deadlines()
+
+    slots = asyncio.Semaphore(TIMER_RECOVERY_BATCH_SIZE)
+    for deadline in deadlines:
+        turn_timer.schedule(
+            deadline.gameID,
+            deadline.timestamp,
+            partial(
+                run_recovered_timer, session_factory, slots, deadline.playerID, deadline.gameID, deadline.timestamp
+            ),
+        )
+    return len(deadlines)
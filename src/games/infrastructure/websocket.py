@@ -1,7 +1,10 @@
 from enum import Enum
-from typing import Dict, List
+from typing import Any, Dict, Optional, Tuple
 
-from fastapi.websockets import WebSocket, WebSocketDisconnect, WebSocketState
+from fastapi.websockets import WebSocket, WebSocketDisconnect
+
+from src.shared.backplane import Backplane, InProcessBackplane, backplane
+from src.shared.websocket import Frame, OutboundConnections
 
 
 class MessageType(str, Enum):
@@ -10,15 +13,29 @@ class MessageType(str, Enum):
     MSG = "msg"
 
 
-class ConnectionManagerGame:
+class ConnectionManagerGame(OutboundConnections):
+    """Conexiones de los jugadores, por juego.
+
+    Los envíos por ID y los broadcasts se publican en el canal `game` del backplane,
+    así que llegan también a los jugadores conectados a otros procesos (ver `receive`).
+    """
+
     active_connections: Dict[int, Dict[int, WebSocket]]
+    owners: Dict[WebSocket, Tuple[int, int]]
 
-    def __init__(self):
+    def __init__(self, backplane: Optional[Backplane] = None):
+        super().__init__()
         self.active_connections = {}
+        # Índice inverso: a qué juego y jugador pertenece cada conexión
+        self.owners = {}
+        self.backplane = backplane or InProcessBackplane()
+        self.backplane.subscribe("game", self.receive)
 
     def clean_up(self):
         """Limpia la lista de conexiones activas"""
         self.active_connections.clear()
+        self.owners.clear()
+        self.clean_up_outbound()
 
     async def connect(self, playerID: int, gameID: int, websocket: WebSocket):
         """Acepta la conexión con el cliente y la almacena.
@@ -32,10 +49,14 @@ class ConnectionManagerGame:
         await websocket.accept()
         if gameID in self.active_connections:
             if playerID in self.active_connections[gameID]:
-                await self.active_connections[gameID][playerID].close(4005, "Conexión abierta en otra pestaña")
+                previous = self.active_connections[gameID][playerID]
+                self.owners.pop(previous, None)
+                await self.close_connection(previous, 4005, "Conexión abierta en otra pestaña")
         if gameID not in self.active_connections:
             self.active_connections[gameID] = {}
         self.active_connections[gameID][playerID] = websocket
+        self.owners[websocket] = (gameID, playerID)
+        self.open_outbound(websocket)
 
     async def keep_listening(self, websocket: WebSocket, gameID: int):
         """Mantiene la conexión abierta con el cliente por tiempo indefinido
@@ -58,17 +79,10 @@ class ConnectionManagerGame:
         Args:
             websocket (WebSocket): Conexión con el cliente
         """
-        if websocket.client_state != WebSocketState.DISCONNECTED:
-            await websocket.close()
-        active_connections = self.active_connections.copy()
-        for gameID in active_connections:
-            if websocket in active_connections[gameID].values():
-                playerID = list(active_connections[gameID].keys())[
-                    list(active_connections[gameID].values()).index(websocket)
-                ]
-                self.active_connections[gameID].pop(playerID)
-                if not self.active_connections[gameID]:
-                    self.active_connections.pop(gameID)
+        owner = self.owners.pop(websocket, None)
+        if owner is not None:
+            self._remove(*owner)
+        await self.close_connection(websocket)
 
     async def disconnect_by_id(self, playerID: int, gameID: int):
         """Remueve al cliente de la lista de conexiones activas y cierra la conexión en caso de que no esté cerrada
@@ -77,14 +91,20 @@ class ConnectionManagerGame:
             playerID (int): ID del jugador
             gameID (int): ID del juego
         """
+        await self.backplane.publish("game", {"op": "disconnect", "gameID": gameID, "playerID": playerID})
+
+    async def _disconnect_local(self, playerID: int, gameID: int):
         if gameID in self.active_connections:
             if playerID in self.active_connections[gameID]:
                 websocket = self.active_connections[gameID][playerID]
-                if websocket.client_state != WebSocketState.DISCONNECTED:
-                    await websocket.close()
-                self.active_connections[gameID].pop(playerID)
-                if not self.active_connections[gameID]:
-                    self.active_connections.pop(gameID)
+                self.owners.pop(websocket, None)
+                self._remove(gameID, playerID)
+                await self.close_connection(websocket)
+
+    def _remove(self, gameID: int, playerID: int):
+        self.active_connections[gameID].pop(playerID)
+        if not self.active_connections[gameID]:
+            self.active_connections.pop(gameID)
 
     async def send_personal_message(self, type: MessageType, payload: str, websocket: WebSocket):
         """Envía un mensaje personalizado al cliente
@@ -95,7 +115,7 @@ class ConnectionManagerGame:
             websocket (WebSocket): Conexión con el cliente
         """
         message = {"type": type, "payload": payload}
-        await websocket.send_json(message)
+        self.send(websocket, message)
 
     async def send_personal_message_by_id(self, type: MessageType, payload: str, playerID: int, gameID: int):
         """Envía un mensaje personalizado al cliente
@@ -106,10 +126,8 @@ class ConnectionManagerGame:
             playerID (int): ID del jugador
             gameID (int): ID del juego
         """
-        message = {"type": type, "payload": payload}
-        if gameID in self.active_connections:
-            if playerID in self.active_connections[gameID]:
-                await self.active_connections[gameID][playerID].send_json(message)
+        frame = Frame.encode({"type": type, "payload": payload})
+        await self.backplane.publish("game", {"op": "send", "gameID": gameID, "playerID": playerID, "frame": frame})
 
     async def broadcast(self, type: MessageType, payload: dict, gameID: int):
         """Envía un mensaje a todos los clientes conectados al juego
@@ -119,10 +137,27 @@ class ConnectionManagerGame:
             payload (dict): Cuerpo del mensaje
             gameID (int): ID del juego
         """
-        message = {"type": type, "payload": payload}
-        if gameID in self.active_connections:
-            for connection in self.active_connections[gameID].values():
-                await connection.send_json(message)
+        frame = Frame.encode({"type": type, "payload": payload})
+        await self.backplane.publish("game", {"op": "send", "gameID": gameID, "playerID": None, "frame": frame})
 
+    async def receive(self, message: Dict[str, Any]):
+        """Aplica sobre las conexiones de este proceso un envío publicado en el backplane
 
-ws_manager_game = ConnectionManagerGame()
+        Args:
+            message (Dict[str, Any]): Operación (`send` o `disconnect`), juego y jugador destinatarios
+            (None para todos los jugadores) y, para `send`, el mensaje serializado
+        """
+        gameID, playerID = message["gameID"], message["playerID"]
+        if message["op"] == "disconnect":
+            await self._disconnect_local(playerID, gameID)
+            return
+        frame = Frame(*message["frame"])
+        connections = self.active_connections.get(gameID, {})
+        if playerID is None:
+            for connection in connections.values():
+                self.send(connection, frame)
+        elif playerID in connections:
+            self.send(connections[playerID], frame)
+
+
+ws_manager_game = ConnectionManagerGame(backplane)
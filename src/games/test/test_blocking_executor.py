@@ -0,0 +1,90 @@
+import asyncio
+import threading
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.database import DB_POOL_SIZE, Base
+from src.players.infrastructure.models import Player as PlayerDB
+from src.shared.executor import blocking_executor, run_blocking
+
+
+def test_run_blocking_uses_bounded_pool():
+    thread = asyncio.run(run_blocking(threading.current_thread))
+
+    assert thread is not threading.current_thread()
+    assert thread.name.startswith("blocking")
+    assert blocking_executor._max_workers == DB_POOL_SIZE
+
+
+def test_run_blocking_keeps_event_loop_responsive():
+    async def main():
+        ticks = 0
+        done = False
+
+        async def ticker():
+            nonlocal ticks
+            while not done:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        task = asyncio.create_task(ticker())
+        await run_blocking(time.sleep, 0.05)
+        done = True
+        await task
+        return ticks
+
+    assert asyncio.run(main()) > 5
+
+
+WRITES = 20
+ROWS_PER_WRITE = 100
+
+
+def test_database_writes_yield_to_broadcasts(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'benchmark.sqlite'}")
+    Base.metadata.create_all(bind=engine)
+    SessionFactory = sessionmaker(bind=engine)
+
+    def write(index: int) -> None:
+        with SessionFactory() as db_session:
+            db_session.add_all([PlayerDB(username=f"player {index}-{row}") for row in range(ROWS_PER_WRITE)])
+            db_session.commit()
+
+    async def inline_write(index: int) -> None:
+        write(index)
+
+    async def blocking_write(index: int) -> None:
+        await run_blocking(write, index)
+
+    async def measure(write_once) -> int:
+        """Cuenta cuántas veces corre un loop de broadcasts mientras se hacen las escrituras"""
+        ticks = 0
+        writing = True
+
+        async def broadcaster():
+            nonlocal ticks
+            while writing:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(broadcaster())
+        await asyncio.sleep(0)
+        for index in range(WRITES):
+            await write_once(index)
+        writing = False
+        await task
+        return ticks
+
+    async def main():
+        return await measure(inline_write), await measure(blocking_write)
+
+    inline, blocking = asyncio.run(main())
+
+    # Escribiendo en el event loop los broadcasts solo corren entre escrituras;
+    # desde el pool de hilos también corren mientras cada escritura espera a la base de datos.
+    assert inline <= WRITES + 1
+    assert blocking > 2 * WRITES
+    with SessionFactory() as db_session:
+        assert db_session.query(PlayerDB).count() == 2 * WRITES * ROWS_PER_WRITE
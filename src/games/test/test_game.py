@@ -3,6 +3,7 @@ import json
 import pytest
 
 from src.conftest import override_get_db
+from src.games.domain.board import Board
 from src.games.infrastructure.models import FigureCard as FigureCardDB
 from src.games.infrastructure.models import Game as GameDB
 from src.games.infrastructure.models import MovementCard as MovementCardDB
@@ -190,19 +191,24 @@ def test_create_game_send_update_room_list_ws_2(client, test_db):
 
         response = client.post(f"/games/{room.roomID}", json={"playerID": players[0].playerID})
 
-        data = websocket.receive_json()
-        assert data["type"] == "status"
-        assert data["payload"] == [
-            {
-                "roomID": 1,
-                "roomName": "test_room1",
-                "maxPlayers": 4,
-                "actualPlayers": 2,
-                "started": True,
-                "private": False,
-                "playersID": [1, 2],
-            },
-        ]
+        delta = websocket.receive_json()
+        assert delta["type"] == "delta"
+        assert delta["seq"] == data["seq"] + 1
+        assert delta["payload"] == {
+            "added": [],
+            "updated": [
+                {
+                    "roomID": 1,
+                    "roomName": "test_room1",
+                    "maxPlayers": 4,
+                    "actualPlayers": 2,
+                    "started": True,
+                    "private": False,
+                    "playersID": [1, 2],
+                },
+            ],
+            "removed": [],
+        }
 
         response.status_code == 201
         response.json() == {"gameID": 1}
@@ -739,13 +745,13 @@ def test_create_game_board(client, test_db):
     response = client.post(f"/games/{room.roomID}", json={"playerID": players[0].playerID})
 
     game = db.get(GameDB, 1)
-    board = json.loads(game.board)
+    board = Board.decode(game.board)
 
     color_count = {}
-    for cell in board:
-        if cell["color"] not in color_count:
-            color_count[cell["color"]] = 0
-        color_count[cell["color"]] += 1
+    for color in board:
+        if color not in color_count:
+            color_count[color] = 0
+        color_count[color] += 1
 
     for count in color_count.values():
         assert count == 9
@@ -824,12 +830,9 @@ def test_play__correct_mov1_card(client, test_db):
 
     db.commit()
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 0 and item["posY"] == 0)
-    destination = next(item for item in board if item["posX"] == 2 and item["posY"] == 2)
-    assert origin["color"] == "R"
-    assert destination["color"] == "B"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 0) == "R"
+    assert board.get(2, 2) == "B"
 
     response = client.post(
         "/games/1/movement",
@@ -837,12 +840,9 @@ def test_play__correct_mov1_card(client, test_db):
     )
     assert response.status_code == 201
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 0 and item["posY"] == 0)
-    destination = next(item for item in board if item["posX"] == 2 and item["posY"] == 2)
-    assert origin["color"] == "B"
-    assert destination["color"] == "R"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 0) == "B"
+    assert board.get(2, 2) == "R"
 
 
 def test_play__incorrect_mov1_card(client, test_db):
@@ -874,12 +874,9 @@ def test_play__incorrect_mov1_card(client, test_db):
 
     db.commit()
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 0 and item["posY"] == 0)
-    destination = next(item for item in board if item["posX"] == 2 and item["posY"] == 2)
-    assert origin["color"] == "R"
-    assert destination["color"] == "B"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 0) == "R"
+    assert board.get(2, 2) == "B"
 
     response = client.post(
         "/games/1/movement",
@@ -888,12 +885,9 @@ def test_play__incorrect_mov1_card(client, test_db):
     assert response.status_code == 403
     assert response.json() == {"detail": "Movimiento inválido."}
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 0 and item["posY"] == 0)
-    destination = next(item for item in board if item["posX"] == 2 and item["posY"] == 2)
-    assert origin["color"] == "R"
-    assert destination["color"] == "B"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 0) == "R"
+    assert board.get(2, 2) == "B"
 
 
 def test_play_correct_mov2_card(client, test_db):
@@ -925,12 +919,9 @@ def test_play_correct_mov2_card(client, test_db):
 
     db.commit()
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 0 and item["posY"] == 0)
-    destination = next(item for item in board if item["posX"] == 0 and item["posY"] == 2)
-    assert origin["color"] == "R"
-    assert destination["color"] == "B"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 0) == "R"
+    assert board.get(0, 2) == "B"
 
     response = client.post(
         "/games/1/movement",
@@ -938,12 +929,9 @@ def test_play_correct_mov2_card(client, test_db):
     )
     assert response.status_code == 201
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 0 and item["posY"] == 0)
-    destination = next(item for item in board if item["posX"] == 0 and item["posY"] == 2)
-    assert origin["color"] == "B"
-    assert destination["color"] == "R"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 0) == "B"
+    assert board.get(0, 2) == "R"
 
 
 def test_play_incorrect_mov2_card(client, test_db):
@@ -975,12 +963,9 @@ def test_play_incorrect_mov2_card(client, test_db):
 
     db.commit()
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 0 and item["posY"] == 0)
-    destination = next(item for item in board if item["posX"] == 0 and item["posY"] == 2)
-    assert origin["color"] == "R"
-    assert destination["color"] == "B"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 0) == "R"
+    assert board.get(0, 2) == "B"
 
     response = client.post(
         "/games/1/movement",
@@ -989,12 +974,9 @@ def test_play_incorrect_mov2_card(client, test_db):
     assert response.status_code == 403
     assert response.json() == {"detail": "Movimiento inválido."}
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 0 and item["posY"] == 0)
-    destination = next(item for item in board if item["posX"] == 0 and item["posY"] == 2)
-    assert origin["color"] == "R"
-    assert destination["color"] == "B"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 0) == "R"
+    assert board.get(0, 2) == "B"
 
 
 def test_play_correct_mov3_card(client, test_db):
@@ -1025,12 +1007,9 @@ def test_play_correct_mov3_card(client, test_db):
     )
     db.commit()
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 0 and item["posY"] == 0)
-    destination = next(item for item in board if item["posX"] == 0 and item["posY"] == 1)
-    assert origin["color"] == "R"
-    assert destination["color"] == "B"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 0) == "R"
+    assert board.get(0, 1) == "B"
 
     response = client.post(
         "/games/1/movement",
@@ -1038,12 +1017,9 @@ def test_play_correct_mov3_card(client, test_db):
     )
     assert response.status_code == 201
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 0 and item["posY"] == 0)
-    destination = next(item for item in board if item["posX"] == 0 and item["posY"] == 1)
-    assert origin["color"] == "B"
-    assert destination["color"] == "R"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 0) == "B"
+    assert board.get(0, 1) == "R"
 
 
 def test_play_incorrect_mov3_card(client, test_db):
@@ -1074,12 +1050,9 @@ def test_play_incorrect_mov3_card(client, test_db):
     )
     db.commit()
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 0 and item["posY"] == 0)
-    destination = next(item for item in board if item["posX"] == 0 and item["posY"] == 1)
-    assert origin["color"] == "R"
-    assert destination["color"] == "B"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 0) == "R"
+    assert board.get(0, 1) == "B"
 
     response = client.post(
         "/games/1/movement",
@@ -1088,12 +1061,9 @@ def test_play_incorrect_mov3_card(client, test_db):
     assert response.status_code == 403
     assert response.json() == {"detail": "Movimiento inválido."}
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 0 and item["posY"] == 0)
-    destination = next(item for item in board if item["posX"] == 0 and item["posY"] == 1)
-    assert origin["color"] == "R"
-    assert destination["color"] == "B"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 0) == "R"
+    assert board.get(0, 1) == "B"
 
 
 def test_play_correct_mov4_card(client, test_db):
@@ -1124,12 +1094,9 @@ def test_play_correct_mov4_card(client, test_db):
     )
     db.commit()
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 0 and item["posY"] == 0)
-    destination = next(item for item in board if item["posX"] == 1 and item["posY"] == 1)
-    assert origin["color"] == "R"
-    assert destination["color"] == "B"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 0) == "R"
+    assert board.get(1, 1) == "B"
 
     response = client.post(
         "/games/1/movement",
@@ -1137,12 +1104,9 @@ def test_play_correct_mov4_card(client, test_db):
     )
     assert response.status_code == 201
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 0 and item["posY"] == 0)
-    destination = next(item for item in board if item["posX"] == 1 and item["posY"] == 1)
-    assert origin["color"] == "B"
-    assert destination["color"] == "R"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 0) == "B"
+    assert board.get(1, 1) == "R"
 
 
 def test_play_incorrect_mov4_card(client, test_db):
@@ -1173,12 +1137,9 @@ def test_play_incorrect_mov4_card(client, test_db):
     )
     db.commit()
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 0 and item["posY"] == 0)
-    destination = next(item for item in board if item["posX"] == 1 and item["posY"] == 1)
-    assert origin["color"] == "R"
-    assert destination["color"] == "B"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 0) == "R"
+    assert board.get(1, 1) == "B"
 
     response = client.post(
         "/games/1/movement",
@@ -1187,12 +1148,9 @@ def test_play_incorrect_mov4_card(client, test_db):
     assert response.status_code == 403
     assert response.json() == {"detail": "Movimiento inválido."}
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 0 and item["posY"] == 0)
-    destination = next(item for item in board if item["posX"] == 1 and item["posY"] == 1)
-    assert origin["color"] == "R"
-    assert destination["color"] == "B"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 0) == "R"
+    assert board.get(1, 1) == "B"
 
 
 def test_play_correct_mov5_card_down(client, test_db):
@@ -1223,12 +1181,9 @@ def test_play_correct_mov5_card_down(client, test_db):
     )
     db.commit()
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 0 and item["posY"] == 2)
-    destination = next(item for item in board if item["posX"] == 2 and item["posY"] == 1)
-    assert origin["color"] == "R"
-    assert destination["color"] == "B"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 2) == "R"
+    assert board.get(2, 1) == "B"
 
     response = client.post(
         "/games/1/movement",
@@ -1236,12 +1191,9 @@ def test_play_correct_mov5_card_down(client, test_db):
     )
     assert response.status_code == 201
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 0 and item["posY"] == 2)
-    destination = next(item for item in board if item["posX"] == 2 and item["posY"] == 1)
-    assert origin["color"] == "B"
-    assert destination["color"] == "R"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 2) == "B"
+    assert board.get(2, 1) == "R"
 
 
 def test_play_correct_mov5_card_up(client, test_db):
@@ -1272,12 +1224,9 @@ def test_play_correct_mov5_card_up(client, test_db):
     )
     db.commit()
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 2 and item["posY"] == 1)
-    destination = next(item for item in board if item["posX"] == 0 and item["posY"] == 2)
-    assert origin["color"] == "R"
-    assert destination["color"] == "B"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(2, 1) == "R"
+    assert board.get(0, 2) == "B"
 
     response = client.post(
         "/games/1/movement",
@@ -1285,12 +1234,9 @@ def test_play_correct_mov5_card_up(client, test_db):
     )
     assert response.status_code == 201
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 2 and item["posY"] == 1)
-    destination = next(item for item in board if item["posX"] == 0 and item["posY"] == 2)
-    assert origin["color"] == "B"
-    assert destination["color"] == "R"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(2, 1) == "B"
+    assert board.get(0, 2) == "R"
 
 
 def test_play_correct_mov6_card_up(client, test_db):
@@ -1321,12 +1267,9 @@ def test_play_correct_mov6_card_up(client, test_db):
     )
     db.commit()
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 2 and item["posY"] == 1)
-    destination = next(item for item in board if item["posX"] == 0 and item["posY"] == 0)
-    assert origin["color"] == "R"
-    assert destination["color"] == "B"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(2, 1) == "R"
+    assert board.get(0, 0) == "B"
 
     response = client.post(
         "/games/1/movement",
@@ -1334,12 +1277,9 @@ def test_play_correct_mov6_card_up(client, test_db):
     )
     assert response.status_code == 201
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 2 and item["posY"] == 1)
-    destination = next(item for item in board if item["posX"] == 0 and item["posY"] == 0)
-    assert origin["color"] == "B"
-    assert destination["color"] == "R"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(2, 1) == "B"
+    assert board.get(0, 0) == "R"
 
 
 def test_play_correct_mov6_card_down(client, test_db):
@@ -1370,12 +1310,9 @@ def test_play_correct_mov6_card_down(client, test_db):
     )
     db.commit()
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 0 and item["posY"] == 0)
-    destination = next(item for item in board if item["posX"] == 2 and item["posY"] == 1)
-    assert origin["color"] == "R"
-    assert destination["color"] == "B"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 0) == "R"
+    assert board.get(2, 1) == "B"
 
     response = client.post(
         "/games/1/movement",
@@ -1383,12 +1320,9 @@ def test_play_correct_mov6_card_down(client, test_db):
     )
     assert response.status_code == 201
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 0 and item["posY"] == 0)
-    destination = next(item for item in board if item["posX"] == 2 and item["posY"] == 1)
-    assert origin["color"] == "B"
-    assert destination["color"] == "R"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 0) == "B"
+    assert board.get(2, 1) == "R"
 
 
 def test_play_correct_mov7_card(client, test_db):
@@ -1419,12 +1353,9 @@ def test_play_correct_mov7_card(client, test_db):
     )
     db.commit()
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 3 and item["posY"] == 1)
-    destination = next(item for item in board if item["posX"] == 0 and item["posY"] == 1)
-    assert origin["color"] == "R"
-    assert destination["color"] == "B"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(3, 1) == "R"
+    assert board.get(0, 1) == "B"
 
     response = client.post(
         "/games/1/movement",
@@ -1432,12 +1363,9 @@ def test_play_correct_mov7_card(client, test_db):
     )
     assert response.status_code == 201
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posX"] == 3 and item["posY"] == 1)
-    destination = next(item for item in board if item["posX"] == 0 and item["posY"] == 1)
-    assert origin["color"] == "B"
-    assert destination["color"] == "R"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(3, 1) == "B"
+    assert board.get(0, 1) == "R"
 
 
 def test_player_did_not_has_movement_card(client, test_db):
@@ -1505,12 +1433,9 @@ def test_play_horizontal_mov06(client, test_db):
     )
     db.commit()
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posY"] == 1 and item["posX"] == 0)
-    destination = next(item for item in board if item["posY"] == 2 and item["posX"] == 2)
-    assert origin["color"] == "R"
-    assert destination["color"] == "B"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 1) == "R"
+    assert board.get(2, 2) == "B"
 
     response = client.post(
         "/games/1/movement",
@@ -1518,12 +1443,9 @@ def test_play_horizontal_mov06(client, test_db):
     )
     assert response.status_code == 201
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posY"] == 1 and item["posX"] == 0)
-    destination = next(item for item in board if item["posY"] == 2 and item["posX"] == 2)
-    assert origin["color"] == "B"
-    assert destination["color"] == "R"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 1) == "B"
+    assert board.get(2, 2) == "R"
 
 
 def test_play_horizontal_mov05(client, test_db):
@@ -1554,12 +1476,9 @@ def test_play_horizontal_mov05(client, test_db):
     )
     db.commit()
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posY"] == 1 and item["posX"] == 0)
-    destination = next(item for item in board if item["posY"] == 0 and item["posX"] == 2)
-    assert origin["color"] == "R"
-    assert destination["color"] == "B"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 1) == "R"
+    assert board.get(2, 0) == "B"
 
     response = client.post(
         "/games/1/movement",
@@ -1567,12 +1486,9 @@ def test_play_horizontal_mov05(client, test_db):
     )
     assert response.status_code == 201
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posY"] == 1 and item["posX"] == 0)
-    destination = next(item for item in board if item["posY"] == 0 and item["posX"] == 2)
-    assert origin["color"] == "B"
-    assert destination["color"] == "R"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 1) == "B"
+    assert board.get(2, 0) == "R"
 
 
 def test_cancel_movement(client, test_db):
@@ -1603,12 +1519,9 @@ def test_cancel_movement(client, test_db):
     )
     db.commit()
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posY"] == 1 and item["posX"] == 0)
-    destination = next(item for item in board if item["posY"] == 0 and item["posX"] == 2)
-    assert origin["color"] == "R"
-    assert destination["color"] == "B"
+    board = Board.decode(db.get(GameDB, 1).board)
+    assert board.get(0, 1) == "R"
+    assert board.get(2, 0) == "B"
 
     response = client.post(
         "/games/1/movement",
@@ -1621,6 +1534,6 @@ def test_cancel_movement(client, test_db):
     response = client.delete("/games/1/movement?playerID=1&gameID=1")
     assert response.status_code == 200
 
-    board = db.get(GameDB, 1).board
-    board = json.loads(board)
-    origin = next(item for item in board if item["posY"] == 1 and item["posX"] == 0)
+    board = Board.decode(db.get(GameDB, 1).board)
+    origin = board.get(0, 1)
+    assert origin == "R"
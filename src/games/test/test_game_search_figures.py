@@ -1,12 +1,26 @@
+import asyncio
 import json
+import random
+import sys
 from typing import List
 
 import numpy as np
 import pytest
 
 from src.conftest import override_get_db
+from src.games.config import FIGURE_CARDS_FORM
+from src.games.domain.figures import (
+    FIGURE_PLACEMENTS,
+    FigureCache,
+    IncrementalFigureDetector,
+    cell_bit,
+    color_masks_from_cells,
+    find_figures,
+    has_same_color_neighbor,
+)
 from src.games.domain.models import BoardPiece, BoardPiecePosition
-from src.games.infrastructure.repository import SQLAlchemyRepository
+from src.games.infrastructure.repository import SQLAlchemyRepository, figure_cache, figure_detector
+from src.shared.executor import run_blocking
 
 
 @pytest.fixture
@@ -402,3 +416,154 @@ def test_get_one_figure_prohibited_color(game_logic: SQLAlchemyRepository):
             BoardPiecePosition(posX=5, posY=4),
         ],
     ]
+
+
+def test_figure_placements_borders():
+    placement = next(p for p in FIGURE_PLACEMENTS if p.figure_type == "fige02" and p.cells[0] == (0, 0))
+
+    assert placement.cells == ((0, 0), (1, 0), (0, 1), (1, 1))
+    assert placement.mask == cell_bit(0, 0) | cell_bit(1, 0) | cell_bit(0, 1) | cell_bit(1, 1)
+    assert placement.border == cell_bit(2, 0) | cell_bit(2, 1) | cell_bit(0, 2) | cell_bit(1, 2)
+    assert placement.mask & placement.border == 0
+
+
+def test_figure_placements_are_unique():
+    cells = [placement.cells for placement in FIGURE_PLACEMENTS]
+
+    assert len(cells) == len(set(cells))
+    assert {placement.figure_type for placement in FIGURE_PLACEMENTS} == set(FIGURE_CARDS_FORM)
+
+
+def test_find_figures_ignores_prohibited_color():
+    cells = [(x, y, "B" if (x, y) in [(0, 0), (1, 0), (0, 1), (1, 1)] else "G") for x in range(6) for y in range(6)]
+    color_masks = color_masks_from_cells(cells)
+
+    assert [p.cells for p in find_figures(color_masks)] == [((0, 0), (1, 0), (0, 1), (1, 1))]
+    assert find_figures(color_masks, "B") == []
+
+
+def test_same_color_neighbor_matches_piece_by_piece_check():
+    rng = random.Random(11)
+    for _ in range(200):
+        colors = [rng.choice("RG") for _ in range(36)]
+        color_masks = color_masks_from_cells((i // 6, i % 6, colors[i]) for i in range(36))
+        figure = {(i // 6, i % 6) for i in rng.sample(range(36), rng.randint(1, 6))}
+
+        expected = any(
+            (x + dx, y + dy) not in figure and colors[(x + dx) * 6 + y + dy] == colors[x * 6 + y]
+            for x, y in figure
+            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+            if 0 <= x + dx < 6 and 0 <= y + dy < 6
+        )
+        assert has_same_color_neighbor(color_masks, figure) == expected
+
+
+def test_placement_has_no_same_color_neighbor():
+    cells = [(x, y, "B" if (x, y) in [(0, 0), (1, 0), (0, 1), (1, 1)] else "G") for x in range(6) for y in range(6)]
+    color_masks = color_masks_from_cells(cells)
+
+    assert not has_same_color_neighbor(color_masks, [(0, 0), (1, 0), (0, 1), (1, 1)])
+    assert has_same_color_neighbor(color_masks, [(0, 0), (1, 0), (0, 1)])
+
+
+def test_incremental_detector_matches_full_search_after_swaps():
+    detector = IncrementalFigureDetector()
+    colors = ["R", "G", "B", "Y"] * 9
+    random.Random(7).shuffle(colors)
+    swaps = [(0, 1), (7, 14), (35, 29), (12, 13), (20, 26), (0, 35), (3, 9)]
+
+    for origin, destination in swaps:
+        colors[origin], colors[destination] = colors[destination], colors[origin]
+        color_masks = color_masks_from_cells((i // 6, i % 6, colors[i]) for i in range(36))
+
+        for prohibited_color in [None, "R", "G"]:
+            assert detector.detect(1, color_masks, prohibited_color) == find_figures(color_masks, prohibited_color)
+
+
+def test_incremental_detector_forget():
+    detector = IncrementalFigureDetector()
+    color_masks = color_masks_from_cells((i // 6, i % 6, "G") for i in range(36))
+
+    assert detector.detect(1, color_masks) == []
+    assert 1 in detector.games
+
+    detector.forget(1)
+    assert 1 not in detector.games
+
+
+def test_figure_cache_hits_and_misses():
+    cache = FigureCache(max_size=2)
+    color_masks = color_masks_from_cells((i // 6, i % 6, "R" if i < 4 else "G") for i in range(36))
+    figures = find_figures(color_masks)
+
+    assert cache.get(color_masks, None) is None
+    cache.put(color_masks, None, figures)
+
+    assert cache.get(color_masks, None) == tuple(figures)
+    assert cache.get(color_masks, "R") is None
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
+def test_figure_cache_lru_eviction():
+    cache = FigureCache(max_size=2)
+    boards = [color_masks_from_cells((i // 6, i % 6, "R" if i == n else "G") for i in range(36)) for n in range(3)]
+
+    cache.put(boards[0], None, [])
+    cache.put(boards[1], None, [])
+    assert cache.get(boards[0], None) == ()
+
+    cache.put(boards[2], None, [])
+
+    assert len(cache.entries) == 2
+    assert cache.get(boards[1], None) is None
+    assert cache.get(boards[0], None) == ()
+    assert cache.get(boards[2], None) == ()
+
+
+def test_get_available_figures_uses_cache(game_logic: SQLAlchemyRepository):
+    figure_cache.clean_up()
+    board_pieces = [BoardPiece(posX=i, posY=j, color="G", isPartial=False) for i in range(6) for j in range(6)]
+
+    game_logic.get_available_figures("R", board_pieces)
+    game_logic.get_available_figures("R", board_pieces)
+
+    assert figure_cache.misses == 1
+    assert figure_cache.hits == 1
+
+
+def test_get_available_figures_concurrent_calls(game_logic: SQLAlchemyRepository):
+    # Cambios de hilo frecuentes para que las llamadas concurrentes se intercalen
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    figure_cache.clean_up()
+    figure_detector.clean_up()
+
+    def play(seed: int) -> List[bool]:
+        rng = random.Random(seed)
+        colors = ["R", "G", "B", "Y"] * 9
+        rng.shuffle(colors)
+        results = []
+        for _ in range(100):
+            origin, destination = rng.randrange(36), rng.randrange(36)
+            colors[origin], colors[destination] = colors[destination], colors[origin]
+            board = [BoardPiece(posX=i // 6, posY=i % 6, color=colors[i], isPartial=False) for i in range(36)]
+            # Varias tareas comparten la misma partida para que compitan por su estado guardado
+            figures = game_logic.get_available_figures("R", board, gameID=seed % 3)
+            expected = find_figures(color_masks_from_cells((i // 6, i % 6, colors[i]) for i in range(36)), "R")
+            results.append(
+                [[(pos.posX, pos.posY) for pos in figure] for figure in figures]
+                == [list(placement.cells) for placement in expected]
+            )
+        return results
+
+    async def main():
+        return await asyncio.gather(*(run_blocking(play, seed) for seed in range(12)))
+
+    try:
+        results = asyncio.run(main())
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert all(all(game) for game in results)
+    assert figure_cache.hits + figure_cache.misses == 12 * 100
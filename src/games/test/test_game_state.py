@@ -0,0 +1,252 @@
+import json
+import random
+
+import pytest
+from sqlalchemy import create_engine, func, select, text, update
+from sqlalchemy.orm.exc import StaleDataError
+
+from src.conftest import count_queries, override_get_db
+from src.games.domain.board import Board
+from src.games.infrastructure.migrations import (
+    add_game_version_column,
+    migrate_legacy_boards,
+    migrate_legacy_last_movements,
+)
+from src.games.infrastructure.models import Game as GameDB
+from src.games.infrastructure.repository import SQLAlchemyRepository
+from src.games.infrastructure.state import GameStateStore, game_state_engine
+from src.players.infrastructure.models import Player as PlayerDB
+from src.rooms.infrastructure.models import Room as RoomDB
+
+
+@pytest.fixture
+def create_game(test_db):
+    test_db.add_all(
+        [
+            PlayerDB(playerID=1, username="test user"),
+            RoomDB(roomID=1, roomName="test room", minPlayers=2, maxPlayers=4, hostID=1),
+            GameDB(
+                roomID=1,
+                board=json.dumps(
+                    [{"posX": x, "posY": y, "color": "R" if x == 0 else "G"} for x in range(6) for y in range(6)]
+                ),
+                lastMovements=json.dumps([]),
+            ),
+        ]
+    )
+    test_db.commit()
+
+
+def test_game_state_is_decoded_once(create_game):
+    db = next(override_get_db())
+    store = GameStateStore.for_session(db)
+
+    state = store.get(1)
+
+    assert state.board == Board("R" * 6 + "G" * 30)
+    assert state.last_movements == []
+    assert store.get(1) is state
+    assert GameStateStore.for_session(db) is store
+
+
+def test_game_state_is_written_on_commit(create_game):
+    db = next(override_get_db())
+    store = GameStateStore.for_session(db)
+
+    state = store.get_for_update(1)
+    state.board.swap(0, 0, 1, 0)
+    store.mark_dirty(state)
+    db.commit()
+
+    game = next(override_get_db()).get(GameDB, 1)
+    assert game.board == "G" + "R" * 6 + "G" * 29
+    assert game.version == 1
+    assert game_state_engine.states[1].version == 1
+
+
+def test_unchanged_game_state_is_not_decoded_again(create_game):
+    GameStateStore.for_session(next(override_get_db())).get(1)
+
+    other_db = next(override_get_db())
+    with count_queries() as statements:
+        state = GameStateStore.for_session(other_db).get(1)
+
+    assert len(statements) == 1
+    assert game_state_engine.loads == 1
+    assert state.board == Board("R" * 6 + "G" * 30)
+
+
+def test_game_state_is_discarded_on_rollback(create_game):
+    db = next(override_get_db())
+    store = GameStateStore.for_session(db)
+
+    state = store.get_for_update(1)
+    state.board.swap(0, 0, 1, 0)
+    store.mark_dirty(state)
+    db.rollback()
+
+    assert store.get(1) is not state
+    assert store.get(1).board.get(0, 0) == "R"
+    assert next(override_get_db()).get(GameDB, 1).version == 0
+
+
+def test_game_state_reloads_when_row_changes(create_game):
+    db = next(override_get_db())
+    state = GameStateStore.for_session(db).get(1)
+
+    # Otro proceso escribe la partida y aumenta su versión
+    other_db = next(override_get_db())
+    other_db.execute(update(GameDB).where(GameDB.gameID == 1).values(board="B" * 36, version=GameDB.version + 1))
+    other_db.commit()
+
+    reloaded = GameStateStore.for_session(next(override_get_db())).get(1)
+
+    assert reloaded is not state
+    assert reloaded.board == Board("B" * 36)
+    assert game_state_engine.loads == 2
+
+
+def test_stale_game_state_is_not_written(create_game):
+    db = next(override_get_db())
+    store = GameStateStore.for_session(db)
+    state = store.get(1)
+
+    other_db = next(override_get_db())
+    other_db.execute(update(GameDB).where(GameDB.gameID == 1).values(board="B" * 36, version=GameDB.version + 1))
+    other_db.commit()
+
+    state.board.swap(0, 0, 1, 0)
+    store.mark_dirty(state)
+    db.add(PlayerDB(playerID=2, username="same transaction"))
+    with pytest.raises(StaleDataError):
+        db.commit()
+    db.rollback()
+
+    # La escritura de la otra transacción se conserva y el resto de la acción se deshace
+    check_db = next(override_get_db())
+    assert check_db.get(GameDB, 1).board == "B" * 36
+    assert check_db.get(PlayerDB, 2) is None
+
+
+def test_game_lock_is_held_until_the_transaction_ends(create_game):
+    db = next(override_get_db())
+    store = GameStateStore.for_session(db)
+    lock = game_state_engine.game_lock(1)
+
+    store.get_for_update(1)
+    assert lock.locked()
+    db.commit()
+    assert not lock.locked()
+
+    store.get_for_update(1)
+    db.rollback()
+    assert not lock.locked()
+
+    assert store.get_for_update(2) is None
+    assert not game_state_engine.game_lock(2).locked()
+
+
+def test_game_state_is_recovered_from_the_row_after_restart(create_game):
+    db = next(override_get_db())
+    store = GameStateStore.for_session(db)
+    state = store.get_for_update(1)
+    state.board.swap(0, 0, 1, 0)
+    store.mark_dirty(state)
+    db.commit()
+
+    game_state_engine.clean_up()
+
+    recovered = GameStateStore.for_session(next(override_get_db())).get(1)
+    assert recovered.board.get(0, 0) == "G"
+    assert recovered.version == 1
+
+
+def test_board_decodes_legacy_json():
+    legacy = json.dumps([{"posX": x, "posY": y, "color": "R" if y == 0 else "G"} for x in range(6) for y in range(6)])
+    board = Board.decode(legacy)
+
+    assert board.encode() == "RGGGGG" * 6
+    assert Board.decode(json.dumps(legacy)) == board
+    assert Board.decode(board.encode()) == board
+    assert board.get(3, 0) == "R"
+    assert board.get(3, 1) == "G"
+
+
+def test_board_decodes_legacy_json_by_position():
+    pieces = [{"posX": x, "posY": y, "color": "R" if (x, y) == (2, 3) else "G"} for x in range(6) for y in range(6)]
+    random.Random(3).shuffle(pieces)
+    board = Board.decode(json.dumps(pieces))
+
+    assert board.get(2, 3) == "R"
+    assert board.encode().count("R") == 1
+
+
+def test_board_decode_without_board():
+    with pytest.raises(ValueError):
+        Board.decode(None)
+
+
+def test_board_swap():
+    board = Board("R" + "G" * 35)
+    board.swap(0, 0, 5, 5)
+
+    assert board.get(0, 0) == "G"
+    assert board.get(5, 5) == "R"
+    assert len(board.encode()) == 36
+
+
+def test_migrate_legacy_boards(create_game):
+    db = next(override_get_db())
+
+    assert migrate_legacy_boards(db) == 1
+    assert db.get(GameDB, 1).board == "R" * 6 + "G" * 30
+    assert migrate_legacy_boards(db) == 0
+
+
+def test_add_game_version_column(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.sqlite'}")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE games (gameID INTEGER PRIMARY KEY, board VARCHAR)"))
+        connection.execute(text("INSERT INTO games (gameID, board) VALUES (1, 'R')"))
+
+    assert add_game_version_column(engine)
+    assert not add_game_version_column(engine)
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT version FROM games")).scalar() == 0
+
+
+def stored_json_type(db, gameID: int) -> str:
+    """Tipo del valor guardado en la columna lastMovements, leído por la base de datos"""
+    json_type = func.jsonb_typeof if db.get_bind().dialect.name == "postgresql" else func.json_type
+    return db.scalar(select(json_type(GameDB.lastMovements)).where(GameDB.gameID == gameID))
+
+
+def test_last_movements_are_stored_as_a_json_array(create_game):
+    db = next(override_get_db())
+    repository = SQLAlchemyRepository(db)
+    repository.play_movement(1, 1, 0, 0, 0, 1)
+
+    assert stored_json_type(db, 1) == "array"
+    assert db.get(GameDB, 1).lastMovements == [
+        {
+            "CardID": 1,
+            "origin": {"posX": 0, "posY": 0, "color": "R"},
+            "destination": {"posX": 0, "posY": 1, "color": "R"},
+            "Order": 1,
+        }
+    ]
+
+    db.add(RoomDB(roomID=2, roomName="test room 2", minPlayers=2, maxPlayers=4, hostID=1))
+    db.commit()
+    gameID = repository.create(2, Board("R" * 36)).gameID
+    assert stored_json_type(db, gameID) == "array"
+
+
+def test_migrate_legacy_last_movements(create_game):
+    db = next(override_get_db())
+
+    assert stored_json_type(db, 1) != "array"
+    assert migrate_legacy_last_movements(db) == 1
+    assert stored_json_type(db, 1) == "array"
+    assert db.get(GameDB, 1).version == 1
+    assert migrate_legacy_last_movements(db) == 0
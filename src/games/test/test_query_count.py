@@ -0,0 +1,136 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.conftest import count_queries, override_get_db
+from src.games.domain.board import Board
+from src.games.domain.service import RepositoryValidators as GameRepositoryValidators
+from src.games.infrastructure import state as state_module
+from src.games.infrastructure.models import FigureCard as FigureCardDB
+from src.games.infrastructure.models import Game as GameDB
+from src.games.infrastructure.repository import SQLAlchemyRepository
+from src.games.infrastructure.state import GameState, PartialMovement
+from src.players.domain.service import RepositoryValidators as PlayerRepositoryValidators
+from src.players.infrastructure.models import Player as PlayerDB
+from src.players.infrastructure.repository import SQLAlchemyRepository as PlayerRepository
+from src.rooms.domain.service import RepositoryValidators as RoomRepositoryValidators
+from src.rooms.infrastructure.models import PlayerRoom as PlayerRoomDB
+from src.rooms.infrastructure.models import Room as RoomDB
+from src.rooms.infrastructure.repository import SQLAlchemyRepository as RoomRepository
+
+
+def create_game_with_partial_movements(test_db, gameID: int, amount: int):
+    state = GameState(
+        gameID=gameID,
+        board=Board("RGBY" * 9),
+        last_movements=[PartialMovement(index, 0, index, 5, index, index) for index in range(amount)],
+    )
+    test_db.add(
+        GameDB(gameID=gameID, roomID=gameID, board=state.encode_board(), lastMovements=state.encode_last_movements())
+    )
+    test_db.commit()
+
+
+@pytest.fixture
+def rooms(test_db):
+    test_db.add_all(
+        [
+            PlayerDB(playerID=1, username="test user"),
+            RoomDB(roomID=1, roomName="test room 1", minPlayers=2, maxPlayers=4, hostID=1),
+            RoomDB(roomID=2, roomName="test room 2", minPlayers=2, maxPlayers=4, hostID=1),
+        ]
+    )
+    test_db.commit()
+
+
+def test_get_board_query_and_decode_count_is_constant(test_db, rooms):
+    create_game_with_partial_movements(test_db, 1, 0)
+    create_game_with_partial_movements(test_db, 2, 6)
+
+    counts = []
+    for gameID in [1, 2]:
+        db = next(override_get_db())
+        repository = SQLAlchemyRepository(db)
+        with patch.object(state_module, "load_game_state", wraps=state_module.load_game_state) as load:
+            with count_queries() as statements:
+                board = repository.get_board(gameID)
+                repository.get_board(gameID)
+            counts.append((len(statements), load.call_count))
+
+    assert counts[0] == counts[1] == (1, 1)
+    assert [(piece.posX, piece.posY) for piece in board if piece.isPartial] == [
+        (posX, posY) for posX in [0, 5] for posY in range(6)
+    ]
+
+
+def test_get_players_query_count_is_constant(test_db, rooms):
+    test_db.add_all([PlayerDB(playerID=playerID, username=f"player {playerID}") for playerID in range(2, 5)])
+    for gameID, playerIDs in [(1, [1, 2]), (2, [1, 2, 3, 4])]:
+        create_game_with_partial_movements(test_db, gameID, 0)
+        for position, playerID in enumerate(playerIDs, start=1):
+            test_db.add(PlayerRoomDB(playerID=playerID, roomID=gameID, position=position))
+            test_db.add_all(
+                [
+                    FigureCardDB(type="fige01", playerID=playerID, gameID=gameID, isPlayable=index < 3)
+                    for index in range(5)
+                ]
+            )
+    test_db.commit()
+
+    counts = []
+    for gameID in [1, 2]:
+        db = next(override_get_db())
+        with count_queries() as statements:
+            players = SQLAlchemyRepository(db).get_players(gameID)
+        counts.append(len(statements))
+
+    assert counts[0] == counts[1] == 3
+    assert [player.username for player in players] == ["test user", "player 2", "player 3", "player 4"]
+    assert all(player.sizeDeckFigure == 2 and len(player.cardsFigure) == 3 for player in players)
+
+
+def test_request_cache_loads_each_view_once(test_db, rooms):
+    create_game_with_partial_movements(test_db, 1, 0)
+    test_db.add(PlayerRoomDB(playerID=1, roomID=1, position=1))
+    test_db.add(FigureCardDB(cardID=1, type="fige01", playerID=1, gameID=1, isPlayable=True))
+    test_db.commit()
+
+    db = next(override_get_db())
+    repository = SQLAlchemyRepository(db)
+
+    with count_queries() as statements:
+        for _ in range(2):
+            repository.get(1)
+            repository.is_player_in_game(1, 1)
+            repository.get_figure_card(1)
+            repository.get_board(1)
+
+    assert len(statements) == 4
+    assert repository.cache.hits > repository.cache.misses
+
+    repository.play_movement(1, 1, 0, 0, 0, 1)
+    assert repository.cache.entries == {}
+    assert repository.get_board(1)[0].isPartial
+
+
+def test_validators_issue_a_single_query(test_db, rooms):
+    create_game_with_partial_movements(test_db, 1, 0)
+    test_db.add(PlayerRoomDB(playerID=1, roomID=1, position=1))
+    test_db.commit()
+
+    db = next(override_get_db())
+    game_validators = GameRepositoryValidators(SQLAlchemyRepository(db))
+    room_validators = RoomRepositoryValidators(RoomRepository(db))
+    player_validators = PlayerRepositoryValidators(PlayerRepository(db))
+
+    for validation in [
+        game_validators.validate_game_exists(1),
+        game_validators.is_player_in_game(1, 1),
+        room_validators.validate_room_exists(1),
+        player_validators.validate_player_exists(1),
+    ]:
+        with count_queries() as statements:
+            asyncio.run(validation)
+        assert len(statements) == 1
+        assert statements[0].startswith("SELECT 1")
@@ -0,0 +1,74 @@
+import re
+
+import pytest
+from sqlalchemy import event
+
+from src.conftest import engine, override_get_db
+from src.games.domain.board import Board
+from src.games.infrastructure.repository import SQLAlchemyRepository
+from src.players.infrastructure.models import Player as PlayerDB
+from src.rooms.infrastructure.models import PlayerRoom as PlayerRoomDB
+from src.rooms.infrastructure.models import Room as RoomDB
+from src.rooms.infrastructure.repository import SQLAlchemyRepository as RoomRepository
+
+HOT_TABLES = ["figure_cards", "movement_cards", "player_room"]
+
+pytestmark = pytest.mark.skipif(engine.dialect.name != "sqlite", reason="EXPLAIN QUERY PLAN es propio de SQLite")
+
+
+@pytest.fixture
+def game(test_db):
+    test_db.add_all([PlayerDB(playerID=playerID, username=f"player {playerID}") for playerID in range(1, 5)])
+    test_db.add(RoomDB(roomID=1, roomName="test room", minPlayers=2, maxPlayers=4, hostID=1))
+    test_db.add_all([PlayerRoomDB(playerID=playerID, roomID=1, position=playerID) for playerID in range(1, 5)])
+    test_db.commit()
+
+    repository = SQLAlchemyRepository(next(override_get_db()))
+    gameID = repository.create(1, Board("RGBY" * 9)).gameID
+    repository.create_figure_cards(gameID)
+    repository.create_movement_cards(gameID)
+    return gameID
+
+
+def run_hot_queries(gameID: int) -> None:
+    db = next(override_get_db())
+    repository = SQLAlchemyRepository(db)
+    for playerID in range(1, 5):
+        repository.get_players(gameID)
+        repository.has_three_cards(gameID, playerID)
+        repository.figure_card_count(gameID, playerID)
+        repository.get_blocked_card(gameID, playerID)
+        repository.is_active_player_in_game(playerID, gameID)
+        repository.get_position_player(gameID, playerID)
+        repository.get_player_movement_cards(gameID, playerID)
+        repository.replacement_figure_card(gameID, playerID)
+        repository.replacement_movement_card(gameID, playerID)
+        RoomRepository(db).get_turn(1, playerID)
+    repository.get_movement_cards_by_player(gameID)
+    repository.rebuild_movement_deck(gameID)
+
+
+def test_hot_queries_use_indexes(game):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and any(table in statement for table in HOT_TABLES):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        run_hot_queries(game)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert statements
+    full_scans = []
+    with engine.connect() as connection:
+        for statement, parameters in statements:
+            plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            for row in plan:
+                detail = row[-1]
+                if re.match(rf"SCAN ({'|'.join(HOT_TABLES)})\b", detail) and "INDEX" not in detail:
+                    full_scans.append((statement, detail))
+
+    assert full_scans == []
@@ -0,0 +1,113 @@
+import asyncio
+import datetime
+
+from src.conftest import TestingSessionLocal
+from src.games.application.timer import TurnTimerScheduler, turn_timer
+from src.games.infrastructure.models import Game as GameDB
+from src.games.infrastructure.timers import restore_turn_timers
+from src.players.infrastructure.models import Player as PlayerDB
+from src.rooms.infrastructure.models import PlayerRoom as PlayerRoomDB
+from src.rooms.infrastructure.models import Room as RoomDB
+
+
+def in_seconds(seconds: float) -> datetime.datetime:
+    return datetime.datetime.now() + datetime.timedelta(seconds=seconds)
+
+
+def test_timer_fires_once_on_expiry():
+    scheduler = TurnTimerScheduler()
+    fired = []
+
+    async def on_expiry():
+        fired.append(1)
+
+    async def main():
+        scheduler.schedule(1, in_seconds(0.01), on_expiry)
+        await asyncio.sleep(0.05)
+
+    asyncio.run(main())
+
+    assert fired == [1]
+    assert scheduler.get_deadline(1) is None
+
+
+def test_timer_reschedule_replaces_previous_deadline():
+    scheduler = TurnTimerScheduler()
+    fired = []
+
+    def on_expiry(turn: int):
+        async def callback():
+            fired.append(turn)
+
+        return callback
+
+    async def main():
+        scheduler.schedule(1, in_seconds(0.01), on_expiry(1))
+        deadline = in_seconds(0.02)
+        scheduler.schedule(1, deadline, on_expiry(2))
+        assert scheduler.get_deadline(1) == deadline
+        await asyncio.sleep(0.05)
+
+    asyncio.run(main())
+
+    assert fired == [2]
+
+
+def test_timer_cancel():
+    scheduler = TurnTimerScheduler()
+    fired = []
+
+    async def on_expiry():
+        fired.append(1)
+
+    async def main():
+        scheduler.schedule(1, in_seconds(0.01), on_expiry)
+        scheduler.schedule(2, in_seconds(0.01), on_expiry)
+        scheduler.cancel(1)
+        await asyncio.sleep(0.05)
+
+    asyncio.run(main())
+
+    assert fired == [1]
+    assert scheduler.timers == {}
+
+
+def test_expired_deadline_fires_immediately():
+    scheduler = TurnTimerScheduler()
+    fired = []
+
+    async def on_expiry():
+        fired.append(1)
+
+    async def main():
+        scheduler.schedule(1, in_seconds(-5), on_expiry)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+
+    assert fired == [1]
+
+
+def test_restore_turn_timers(test_db, mock_mi_funcion):
+    expired = in_seconds(-10)
+    pending = in_seconds(60)
+    test_db.add_all([PlayerDB(playerID=1, username="test user"), PlayerDB(playerID=2, username="test user 2")])
+    for roomID, timestamp in enumerate([expired, pending, None], start=1):
+        test_db.add(RoomDB(roomID=roomID, roomName=f"test room {roomID}", minPlayers=2, maxPlayers=4, hostID=1))
+        test_db.add(PlayerRoomDB(playerID=1, roomID=roomID, position=1))
+        test_db.add(PlayerRoomDB(playerID=2, roomID=roomID, position=2))
+        test_db.add(GameDB(gameID=roomID, roomID=roomID, posEnabledToPlay=2, timestamp_next_turn=timestamp))
+    test_db.commit()
+
+    async def main():
+        assert restore_turn_timers(TestingSessionLocal) == 2
+        await asyncio.sleep(0.01)
+        assert turn_timer.get_deadline(1) is None
+        assert turn_timer.get_deadline(2) == pending
+        assert turn_timer.get_deadline(3) is None
+        turn_timer.clean_up()
+
+    asyncio.run(main())
+
+    mock_mi_funcion.assert_awaited_once_with(2, 1, expired)
@@ -0,0 +1,44 @@
+import asyncio
+
+from src.conftest import FakeWebSocket
+from src.games.infrastructure.websocket import ConnectionManagerGame
+from src.rooms.infrastructure.websocket import ConnectionManagerRoom
+
+PLAYERS_PER_GAME = 4
+CONNECTIONS = 1000
+DISCONNECTS = 200
+
+
+def test_disconnect_uses_the_reverse_index():
+    for manager_class in (ConnectionManagerGame, ConnectionManagerRoom):
+        manager = manager_class()
+
+        async def main():
+            websockets = []
+            for i in range(CONNECTIONS):
+                websocket = FakeWebSocket()
+                await manager.connect(i % PLAYERS_PER_GAME, i // PLAYERS_PER_GAME, websocket)
+                websockets.append(websocket)
+
+            assert all(
+                manager.owners[websocket] == (i // PLAYERS_PER_GAME, i % PLAYERS_PER_GAME)
+                for i, websocket in enumerate(websockets)
+            )
+
+            # Se desconectan los clientes de las últimas partidas completas
+            for websocket in websockets[-DISCONNECTS:]:
+                await manager.disconnect(websocket)
+
+            remaining = CONNECTIONS - DISCONNECTS
+            assert len(manager.owners) == len(manager.outbound) == remaining
+            assert sum(len(players) for players in manager.active_connections.values()) == remaining
+            # Las partidas sin conexiones dejan de estar registradas
+            assert list(manager.active_connections) == list(range(remaining // PLAYERS_PER_GAME))
+            assert not set(websockets[-DISCONNECTS:]) & set(manager.owners)
+
+            # Desconectar de nuevo una conexión ya removida no cambia nada
+            await manager.disconnect(websockets[-1])
+            assert len(manager.owners) == remaining
+            manager.clean_up()
+
+        asyncio.run(main())
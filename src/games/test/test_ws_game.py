@@ -1,10 +1,14 @@
+import asyncio
 import json
+from unittest.mock import patch
 
 import pytest
 from fastapi.websockets import WebSocketDisconnect, WebSocket
 
 from src.conftest import override_get_db
 from src.games.infrastructure.models import Game as GameDB
+from src.games.infrastructure.models import MovementCard as MovementCardDB
+from src.games.infrastructure.repository import WebSocketRepository
 from src.players.infrastructure.models import Player as PlayerDB
 from src.rooms.infrastructure.models import PlayerRoom as PlayerRoom
 from src.rooms.infrastructure.models import Room as RoomDB
@@ -251,4 +255,42 @@ def test_broadcast_message(client, test_db):
         data1 = websocket1.receive_json()
         data2 = websocket2.receive_json()
         assert data1 == broadcast_message
-        assert data2 == broadcast_message
\ No newline at end of file
+        assert data2 == broadcast_message
+
+def test_broadcast_status_game_builds_status_once(client, test_db):
+    db = next(override_get_db())
+    db.add_all(
+        [
+            PlayerDB(playerID=1, username="test user 1"),
+            PlayerDB(playerID=2, username="test user 2"),
+            RoomDB(roomID=1, roomName="test room", minPlayers=2, maxPlayers=4, hostID=1),
+            PlayerRoom(playerID=1, roomID=1, position=1),
+            PlayerRoom(playerID=2, roomID=1, position=2),
+            GameDB(roomID=1, board=json.dumps([{"posX": 0, "posY": 0, "color": "R"} for _ in range(36)])),
+            MovementCardDB(gameID=1, type="mov01", playerID=1),
+            MovementCardDB(gameID=1, type="mov02", playerID=2),
+        ]
+    )
+    db.commit()
+
+    with client.websocket_connect("/games/1/1") as websocket1, client.websocket_connect("/games/2/1") as websocket2:
+        websocket1.receive_json()
+        websocket2.receive_json()
+
+        with patch.object(
+            WebSocketRepository,
+            "get_shared_public_info",
+            autospec=True,
+            side_effect=WebSocketRepository.get_shared_public_info,
+        ) as get_shared_public_info:
+            asyncio.run(WebSocketRepository(db).broadcast_status_game(1))
+
+        data1 = websocket1.receive_json()
+        data2 = websocket2.receive_json()
+
+    assert get_shared_public_info.call_count == 1
+    assert data1["payload"]["players"][0]["cardsMovement"] == [{"type": "mov01", "cardID": 1, "isUsed": False}]
+    assert data1["payload"]["players"][1]["cardsMovement"] == [None]
+    assert data2["payload"]["players"][0]["cardsMovement"] == [None]
+    assert data2["payload"]["players"][1]["cardsMovement"] == [{"type": "mov02", "cardID": 2, "isUsed": False}]
+    assert data1["payload"]["board"] == data2["payload"]["board"]
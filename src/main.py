@@ -5,27 +5,46 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 
-from src.database import Base, engine
+from src.database import Base, SessionLocal, create_missing_indexes, engine
+from src.games.application.timer import turn_timer
 from src.games.infrastructure.api import router as games_router
+from src.games.infrastructure.migrations import (
+    add_game_version_column,
+    migrate_legacy_boards,
+    migrate_legacy_last_movements,
+)
+from src.games.infrastructure.timers import restore_turn_timers
 from src.players.infrastructure.api import router as players_router
 from src.rooms.infrastructure.api import router as rooms_router
-from src.rooms.infrastructure.websocket import ws_manager_room, ws_manager_room_list
-
-app = FastAPI(title="Switcher Card Game", description="API for Switcher Card Game")
-
+from src.rooms.infrastructure.websocket import room_list_broadcaster, ws_manager_room, ws_manager_room_list
+from src.shared.backplane import backplane
 
 Base.metadata.create_all(bind=engine)
+create_missing_indexes(engine)
+add_game_version_column(engine)
+
+with SessionLocal() as db_session:
+    migrate_legacy_boards(db_session)
+    migrate_legacy_last_movements(db_session)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     ws_manager_room_list.clean_up()
     ws_manager_room.clean_up()
+    await backplane.start()
+    restore_turn_timers(SessionLocal)
     yield
+    await backplane.stop()
+    turn_timer.clean_up()
+    room_list_broadcaster.clean_up()
     ws_manager_room_list.clean_up()
     ws_manager_room.clean_up()
 
 
+app = FastAPI(title="Switcher Card Game", description="API for Switcher Card Game", lifespan=lifespan)
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -13,6 +13,10 @@ class PlayerRepository(ABC):
     def get(self, playerID: int) -> Optional[Player]:
         pass
 
+    @abstractmethod
+    def exists(self, playerID: int) -> bool:
+        pass
+
     @abstractmethod
     def update(self, player: Player) -> None:
         pass
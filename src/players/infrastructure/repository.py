@@ -1,6 +1,7 @@
 from typing import Optional
 
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import literal_column
 
 from src.players.domain.models import Player, PlayerCreationRequest
 from src.players.domain.repository import PlayerRepository
@@ -28,6 +29,9 @@ class SQLAlchemyRepository(PlayerRepository):
 
         return Player(playerID=player.playerID, username=player.username)
 
+    def exists(self, playerID: int) -> bool:
+        return self.db_session.query(literal_column("1")).filter(PlayerDB.playerID == playerID).first() is not None
+
     def update(self, player: Player) -> None:
         self.db_session.query(PlayerDB).filter(PlayerDB.playerID == player.playerID).update(
             {"username": player.username}
@@ -7,6 +7,7 @@ from src.players.domain.service import RepositoryValidators as PlayerRepositoryV
 from src.rooms.domain.models import RoomCreationRequest, RoomID
 from src.rooms.domain.repository import RoomRepositoryWS
 from src.rooms.domain.service import RepositoryValidators as RoomRepositoryValidators
+from src.shared.executor import run_blocking
 
 
 class RoomService:
@@ -24,8 +25,10 @@ class RoomService:
     async def create_room(self, room_data: RoomCreationRequest) -> RoomID:
         await self.player_domain_service.validate_player_exists(room_data.playerID)
 
-        saved_room = self.room_repository.create(room_data)
-        self.room_repository.add_player_to_room(playerID=room_data.playerID, roomID=saved_room.roomID)
+        saved_room = await run_blocking(self.room_repository.create, room_data)
+        await run_blocking(
+            self.room_repository.add_player_to_room, playerID=room_data.playerID, roomID=saved_room.roomID
+        )
         await self.room_repository.broadcast_status_room_list()
 
         return saved_room
@@ -38,12 +41,12 @@ class RoomService:
 
         isHost = self.room_repository.is_owner(playerID, roomID)
 
-        self.room_repository.remove_player_from_room(playerID=playerID, roomID=roomID)
+        await run_blocking(self.room_repository.remove_player_from_room, playerID=playerID, roomID=roomID)
         await self.room_repository.disconnect_player(roomID, playerID)
 
         if isHost:
             await self.room_repository.broadcast_room_cancellation(roomID)
-            self.room_repository.delete_and_clean(roomID)
+            await run_blocking(self.room_repository.delete_and_clean, roomID)
         else:
             await self.room_repository.broadcast_status_room(roomID)
 
@@ -57,7 +60,7 @@ class RoomService:
 
         self.room_domain_service.validate_room_password(roomID, password=password)
 
-        self.room_repository.add_player_to_room(playerID=playerID, roomID=roomID)
+        await run_blocking(self.room_repository.add_player_to_room, playerID=playerID, roomID=roomID)
 
         await self.room_repository.broadcast_status_room_list()
         await self.room_repository.broadcast_status_room(roomID)
@@ -0,0 +1,5 @@
+import os
+
+# Intervalo mínimo (en segundos) entre dos envíos de la lista de salas. Los cambios que ocurren
+# dentro del intervalo se agrupan en un único envío al finalizar el intervalo.
+ROOM_LIST_BROADCAST_INTERVAL = float(os.environ.get("ROOM_LIST_BROADCAST_INTERVAL", 0.1))
@@ -20,6 +20,10 @@ class RoomRepository(ABC):
     def get(self, roomID: int) -> Optional[RoomPublicInfo]:
         pass
 
+    @abstractmethod
+    def exists(self, roomID: int) -> bool:
+        pass
+
     @abstractmethod
     def get_public_info(self, roomID: int) -> Optional[RoomPublicInfo]:
         pass
@@ -18,7 +18,7 @@ class RepositoryValidators:
         self.player_repository = player_repository
 
     async def validate_room_exists(self, roomID: int, websocket: Optional[WebSocket] = None):
-        if self.room_repository.get(roomID) is not None:
+        if self.room_repository.exists(roomID):
             return
         if websocket is None:
             raise HTTPException(status_code=404, detail="La sala no existe.")
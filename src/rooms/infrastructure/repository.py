@@ -1,11 +1,15 @@
 import json
-from typing import List, Optional
+from functools import partial
+from typing import Any, Dict, List, Optional
 
 import bcrypt
 from fastapi.websockets import WebSocket
+from sqlalchemy import ColumnElement, Engine, String, case, cast, func
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import literal_column
 
 from src.games.domain.models import GameID
+from src.games.infrastructure.models import Game
 from src.players.domain.models import Player
 from src.rooms.domain.models import Room as RoomDomain
 from src.rooms.domain.models import (
@@ -18,6 +22,7 @@ from src.rooms.domain.repository import RoomRepository, RoomRepositoryWS
 from src.rooms.infrastructure.models import PlayerRoom, Room
 from src.rooms.infrastructure.websocket import (
     MessageType,
+    room_list_broadcaster,
     ws_manager_room,
     ws_manager_room_list,
 )
@@ -62,6 +67,9 @@ class SQLAlchemyRepository(RoomRepository):
             players=players_list,
         )
 
+    def exists(self, roomID: int) -> bool:
+        return self.db_session.query(literal_column("1")).filter(Room.roomID == roomID).first() is not None
+
     def get_public_info(self, roomID) -> Optional[RoomPublicInfo]:
         room = self.get(roomID)
 
@@ -78,38 +86,47 @@ class SQLAlchemyRepository(RoomRepository):
         )
 
     def get_all_rooms(self) -> List[RoomExtendedInfo]:
-        all_rooms = self.db_session.query(Room).order_by(Room.roomID).all()
-        room_list = [
+        """Arma la lista de salas con una única consulta agrupada por sala,
+        que cuenta y junta los IDs de los jugadores activos y verifica si la sala tiene partida
+        """
+        active_playerID = case((PlayerRoom.isActive.is_(True), PlayerRoom.playerID))
+        rooms = (
+            self.db_session.query(
+                Room.roomID,
+                Room.roomName,
+                Room.minPlayers,
+                Room.maxPlayers,
+                Room.password,
+                func.count(active_playerID).label("actualPlayers"),
+                self.aggregate_ids(active_playerID).label("playersID"),
+                func.max(Game.gameID).label("gameID"),
+            )
+            .outerjoin(PlayerRoom, PlayerRoom.roomID == Room.roomID)
+            .outerjoin(Game, Game.roomID == Room.roomID)
+            .group_by(Room.roomID)
+            .order_by(Room.roomID)
+            .all()
+        )
+
+        return [
             RoomExtendedInfo(
                 roomID=room.roomID,
                 roomName=room.roomName,
                 minPlayers=room.minPlayers,
                 maxPlayers=room.maxPlayers,
-                actualPlayers=len(
-                    [
-                        player
-                        for player in room.players
-                        if self.db_session.query(PlayerRoom)
-                        .filter_by(playerID=player.playerID, roomID=room.roomID)
-                        .one()
-                        .isActive
-                    ]
-                ),
-                started=room.game is not None,
+                actualPlayers=room.actualPlayers,
+                started=room.gameID is not None,
                 private=room.password is not None,
-                playersID=[
-                    player.playerID
-                    for player in room.players
-                    if self.db_session.query(PlayerRoom)
-                    .filter_by(playerID=player.playerID, roomID=room.roomID)
-                    .one()
-                    .isActive
-                ],
+                playersID=sorted(int(playerID) for playerID in room.playersID.split(",")) if room.playersID else [],
             )
-            for room in all_rooms
+            for room in rooms
         ]
 
-        return room_list
+    def aggregate_ids(self, column: ColumnElement) -> ColumnElement:
+        """Junta los valores no nulos de la columna en un texto separado por comas"""
+        if self.db_session.get_bind().dialect.name == "postgresql":
+            return func.string_agg(cast(column, String), ",")
+        return func.group_concat(column, ",")
 
     def get_player_count(self, roomID: int) -> int:
         room = self.get(roomID)
@@ -154,16 +171,21 @@ class SQLAlchemyRepository(RoomRepository):
         self.db_session.commit()
 
     def is_owner(self, playerID: int, roomID: int) -> bool:
-        room = self.db_session.query(Room).filter_by(hostID=playerID, roomID=roomID).one_or_none()
-        return room is not None
+        return (
+            self.db_session.query(literal_column("1")).filter(Room.roomID == roomID, Room.hostID == playerID).first()
+            is not None
+        )
 
     def is_player_in_room(self, playerID: int, roomID: int) -> bool:
-        player_in_room = self.db_session.query(PlayerRoom).filter_by(playerID=playerID, roomID=roomID).one_or_none()
-        return player_in_room is not None
+        return (
+            self.db_session.query(literal_column("1"))
+            .filter(PlayerRoom.playerID == playerID, PlayerRoom.roomID == roomID)
+            .first()
+            is not None
+        )
 
     def is_game_started(self, roomID: int) -> bool:
-        room = self.db_session.query(Room).filter_by(roomID=roomID).one_or_none()
-        return room.game is not None
+        return self.db_session.query(literal_column("1")).filter(Game.roomID == roomID).first() is not None
 
     def set_position(self, playerID: int, position: int, roomID: int) -> None:
         self.db_session.query(PlayerRoom).filter(PlayerRoom.playerID == playerID, PlayerRoom.roomID == roomID).update(
@@ -193,19 +215,31 @@ class SQLAlchemyRepository(RoomRepository):
         )
 
 
+def load_room_list(bind: Engine) -> List[Dict[str, Any]]:
+    """Lee la lista de salas con una sesión propia, ya que los envíos agrupados
+    pueden ocurrir después de que termine la request que los originó
+    """
+    with Session(bind=bind) as db_session:
+        return [room.model_dump() for room in SQLAlchemyRepository(db_session).get_all_rooms()]
+
+
 class WebSocketRepository(RoomRepositoryWS, SQLAlchemyRepository):
     async def setup_connection_room_list(self, websocket: WebSocket) -> None:
         """Establece la conexión con el websocket lista de salas
-        y le envia el estado actual de la lista de salas
+        y le envia el estado actual de la lista de salas con su número de secuencia.
+        Si la lista cambió desde el último envío, los demás clientes de este proceso reciben primero
+        esos cambios. La lista no se publica en el backplane, para que cada conexión nueva no genere un envío
+        a todos los workers.
 
         Args:
             playerID (int): ID del jugador
             websocket (WebSocket): Conexión con el cliente
         """
-        await ws_manager_room_list.connect(websocket)
         room_list = self.get_all_rooms()
         room_list_json = [room.model_dump() for room in room_list]
-        await ws_manager_room_list.send_personal_message(MessageType.STATUS, room_list_json, websocket)
+        await ws_manager_room_list.refresh(room_list_json)
+        await ws_manager_room_list.connect(websocket)
+        await ws_manager_room_list.send_snapshot(websocket)
         await ws_manager_room_list.keep_listening(websocket)
 
     async def setup_connection_room(self, playerID: int, roomID: int, websocket: WebSocket) -> None:
@@ -226,10 +260,10 @@ class WebSocketRepository(RoomRepositoryWS, SQLAlchemyRepository):
         await ws_manager_room.keep_listening(websocket)
 
     async def broadcast_status_room_list(self) -> None:
-        """Envía la lista de salas (actualizada) a todos los clientes conectados a la lista de salas"""
-        room_list = self.get_all_rooms()
-        room_list_json = [room.model_dump() for room in room_list]
-        await ws_manager_room_list.broadcast(MessageType.STATUS, room_list_json)
+        """Envía los cambios de la lista de salas a todos los clientes conectados a la lista de salas.
+        Los cambios cercanos en el tiempo se agrupan en un único envío (ver `RoomListBroadcaster`)
+        """
+        await room_list_broadcaster.request(partial(load_room_list, self.db_session.get_bind()))
 
     async def broadcast_status_room(self, roomID: int) -> None:
         """Envía el estado de la sala (actualizado) a todos los clientes conectados a la sala
@@ -1,24 +1,99 @@
+import asyncio
+import time
 from enum import Enum
-from typing import Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from fastapi.websockets import WebSocket, WebSocketDisconnect, WebSocketState
+from fastapi.websockets import WebSocket, WebSocketDisconnect
+
+from src.rooms.config import ROOM_LIST_BROADCAST_INTERVAL
+from src.shared.backplane import Backplane, InProcessBackplane, backplane
+from src.shared.executor import run_blocking
+from src.shared.websocket import Frame, OutboundConnections
 
 
 class MessageType(str, Enum):
     STATUS = "status"
+    DELTA = "delta"
     START_GAME = "start"
     END_ROOM = "end"
 
 
-class ConnectionManagerRoomList:
-    active_connections: List[WebSocket]
+RESYNC_REQUEST = "resync"
+
+
+class RoomListFeed:
+    """Versión de la lista de salas que conocen los clientes conectados a la lista de salas.
+
+    Cada cambio de la lista incrementa `seq` y se describe con las salas agregadas, las modificadas
+    y los IDs de las eliminadas. Un cliente que recibió la lista completa con número de secuencia `n`
+    queda al día aplicando, en orden, los cambios `n + 1`, `n + 2`, ...
+    """
+
+    rooms: Dict[int, Dict[str, Any]]
+    seq: int
+    encoded_snapshot: Optional[Frame]
 
     def __init__(self):
-        self.active_connections = []
+        self.rooms = {}
+        self.seq = 0
+        self.encoded_snapshot: Optional[Frame] = None
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Lista completa de salas en la versión actual"""
+        return list(self.rooms.values())
+
+    def snapshot_frame(self) -> Frame:
+        """Mensaje con la lista completa de salas, serializado una única vez por versión"""
+        if self.encoded_snapshot is None:
+            message = {"type": MessageType.STATUS, "seq": self.seq, "payload": self.snapshot()}
+            self.encoded_snapshot = Frame.encode(message)
+        return self.encoded_snapshot
+
+    def apply(self, room_list: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Reemplaza la lista de salas y calcula la diferencia con la versión anterior
+
+        Args:
+            room_list (List[Dict[str, Any]]): Lista completa y actualizada de salas
+
+        Returns:
+            Optional[Dict[str, Any]]: Salas agregadas (`added`), modificadas (`updated`) y eliminadas (`removed`),
+            o None si la lista no cambió
+        """
+        rooms = {room["roomID"]: room for room in room_list}
+        added = [room for roomID, room in rooms.items() if roomID not in self.rooms]
+        updated = [room for roomID, room in rooms.items() if roomID in self.rooms and self.rooms[roomID] != room]
+        removed = [roomID for roomID in self.rooms if roomID not in rooms]
+        self.rooms = rooms
+        if not (added or updated or removed):
+            return None
+        self.seq += 1
+        self.encoded_snapshot = None
+        return {"added": added, "updated": updated, "removed": removed}
+
+
+class ConnectionManagerRoomList(OutboundConnections):
+    """Conexiones a la lista de salas.
+
+    Las actualizaciones de la lista se publican en el canal `room_list` del backplane; cada proceso
+    calcula los cambios respecto de la versión que enviaron sus propios clientes (ver `receive`).
+    """
+
+    # Diccionario usado como conjunto ordenado: alta y baja en O(1), recorrido en orden de conexión
+    active_connections: Dict[WebSocket, None]
+    feed: RoomListFeed
+
+    def __init__(self, backplane: Optional[Backplane] = None):
+        super().__init__()
+        self.active_connections = {}
+        self.feed = RoomListFeed()
+        self.backplane = backplane or InProcessBackplane()
+        self.backplane.subscribe("room_list", self.receive)
 
     def clean_up(self):
-        """Limpia la lista de conexiones activas"""
-        self.active_connections = []
+        """Limpia la lista de conexiones activas y la versión de la lista de salas"""
+        self.active_connections.clear()
+        self.feed = RoomListFeed()
+        self.clean_up_outbound()
 
     async def connect(self, websocket: WebSocket):
         """Acepta la conexión con el cliente y la almacena.
@@ -27,17 +102,21 @@ class ConnectionManagerRoomList:
             websocket (WebSocket): Conexión con el cliente
         """
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections[websocket] = None
+        self.open_outbound(websocket)
 
     async def keep_listening(self, websocket: WebSocket):
-        """Mantiene la conexión abierta con el cliente por tiempo indefinido
+        """Mantiene la conexión abierta con el cliente por tiempo indefinido.
+        Si el cliente envía `resync` (por ejemplo, al detectar un salto en la secuencia),
+        se le vuelve a enviar la lista completa de salas.
 
         Args:
             websocket (WebSocket): Conexión con el cliente
         """
         try:
             while True:
-                await websocket.receive_text()
+                if await websocket.receive_text() == RESYNC_REQUEST:
+                    await self.send_snapshot(websocket)
 
         except WebSocketDisconnect:
             await self.disconnect(websocket)
@@ -48,10 +127,8 @@ class ConnectionManagerRoomList:
         Args:
             websocket (WebSocket): Conexión con el cliente
         """
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        if websocket.client_state != WebSocketState.DISCONNECTED:
-            await websocket.close()
+        self.active_connections.pop(websocket, None)
+        await self.close_connection(websocket)
 
     async def send_personal_message(self, type: MessageType, payload, websocket: WebSocket):
         """Envía un mensaje personalizado al cliente
@@ -62,7 +139,7 @@ class ConnectionManagerRoomList:
             websocket (WebSocket): Conexión con el cliente
         """
         message = {"type": type, "payload": payload}
-        await websocket.send_json(message)
+        self.send(websocket, message)
 
     async def broadcast(self, type: MessageType, payload):
         """Envía un mensaje a todos los clientes conectados
@@ -71,20 +148,150 @@ class ConnectionManagerRoomList:
             type (str): Tipo de mensaje
             payload (str): Cuerpo del mensaje
         """
-        message = {"type": type, "payload": payload}
+        frame = Frame.encode({"type": type, "payload": payload})
+        await self.backplane.publish("room_list", {"frame": frame})
+
+    async def send_snapshot(self, websocket: WebSocket):
+        """Envía al cliente la lista completa de salas junto a su número de secuencia
+
+        Args:
+            websocket (WebSocket): Conexión con el cliente
+        """
+        self.send(websocket, self.feed.snapshot_frame())
+
+    async def publish(self, room_list: List[Dict[str, Any]]):
+        """Publica la lista de salas actualizada; cada proceso envía a sus clientes solo los cambios
+        respecto de la versión anterior. Si la lista no cambió no se envía nada.
+
+        Args:
+            room_list (List[Dict[str, Any]]): Lista completa y actualizada de salas
+        """
+        await self.backplane.publish("room_list", {"rooms": room_list})
+
+    async def refresh(self, room_list: List[Dict[str, Any]]):
+        """Actualiza la lista de salas solo en este proceso, sin publicarla en el backplane.
+        Los clientes de este proceso reciben los cambios respecto de la versión anterior.
+
+        Args:
+            room_list (List[Dict[str, Any]]): Lista completa y actualizada de salas
+        """
+        await self.receive({"rooms": room_list})
+
+    async def receive(self, message: Dict[str, Any]):
+        """Aplica sobre las conexiones de este proceso un envío publicado en el backplane
+
+        Args:
+            message (Dict[str, Any]): Lista de salas actualizada (`rooms`) o mensaje serializado (`frame`)
+        """
+        if "rooms" in message:
+            delta = self.feed.apply(message["rooms"])
+            if delta is None:
+                return
+            frame = Frame.encode({"type": MessageType.DELTA, "seq": self.feed.seq, "payload": delta})
+        else:
+            frame = Frame(*message["frame"])
+        # Encolar no cede el event loop, así que ninguna conexión se agrega ni se quita durante el recorrido
         for connection in self.active_connections:
-            await connection.send_json(message)
+            self.send(connection, frame)
+
+
+RoomListLoader = Callable[[], List[Dict[str, Any]]]
+
+
+class RoomListBroadcaster:
+    """Agrupa los envíos de la lista de salas.
+
+    Cada cambio solo marca la lista como desactualizada; la lista se lee y se envía a lo sumo una vez
+    por `interval` segundos. El primer cambio luego de un intervalo sin envíos se envía de inmediato,
+    y los cambios que llegan mientras tanto se agrupan en un único envío al final del intervalo,
+    que lee la lista con el último `loader` recibido.
+
+    Métricas: `requests` (pedidos de envío), `flushes` (envíos realizados)
+    y `coalesced` (pedidos que se agruparon en el envío de otro pedido).
+    """
+
+    def __init__(self, manager: ConnectionManagerRoomList, interval: float = ROOM_LIST_BROADCAST_INTERVAL):
+        self.manager = manager
+        self.interval = interval
+        self.loader: Optional[RoomListLoader] = None
+        self.flushing = False
+        self.pending: Optional[asyncio.Task] = None
+        self.last_flush = float("-inf")
+        self.requests = 0
+        self.flushes = 0
+        self.coalesced = 0
+
+    def clean_up(self):
+        """Descarta el envío pendiente, si lo hay"""
+        if self.pending is not None:
+            self.pending.cancel()
+        self.pending = None
+        self.loader = None
+        self.flushing = False
+        self.last_flush = float("-inf")
+
+    async def request(self, loader: RoomListLoader):
+        """Marca la lista de salas como desactualizada y la envía cuando corresponda
+
+        Args:
+            loader (RoomListLoader): Función bloqueante que devuelve la lista de salas actualizada
+        """
+        self.requests += 1
+        if self.loader is not None:
+            self.coalesced += 1
+        self.loader = loader
+        if self.flushing or (self.pending is not None and not self.pending.done()):
+            return
+        delay = self.last_flush + self.interval - time.monotonic()
+        if delay <= 0:
+            await self.flush()
+        else:
+            self.pending = asyncio.create_task(self.flush_later(delay))
+
+    async def flush_later(self, delay: float):
+        await asyncio.sleep(delay)
+        self.pending = None
+        if self.loader is not None and not self.flushing:
+            await self.flush()
+
+    async def flush(self):
+        """Lee la lista de salas con el último `loader` y envía los cambios a los clientes"""
+        self.flushing = True
+        try:
+            loader, self.loader = self.loader, None
+            room_list = await run_blocking(loader)
+            self.flushes += 1
+            await self.manager.publish(room_list)
+        finally:
+            self.last_flush = time.monotonic()
+            self.flushing = False
+        if self.loader is not None:
+            self.pending = asyncio.create_task(self.flush_later(self.interval))
+
 
+class ConnectionManagerRoom(OutboundConnections):
+    """Conexiones de los jugadores, por sala.
+
+    Los envíos por ID y los broadcasts se publican en el canal `room` del backplane,
+    así que llegan también a los jugadores conectados a otros procesos (ver `receive`).
+    """
 
-class ConnectionManagerRoom:
     active_connections: Dict[int, Dict[int, WebSocket]]
+    owners: Dict[WebSocket, Tuple[int, int]]
 
-    def __init__(self):
+    def __init__(self, backplane: Optional[Backplane] = None):
+        super().__init__()
         self.active_connections = {}
+        # Índice inverso: a qué sala y jugador pertenece cada conexión
+        self.owners = {}
+        self.backplane = backplane or InProcessBackplane()
+        self.backplane.subscribe("room", self.receive)
 
     def clean_up(self):
         """Limpia la lista de conexiones activas"""
         self.active_connections.clear()
+        self.owners.clear()
+        self.clean_up_outbound()
 
     async def connect(self, playerID: int, roomID: int, websocket: WebSocket):
         """Acepta la conexión con el cliente y la almacena.
@@ -98,10 +305,14 @@ class ConnectionManagerRoom:
         await websocket.accept()
         if roomID in self.active_connections:
             if playerID in self.active_connections[roomID]:
-                await self.active_connections[roomID][playerID].close(4005, "Conexión abierta en otra pestaña")
+                previous = self.active_connections[roomID][playerID]
+                self.owners.pop(previous, None)
+                await self.close_connection(previous, 4005, "Conexión abierta en otra pestaña")
         if roomID not in self.active_connections:
             self.active_connections[roomID] = {}
         self.active_connections[roomID][playerID] = websocket
+        self.owners[websocket] = (roomID, playerID)
+        self.open_outbound(websocket)
 
     async def keep_listening(self, websocket: WebSocket):
         """Mantiene la conexión abierta con el cliente por tiempo indefinido
@@ -122,17 +333,10 @@ class ConnectionManagerRoom:
         Args:
             websocket (WebSocket): Conexión con el cliente
         """
-        if websocket.client_state != WebSocketState.DISCONNECTED:
-            await websocket.close()
-        active_connections = self.active_connections.copy()
-        for roomID in active_connections:
-            if websocket in active_connections[roomID].values():
-                playerID = list(active_connections[roomID].keys())[
-                    list(active_connections[roomID].values()).index(websocket)
-                ]
-                self.active_connections[roomID].pop(playerID)
-                if not self.active_connections[roomID]:
-                    self.active_connections.pop(roomID)
+        owner = self.owners.pop(websocket, None)
+        if owner is not None:
+            self._remove(*owner)
+        await self.close_connection(websocket)
 
     async def disconnect_by_id_room(self, playerID: int, roomID: int):
         """Remueve al cliente de la lista de conexiones activas y cierra la conexión en caso de que no esté cerrada
@@ -141,14 +345,20 @@ class ConnectionManagerRoom:
             playerID (int): ID del jugador
             roomID (int): ID de la sala
         """
+        await self.backplane.publish("room", {"op": "disconnect", "roomID": roomID, "playerID": playerID})
+
+    async def _disconnect_local(self, playerID: int, roomID: int):
         if roomID in self.active_connections:
             if playerID in self.active_connections[roomID]:
                 websocket = self.active_connections[roomID][playerID]
-                if websocket.client_state != WebSocketState.DISCONNECTED:
-                    await websocket.close()
-                self.active_connections[roomID].pop(playerID)
-                if not self.active_connections[roomID]:
-                    self.active_connections.pop(roomID)
+                self.owners.pop(websocket, None)
+                self._remove(roomID, playerID)
+                await self.close_connection(websocket)
+
+    def _remove(self, roomID: int, playerID: int):
+        self.active_connections[roomID].pop(playerID)
+        if not self.active_connections[roomID]:
+            self.active_connections.pop(roomID)
 
     async def send_personal_message(self, type: MessageType, payload: str, websocket: WebSocket):
         """Envía un mensaje personalizado al cliente
@@ -159,7 +369,7 @@ class ConnectionManagerRoom:
             websocket (WebSocket): Conexión con el cliente
         """
         message = {"type": type, "payload": payload}
-        await websocket.send_json(message)
+        self.send(websocket, message)
 
     async def send_personal_message_by_id(self, type: MessageType, payload: str, playerID: int, roomID: int):
         """Envía un mensaje personalizado al cliente
@@ -170,10 +380,8 @@ class ConnectionManagerRoom:
             playerID (int): ID del jugador
             roomID (int): ID de la sala
         """
-        message = {"type": type, "payload": payload}
-        if roomID in self.active_connections:
-            if playerID in self.active_connections[roomID]:
-                await self.active_connections[roomID][playerID].send_json(message)
+        frame = Frame.encode({"type": type, "payload": payload})
+        await self.backplane.publish("room", {"op": "send", "roomID": roomID, "playerID": playerID, "frame": frame})
 
     async def broadcast(self, type: MessageType, payload: str, roomID: int):
         """Envía un mensaje a todos los clientes conectados a la sala
@@ -183,11 +391,29 @@ class ConnectionManagerRoom:
             payload (str): Cuerpo del mensaje
             roomID (int): ID de la sala
         """
-        message = {"type": type, "payload": payload}
-        if roomID in self.active_connections:
-            for connection in self.active_connections[roomID].values():
-                await connection.send_json(message)
+        frame = Frame.encode({"type": type, "payload": payload})
+        await self.backplane.publish("room", {"op": "send", "roomID": roomID, "playerID": None, "frame": frame})
 
+    async def receive(self, message: Dict[str, Any]):
+        """Aplica sobre las conexiones de este proceso un envío publicado en el backplane
 
-ws_manager_room_list = ConnectionManagerRoomList()
-ws_manager_room = ConnectionManagerRoom()
+        Args:
+            message (Dict[str, Any]): Operación (`send` o `disconnect`), sala y jugador destinatarios
+            (None para todos los jugadores) y, para `send`, el mensaje serializado
+        """
+        roomID, playerID = message["roomID"], message["playerID"]
+        if message["op"] == "disconnect":
+            await self._disconnect_local(playerID, roomID)
+            return
+        frame = Frame(*message["frame"])
+        connections = self.active_connections.get(roomID, {})
+        if playerID is None:
+            for connection in connections.values():
+                self.send(connection, frame)
+        elif playerID in connections:
+            self.send(connections[playerID], frame)
+
+
+ws_manager_room_list = ConnectionManagerRoomList(backplane)
+room_list_broadcaster = RoomListBroadcaster(ws_manager_room_list)
+ws_manager_room = ConnectionManagerRoom(backplane)
@@ -93,19 +93,24 @@ def test_join_room_send_update_ws_room_list(client, test_db):
         ]
 
         response = client.put(f"/rooms/{room.roomID}/join", json={"playerID": players[3].playerID})
-        data = websocket.receive_json()
-        assert data["type"] == "status"
-        assert data["payload"] == [
-            {
-                "roomID": 1,
-                "roomName": "test_room1",
-                "maxPlayers": 4,
-                "actualPlayers": 4,
-                "started": False,
-                "private": False,
-                "playersID": [1, 2, 3, 4],
-            },
-        ]
+        delta = websocket.receive_json()
+        assert delta["type"] == "delta"
+        assert delta["seq"] == data["seq"] + 1
+        assert delta["payload"] == {
+            "added": [],
+            "updated": [
+                {
+                    "roomID": 1,
+                    "roomName": "test_room1",
+                    "maxPlayers": 4,
+                    "actualPlayers": 4,
+                    "started": False,
+                    "private": False,
+                    "playersID": [1, 2, 3, 4],
+                },
+            ],
+            "removed": [],
+        }
         assert response.status_code == 200
 
 
@@ -180,7 +185,7 @@ def test_join_room_game_started(client, test_db):
     db.add_all(players_room_relations)
     db.commit()
 
-    game = GameDB(roomID=room.roomID, board={}, lastMovements={}, prohibitedColor=None)
+    game = GameDB(roomID=room.roomID, board=None, lastMovements={}, prohibitedColor=None)
     db.add(game)
     db.commit()
 
@@ -141,19 +141,24 @@ def test_leave_room_send_update_ws_room_list(client, test_db):
             }
         ]
         response_leave = client.put("/rooms/1/leave", json=player_id)
-        data = websocket.receive_json()
-        assert data["type"] == "status"
-        assert data["payload"] == [
-            {
-                "roomID": 1,
-                "roomName": "test_room",
-                "maxPlayers": 4,
-                "actualPlayers": 1,
-                "started": False,
-                "private": False,
-                "playersID": [1],
-            }
-        ]
+        delta = websocket.receive_json()
+        assert delta["type"] == "delta"
+        assert delta["seq"] == data["seq"] + 1
+        assert delta["payload"] == {
+            "added": [],
+            "updated": [
+                {
+                    "roomID": 1,
+                    "roomName": "test_room",
+                    "maxPlayers": 4,
+                    "actualPlayers": 1,
+                    "started": False,
+                    "private": False,
+                    "playersID": [1],
+                }
+            ],
+            "removed": [],
+        }
         assert response_leave.status_code == 200
 
 
@@ -220,7 +225,7 @@ def test_leave_room_game_started(client, test_db):
     db.add_all(players_room_relations)
     db.commit()
 
-    game = GameDB(roomID=room.roomID, board={}, lastMovements={}, prohibitedColor=None)
+    game = GameDB(roomID=room.roomID, board=None, lastMovements={}, prohibitedColor=None)
     db.add(game)
     db.commit()
 
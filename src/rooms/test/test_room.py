@@ -229,18 +229,23 @@ def test_create_room_send_update_room_list_ws(client, test_db):
 
         response = client.post("/rooms/", json=data_room)
 
-        data = websocket.receive_json()
-        assert data["type"] == "status"
-        assert data["payload"] == [
-            {
-                "roomID": 1,
-                "roomName": "test_room",
-                "maxPlayers": 4,
-                "actualPlayers": 1,
-                "started": False,
-                "private": False,
-                "playersID": [1],
-            },
-        ]
+        delta = websocket.receive_json()
+        assert delta["type"] == "delta"
+        assert delta["seq"] == data["seq"] + 1
+        assert delta["payload"] == {
+            "added": [
+                {
+                    "roomID": 1,
+                    "roomName": "test_room",
+                    "maxPlayers": 4,
+                    "actualPlayers": 1,
+                    "started": False,
+                    "private": False,
+                    "playersID": [1],
+                },
+            ],
+            "updated": [],
+            "removed": [],
+        }
         assert response.status_code == 201
         assert response.json() == {"roomID": 1}
@@ -0,0 +1,86 @@
+import asyncio
+from unittest.mock import patch
+
+import httpx
+
+from src.conftest import FakeWebSocket
+from src.main import app
+from src.players.infrastructure.models import Player as PlayerDB
+from src.rooms.infrastructure.websocket import RoomListBroadcaster, room_list_broadcaster, ws_manager_room_list
+
+
+class PublishedRoomLists:
+    def __init__(self):
+        self.room_lists = []
+
+    async def publish(self, room_list):
+        self.room_lists.append(room_list)
+
+
+def test_burst_of_changes_is_sent_twice():
+    manager = PublishedRoomLists()
+    broadcaster = RoomListBroadcaster(manager, interval=0.05)
+
+    async def main():
+        await asyncio.gather(*(broadcaster.request(lambda i=i: [{"roomID": i}]) for i in range(50)))
+        await asyncio.sleep(0.1)
+
+    asyncio.run(main())
+
+    # El primer cambio se envía de inmediato y los 49 restantes se agrupan en un único envío con el último estado
+    assert manager.room_lists == [[{"roomID": 0}], [{"roomID": 49}]]
+    assert broadcaster.requests == 50
+    assert broadcaster.flushes == 2
+    assert broadcaster.coalesced == 48
+
+
+def test_changes_apart_in_time_are_sent_separately():
+    manager = PublishedRoomLists()
+    broadcaster = RoomListBroadcaster(manager, interval=0.01)
+
+    async def main():
+        for i in range(3):
+            await broadcaster.request(lambda i=i: [{"roomID": i}])
+            await asyncio.sleep(0.02)
+
+    asyncio.run(main())
+
+    assert manager.room_lists == [[{"roomID": 0}], [{"roomID": 1}], [{"roomID": 2}]]
+    assert broadcaster.coalesced == 0
+
+
+def test_burst_of_room_creations_reaches_clients_coalesced(test_db):
+    test_db.add_all([PlayerDB(playerID=playerID, username=f"player {playerID}") for playerID in range(1, 6)])
+    test_db.commit()
+    websocket = FakeWebSocket()
+    flushes, coalesced = room_list_broadcaster.flushes, room_list_broadcaster.coalesced
+
+    async def main():
+        ws_manager_room_list.clean_up()
+        await ws_manager_room_list.connect(websocket)
+        await ws_manager_room_list.send_snapshot(websocket)
+
+        # Todas las requests se atienden en este event loop, como en el servidor
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            for playerID in range(1, 6):
+                room = {"playerID": playerID, "roomName": f"room {playerID}", "minPlayers": 2, "maxPlayers": 4}
+                response = await client.post("/rooms", json=room)
+                assert response.status_code == 201
+
+        await asyncio.sleep(room_list_broadcaster.interval * 2)
+        ws_manager_room_list.clean_up()
+
+    with patch.object(room_list_broadcaster, "interval", 0.3):
+        asyncio.run(main())
+
+    snapshot, *deltas = websocket.sent
+    assert snapshot == {"type": "status", "seq": 0, "payload": []}
+    # La primera sala se envía de inmediato y las otras cuatro llegan juntas al final del intervalo
+    assert [delta["seq"] for delta in deltas] == [1, 2]
+    assert [[room["roomName"] for room in delta["payload"]["added"]] for delta in deltas] == [
+        ["room 1"],
+        ["room 2", "room 3", "room 4", "room 5"],
+    ]
+    assert room_list_broadcaster.flushes - flushes == 2
+    assert room_list_broadcaster.coalesced - coalesced == 3
@@ -0,0 +1,71 @@
+import asyncio
+
+from src.conftest import FakeWebSocket
+from src.rooms.infrastructure.websocket import ConnectionManagerRoomList
+
+
+def test_room_list_connections_keep_connection_order():
+    manager = ConnectionManagerRoomList()
+
+    async def main():
+        websockets = [FakeWebSocket() for _ in range(10)]
+        for websocket in websockets:
+            await manager.connect(websocket)
+
+        # Se desconectan clientes del principio, del medio y del final
+        for index in [0, 4, 9]:
+            await manager.disconnect(websockets[index])
+        remaining = [websocket for index, websocket in enumerate(websockets) if index not in [0, 4, 9]]
+
+        assert isinstance(manager.active_connections, dict)
+        assert list(manager.active_connections) == remaining
+        assert list(manager.outbound) == remaining
+
+        # Un cliente que se reconecta pasa al final
+        await manager.connect(websockets[4])
+        assert list(manager.active_connections) == remaining + [websockets[4]]
+        manager.clean_up()
+
+    asyncio.run(main())
+
+
+def test_room_list_disconnect_of_unknown_connection_is_ignored():
+    manager = ConnectionManagerRoomList()
+
+    async def main():
+        websocket = FakeWebSocket()
+        await manager.connect(websocket)
+
+        await manager.disconnect(websocket)
+        await manager.disconnect(websocket)
+
+        assert manager.active_connections == {}
+        assert manager.outbound == {}
+
+    asyncio.run(main())
+
+
+def test_room_list_broadcast_during_reconnect_storm():
+    manager = ConnectionManagerRoomList()
+
+    async def main():
+        websockets = [FakeWebSocket() for _ in range(1000)]
+        for websocket in websockets:
+            await manager.connect(websocket)
+
+        async def reconnect(websocket):
+            await manager.disconnect(websocket)
+            await manager.connect(FakeWebSocket())
+
+        async def publish():
+            for i in range(50):
+                await manager.publish([{"roomID": 1, "actualPlayers": i}])
+                await asyncio.sleep(0)
+
+        await asyncio.gather(publish(), *(reconnect(websocket) for websocket in websockets))
+
+        assert len(manager.active_connections) == len(manager.outbound) == 1000
+        assert not set(websockets) & set(manager.active_connections)
+        manager.clean_up()
+
+    asyncio.run(main())
@@ -0,0 +1,18 @@
+from src.rooms.infrastructure.websocket import RoomListFeed
+
+
+def test_room_list_feed_sends_only_changes():
+    feed = RoomListFeed()
+    room1 = {"roomID": 1, "roomName": "room1", "actualPlayers": 1}
+    room2 = {"roomID": 2, "roomName": "room2", "actualPlayers": 1}
+
+    assert feed.apply([room1, room2]) == {"added": [room1, room2], "updated": [], "removed": []}
+    assert feed.seq == 1
+
+    assert feed.apply([room1, room2]) is None
+    assert feed.seq == 1
+
+    room1_joined = {**room1, "actualPlayers": 2}
+    assert feed.apply([room1_joined]) == {"added": [], "updated": [room1_joined], "removed": [2]}
+    assert feed.seq == 2
+    assert feed.snapshot() == [room1_joined]
@@ -0,0 +1,35 @@
+from src.conftest import count_queries, override_get_db
+from src.games.infrastructure.models import Game as GameDB
+from src.players.infrastructure.models import Player as PlayerDB
+from src.rooms.infrastructure.models import PlayerRoom as PlayerRoomDB
+from src.rooms.infrastructure.models import Room as RoomDB
+from src.rooms.infrastructure.repository import SQLAlchemyRepository
+
+
+def create_rooms(test_db, first_roomID: int, amount: int):
+    for roomID in range(first_roomID, first_roomID + amount):
+        test_db.add(RoomDB(roomID=roomID, roomName=f"room {roomID}", minPlayers=2, maxPlayers=4, hostID=1))
+        for playerID in range(1, 4):
+            test_db.add(PlayerRoomDB(playerID=playerID, roomID=roomID, isActive=playerID != 2))
+        if roomID % 2 == 0:
+            test_db.add(GameDB(gameID=roomID, roomID=roomID, board="RGBY" * 9))
+    test_db.commit()
+
+
+def test_get_all_rooms_query_count_is_constant(test_db):
+    test_db.add_all([PlayerDB(playerID=playerID, username=f"player {playerID}") for playerID in range(1, 4)])
+    create_rooms(test_db, 1, 10)
+
+    db = next(override_get_db())
+    with count_queries() as few_rooms_statements:
+        assert len(SQLAlchemyRepository(db).get_all_rooms()) == 10
+
+    create_rooms(test_db, 11, 990)
+    db = next(override_get_db())
+    with count_queries() as many_rooms_statements:
+        rooms = SQLAlchemyRepository(db).get_all_rooms()
+
+    assert len(few_rooms_statements) == len(many_rooms_statements) == 1
+    assert [room.roomID for room in rooms] == list(range(1, 1001))
+    assert all(room.actualPlayers == 2 and room.playersID == [1, 3] for room in rooms)
+    assert [room.started for room in rooms[:4]] == [False, True, False, True]
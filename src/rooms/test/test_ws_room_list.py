@@ -249,7 +249,7 @@ def test_get_room_started(client, test_db):
     db.add(room1)
     db.commit()
     db.add(PlayerRoomDB(playerID=player1.playerID, roomID=room1.roomID))
-    game1 = GameDB(roomID=room1.roomID, board={}, lastMovements={}, prohibitedColor=None)
+    game1 = GameDB(roomID=room1.roomID, board=None, lastMovements={}, prohibitedColor=None)
     db.add(game1)
     db.commit()
 
@@ -267,3 +267,23 @@ def test_get_room_started(client, test_db):
                 "playersID": [1],
             },
         ]
+
+
+def test_room_list_resync_sends_snapshot(client, test_db):
+    db = next(override_get_db())
+    db.add_all(
+        [
+            PlayerDB(playerID=1, username="test user"),
+            RoomDB(roomID=1, roomName="test room", minPlayers=2, maxPlayers=4, hostID=1),
+            PlayerRoomDB(playerID=1, roomID=1),
+        ]
+    )
+    db.commit()
+
+    with client.websocket_connect("/rooms/1") as websocket:
+        snapshot = websocket.receive_json()
+        assert snapshot["type"] == "status"
+
+        websocket.send_text("resync")
+        resync = websocket.receive_json()
+        assert resync == snapshot
@@ -0,0 +1,198 @@
+import asyncio
+import json
+import logging
+import os
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+MessageHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# Sin URL los envíos solo llegan a los clientes de este proceso (un único worker).
+# Con varios workers se indica el socket del broker local, por ejemplo unix:///tmp/switcher-backplane.sock
+WS_BACKPLANE_URL = os.environ.get("WEBSOCKET_BACKPLANE_URL")
+
+# Un mensaje por línea; la lista de salas completa puede superar el límite por defecto de asyncio (64 KiB)
+STREAM_LIMIT = 16 * 1024 * 1024
+
+# Espera entre reintentos de conexión con el broker, en segundos
+RECONNECT_MIN_DELAY = 0.1
+RECONNECT_MAX_DELAY = 5.0
+
+
+class Backplane(ABC):
+    """Canal de publicación/suscripción para los envíos por websocket.
+
+    Cada administrador de conexiones se suscribe a un canal y publica en él sus envíos; el backplane
+    entrega cada mensaje publicado a los suscriptores del canal en todos los procesos, de modo que
+    un envío originado en un worker llega también a los clientes conectados a los demás workers.
+    """
+
+    def __init__(self):
+        self.handlers: Dict[str, MessageHandler] = {}
+
+    def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        self.handlers[channel] = handler
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    @abstractmethod
+    async def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        pass
+
+    async def deliver(self, channel: str, message: Dict[str, Any]) -> None:
+        handler = self.handlers.get(channel)
+        if handler is not None:
+            await handler(message)
+
+
+class InProcessBackplane(Backplane):
+    """Backplane de un único proceso: cada mensaje se entrega directamente a los suscriptores locales"""
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        await self.deliver(channel, message)
+
+
+class SocketBackplane(Backplane):
+    """Backplane a través del broker local (`run_broker`) escuchando en un socket Unix.
+
+    Los mensajes publicados se envían al broker, que los reenvía a todos los procesos conectados,
+    incluido el que los publicó, así que todos los procesos los reciben en el mismo orden.
+
+    Si se pierde la conexión con el broker se reintenta con espera exponencial (entre
+    `RECONNECT_MIN_DELAY` y `RECONNECT_MAX_DELAY` segundos). Mientras tanto los mensajes publicados
+    se entregan solo a los suscriptores de este proceso, así que las requests no fallan por el broker.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.listener: Optional[asyncio.Task] = None
+        self.reconnects = 0
+
+    async def start(self) -> None:
+        try:
+            reader: Optional[asyncio.StreamReader] = await self.connect()
+        except OSError:
+            logger.exception("No se pudo conectar con el broker en %s", self.path)
+            reader = None
+        self.listener = asyncio.create_task(self.run(reader))
+
+    async def stop(self) -> None:
+        if self.listener is not None:
+            self.listener.cancel()
+        self.disconnect()
+        self.listener = None
+
+    async def connect(self) -> asyncio.StreamReader:
+        reader, writer = await asyncio.open_unix_connection(self.path, limit=STREAM_LIMIT)
+        # El broker confirma con una línea vacía que ya reenvía los mensajes a esta conexión
+        if not await reader.readline():
+            writer.close()
+            raise ConnectionResetError("El broker cerró la conexión")
+        self.writer = writer
+        return reader
+
+    def disconnect(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+        self.writer = None
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        if self.writer is not None:
+            line = json.dumps({"channel": channel, "message": message}, separators=(",", ":"), ensure_ascii=False)
+            try:
+                self.writer.write(line.encode() + b"\n")
+                await self.writer.drain()
+                return
+            except OSError:
+                logger.warning("Se perdió la conexión con el broker al publicar en %s", channel)
+                self.disconnect()
+        # Sin broker el mensaje llega al menos a los clientes de este proceso
+        await self.deliver(channel, message)
+
+    async def run(self, reader: Optional[asyncio.StreamReader]) -> None:
+        """Escucha los mensajes del broker y se reconecta cada vez que se pierde la conexión"""
+        delay = RECONNECT_MIN_DELAY
+        while True:
+            if reader is not None:
+                await self.listen(reader)
+                self.disconnect()
+                logger.warning("Se perdió la conexión con el broker en %s", self.path)
+            await asyncio.sleep(delay)
+            try:
+                reader = await self.connect()
+            except OSError:
+                reader = None
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+            else:
+                self.reconnects += 1
+                delay = RECONNECT_MIN_DELAY
+
+    async def listen(self, reader: asyncio.StreamReader) -> None:
+        """Entrega los mensajes recibidos hasta que el broker cierra la conexión.
+        Un mensaje que no se puede entregar no interrumpe la entrega de los siguientes
+        """
+        try:
+            while line := await reader.readline():
+                try:
+                    data = json.loads(line)
+                    await self.deliver(data["channel"], data["message"])
+                except Exception:
+                    logger.exception("No se pudo entregar un mensaje del backplane")
+        except (OSError, ValueError):
+            # ValueError: una línea que supera `STREAM_LIMIT` deja el stream en un estado inválido
+            logger.exception("Error al leer del broker en %s", self.path)
+
+
+async def run_broker(path: str) -> None:
+    """Broker local para `SocketBackplane`: reenvía cada línea recibida a todos los procesos conectados
+
+    Args:
+        path (str): Ruta del socket Unix en el que escucha
+    """
+    clients: Set[asyncio.StreamWriter] = set()
+
+    async def relay(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        clients.add(writer)
+        writer.write(b"\n")
+        try:
+            while line := await reader.readline():
+                for client in list(clients):
+                    client.write(line)
+                await asyncio.gather(*(client.drain() for client in list(clients)), return_exceptions=True)
+        finally:
+            clients.discard(writer)
+            writer.close()
+
+    if os.path.exists(path):
+        os.unlink(path)
+    server = await asyncio.start_unix_server(relay, path, limit=STREAM_LIMIT)
+    async with server:
+        await server.serve_forever()
+
+
+def create_backplane(url: Optional[str] = WS_BACKPLANE_URL) -> Backplane:
+    """Crea el backplane indicado por la URL (en proceso si no se indica ninguna)"""
+    if not url:
+        return InProcessBackplane()
+    parsed = urlparse(url)
+    if parsed.scheme != "unix":
+        raise ValueError(f"Backplane no soportado: {url}")
+    return SocketBackplane(parsed.path)
+
+
+backplane = create_backplane()
+
+
+if __name__ == "__main__":
+    # python -m src.shared.backplane /tmp/switcher-backplane.sock
+    asyncio.run(run_broker(sys.argv[1]))
@@ -0,0 +1,22 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+from src.database import DB_POOL_SIZE
+
+T = TypeVar("T")
+
+# Acotado al tamaño del pool de conexiones: más hilos que conexiones solo esperarían una conexión libre.
+blocking_executor = ThreadPoolExecutor(max_workers=DB_POOL_SIZE, thread_name_prefix="blocking")
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Ejecuta una función bloqueante (acceso a la base de datos, búsqueda de figuras)
+    en el pool de hilos, sin frenar el event loop mientras tanto.
+
+    Las llamadas de una misma request se hacen de a una (se espera cada resultado),
+    por lo que la sesión de la request nunca se usa desde dos hilos a la vez.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(blocking_executor, partial(func, *args, **kwargs))
@@ -0,0 +1,179 @@
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+from fastapi.websockets import WebSocketState
+
+from src.conftest import FakeWebSocket
+from src.games.infrastructure.websocket import ConnectionManagerGame, MessageType
+from src.rooms.infrastructure.websocket import ConnectionManagerRoomList
+from src.shared.backplane import InProcessBackplane, SocketBackplane, create_backplane
+
+
+def start_broker(path):
+    """Broker local en un proceso aparte, como se ejecuta junto a los workers"""
+    process = subprocess.Popen([sys.executable, "-m", "src.shared.backplane", path])
+    deadline = time.monotonic() + 10
+    while not os.path.exists(path):
+        assert time.monotonic() < deadline, "El broker no inició"
+        time.sleep(0.01)
+    return process
+
+
+def stop_broker(process):
+    process.terminate()
+    process.wait()
+
+
+@pytest.fixture
+def broker(tmp_path):
+    path = str(tmp_path / "backplane.sock")
+    process = start_broker(path)
+    yield path
+    stop_broker(process)
+
+
+def test_create_backplane():
+    assert isinstance(create_backplane(None), InProcessBackplane)
+    assert create_backplane("unix:///tmp/switcher.sock").path == "/tmp/switcher.sock"
+    with pytest.raises(ValueError):
+        create_backplane("tcp://localhost:6379")
+
+
+def test_broadcast_reaches_players_connected_to_other_workers(broker):
+    async def main():
+        # Dos workers, cada uno con su backplane y sus administradores de conexiones
+        backplane_a, backplane_b = SocketBackplane(broker), SocketBackplane(broker)
+        await backplane_a.start()
+        await backplane_b.start()
+        manager_a, manager_b = ConnectionManagerGame(backplane_a), ConnectionManagerGame(backplane_b)
+        room_list_a, room_list_b = ConnectionManagerRoomList(backplane_a), ConnectionManagerRoomList(backplane_b)
+
+        player1, player2, viewer = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+        await manager_a.connect(1, 1, player1)
+        await manager_b.connect(2, 1, player2)
+        await room_list_b.connect(viewer)
+
+        await manager_a.broadcast(MessageType.MSG, {"text": "hola"}, 1)
+        await manager_a.send_personal_message_by_id(MessageType.STATUS, {"turn": 2}, 2, 1)
+        await room_list_a.publish([{"roomID": 1, "actualPlayers": 1}])
+        await manager_a.disconnect_by_id(2, 1)
+        await asyncio.sleep(0.2)
+
+        assert player1.sent == [{"type": "msg", "payload": {"text": "hola"}}]
+        assert player2.sent == [
+            {"type": "msg", "payload": {"text": "hola"}},
+            {"type": "status", "payload": {"turn": 2}},
+        ]
+        assert player2.client_state == WebSocketState.DISCONNECTED
+        assert 1 not in manager_b.active_connections
+        delta = {"added": [{"roomID": 1, "actualPlayers": 1}], "updated": [], "removed": []}
+        assert viewer.sent == [{"type": "delta", "seq": 1, "payload": delta}]
+
+        for manager in (manager_a, manager_b, room_list_a, room_list_b):
+            manager.clean_up()
+        await backplane_a.stop()
+        await backplane_b.stop()
+
+    asyncio.run(main())
+
+
+def test_handler_error_does_not_stop_the_listener(broker):
+    async def main():
+        backplane = SocketBackplane(broker)
+        await backplane.start()
+        received = []
+
+        async def handler(message):
+            if message["n"] == 1:
+                raise RuntimeError("falla del suscriptor")
+            received.append(message["n"])
+
+        backplane.subscribe("test", handler)
+        for n in range(1, 4):
+            await backplane.publish("test", {"n": n})
+        await asyncio.sleep(0.2)
+
+        assert received == [2, 3]
+        assert not backplane.listener.done()
+        await backplane.stop()
+
+    asyncio.run(main())
+
+
+def test_backplane_reconnects_after_the_broker_restarts(tmp_path):
+    path = str(tmp_path / "backplane.sock")
+    process = start_broker(path)
+
+    async def wait_for(condition):
+        deadline = time.monotonic() + 10
+        while not condition():
+            assert time.monotonic() < deadline
+            await asyncio.sleep(0.01)
+
+    async def main():
+        backplane_a, backplane_b = SocketBackplane(path), SocketBackplane(path)
+        await backplane_a.start()
+        await backplane_b.start()
+        received_a, received_b = [], []
+
+        async def handler_a(message):
+            received_a.append(message["n"])
+
+        async def handler_b(message):
+            received_b.append(message["n"])
+
+        backplane_a.subscribe("test", handler_a)
+        backplane_b.subscribe("test", handler_b)
+
+        stop_broker(process)
+        await wait_for(lambda: backplane_a.writer is None and backplane_b.writer is None)
+
+        # Sin broker publicar no falla y el mensaje llega a los suscriptores del mismo proceso
+        await backplane_a.publish("test", {"n": 1})
+        assert received_a == [1]
+        assert received_b == []
+
+        restarted = start_broker(path)
+        try:
+            await wait_for(lambda: backplane_a.reconnects == 1 and backplane_b.reconnects == 1)
+            await backplane_a.publish("test", {"n": 2})
+            await wait_for(lambda: received_b == [2])
+            assert received_a == [1, 2]
+        finally:
+            await backplane_a.stop()
+            await backplane_b.stop()
+            stop_broker(restarted)
+
+    asyncio.run(main())
+
+
+def test_refresh_does_not_publish_the_room_list():
+    class RecordingBackplane(InProcessBackplane):
+        def __init__(self):
+            super().__init__()
+            self.published = []
+
+        async def publish(self, channel, message):
+            self.published.append(channel)
+            await super().publish(channel, message)
+
+    async def main():
+        backplane = RecordingBackplane()
+        room_list = ConnectionManagerRoomList(backplane)
+        viewer = FakeWebSocket()
+        await room_list.connect(viewer)
+
+        await room_list.refresh([{"roomID": 1, "actualPlayers": 1}])
+        await room_list.refresh([{"roomID": 1, "actualPlayers": 1}])
+        await asyncio.sleep(0.05)
+
+        assert backplane.published == []
+        delta = {"added": [{"roomID": 1, "actualPlayers": 1}], "updated": [], "removed": []}
+        assert viewer.sent == [{"type": "delta", "seq": 1, "payload": delta}]
+        room_list.clean_up()
+
+    asyncio.run(main())
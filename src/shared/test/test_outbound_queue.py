@@ -0,0 +1,85 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+from src.conftest import FakeWebSocket
+from src.games.infrastructure.websocket import ConnectionManagerGame, MessageType
+from src.shared.websocket import SLOW_CONSUMER_CLOSE_CODE, Frame, OutboundQueue, SlowConsumerPolicy
+
+
+def test_slow_client_does_not_delay_the_others():
+    manager = ConnectionManagerGame()
+    slow, fast = FakeWebSocket(delay=1), FakeWebSocket()
+
+    async def main():
+        await manager.connect(1, 1, slow)
+        await manager.connect(2, 1, fast)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for i in range(10):
+            await manager.broadcast(MessageType.MSG, {"text": str(i)}, 1)
+        assert loop.time() - start < 0.1
+
+        await asyncio.sleep(0.05)
+        assert len(fast.sent) == 10
+        assert slow.sent == []
+        assert manager.queue_metrics()["max_depth"] == 9
+        manager.clean_up()
+
+    asyncio.run(main())
+
+
+def test_drop_oldest_keeps_latest_status():
+    websocket = FakeWebSocket(delay=1)
+
+    async def main():
+        queue = OutboundQueue(websocket, maxsize=3, policy=SlowConsumerPolicy.DROP_OLDEST)
+        queue.put(Frame.encode({"type": "status", "payload": 0}))
+        await asyncio.sleep(0)  # el escritor toma el primer mensaje y queda esperando al cliente
+        for i in range(1, 6):
+            queue.put(Frame.encode({"type": "status", "payload": i}))
+        queue.put(Frame.encode({"type": "msg", "payload": "log"}))
+
+        assert [json.loads(frame.text)["payload"] for frame in queue.frames] == [4, 5, "log"]
+        assert queue.dropped == 3
+        assert websocket.close_code is None
+        queue.writer.cancel()
+
+    asyncio.run(main())
+
+
+def test_disconnect_policy_closes_slow_client():
+    websocket = FakeWebSocket(delay=0.01)
+
+    async def main():
+        queue = OutboundQueue(websocket, maxsize=2, policy=SlowConsumerPolicy.DISCONNECT)
+        for i in range(3):
+            queue.put(Frame.encode({"type": "status", "payload": i}))
+        await asyncio.sleep(0.05)
+
+        assert queue.slow_consumer
+        assert websocket.close_code == SLOW_CONSUMER_CLOSE_CODE
+        assert websocket.sent == []
+
+    asyncio.run(main())
+
+
+def test_broadcast_encodes_once():
+    manager = ConnectionManagerGame()
+    websockets = [FakeWebSocket() for _ in range(50)]
+
+    async def main():
+        for playerID, websocket in enumerate(websockets):
+            await manager.connect(playerID, 1, websocket)
+
+        with patch("src.shared.websocket.Frame.encode", wraps=Frame.encode) as encode:
+            await manager.broadcast(MessageType.MSG, {"username": "jugador", "text": "¡hola!"}, 1)
+        await asyncio.sleep(0.01)
+
+        assert encode.call_count == 1
+        expected = [{"type": "msg", "payload": {"username": "jugador", "text": "¡hola!"}}]
+        assert all(websocket.sent == expected for websocket in websockets)
+        manager.clean_up()
+
+    asyncio.run(main())
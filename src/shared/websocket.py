@@ -0,0 +1,218 @@
+import asyncio
+import json
+import os
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Dict, NamedTuple, Optional, Union
+
+from fastapi.websockets import WebSocket, WebSocketState
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+class SlowConsumerPolicy(str, Enum):
+    DROP_OLDEST = "drop_oldest"
+    DISCONNECT = "disconnect"
+
+
+# Cantidad máxima de mensajes pendientes de envío por conexión y qué hacer cuando un cliente no los consume a tiempo
+WS_SEND_QUEUE_SIZE = int(os.environ.get("WEBSOCKET_SEND_QUEUE_SIZE", 64))
+WS_SLOW_CONSUMER_POLICY = SlowConsumerPolicy(os.environ.get("WEBSOCKET_SLOW_CONSUMER_POLICY", "drop_oldest"))
+
+SLOW_CONSUMER_CLOSE_CODE = 4008
+SLOW_CONSUMER_CLOSE_REASON = "Conexión demasiado lenta"
+
+# Un mensaje de estado contiene el estado completo, por lo que un estado posterior lo reemplaza
+DROPPABLE_MESSAGE_TYPE = "status"
+
+
+class Frame(NamedTuple):
+    """Mensaje ya serializado, listo para enviarse a cualquier cantidad de clientes"""
+
+    type: Optional[str]
+    text: str
+
+    @classmethod
+    def encode(cls, message: Dict[str, Any]) -> "Frame":
+        """Serializa el mensaje una única vez (con orjson si está instalado)"""
+        if HAS_ORJSON:
+            text = orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+        else:
+            text = json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+        return cls(message.get("type"), text)
+
+
+class CloseFrame(NamedTuple):
+    code: int
+    reason: Optional[str]
+
+
+class OutboundQueue:
+    """Cola acotada de mensajes salientes de una conexión, vaciada por su propia tarea escritora.
+
+    Encolar un mensaje no espera al cliente, así que un cliente lento no demora los envíos a los demás
+    ni a la request que originó el envío. Si la cola se llena se aplica `policy`:
+
+    - `drop_oldest`: se descarta el mensaje de estado más antiguo, siempre que quede otro estado posterior
+      que lo reemplace; si no lo hay, se desconecta al cliente
+    - `disconnect`: se desconecta al cliente
+
+    La cola pertenece al event loop en el que se creó; los mensajes encolados desde otro loop o hilo
+    se entregan con `call_soon_threadsafe`.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        maxsize: int = WS_SEND_QUEUE_SIZE,
+        policy: SlowConsumerPolicy = WS_SLOW_CONSUMER_POLICY,
+    ):
+        self.websocket = websocket
+        self.maxsize = maxsize
+        self.policy = policy
+        self.loop = asyncio.get_running_loop()
+        self.frames: Deque[Union[Frame, CloseFrame]] = deque()
+        self.ready = asyncio.Event()
+        self.closing = False
+        self.peak_depth = 0
+        self.dropped = 0
+        self.slow_consumer = False
+        self.writer = self.loop.create_task(self.write())
+
+    @property
+    def depth(self) -> int:
+        """Cantidad de mensajes pendientes de envío"""
+        return len(self.frames)
+
+    def put(self, frame: Frame) -> None:
+        """Encola un mensaje para el cliente sin esperar a que se envíe
+
+        Args:
+            frame (Frame): Mensaje serializado a enviar
+        """
+        self._call_in_loop(self._put, frame)
+
+    def close(self, code: int = 1000, reason: Optional[str] = None) -> None:
+        """Cierra la conexión luego de enviar los mensajes pendientes
+
+        Args:
+            code (int): Código de cierre
+            reason (Optional[str]): Motivo del cierre
+        """
+        self._call_in_loop(self._close, code, reason)
+
+    async def write(self):
+        while True:
+            await self.ready.wait()
+            while self.frames:
+                frame = self.frames.popleft()
+                try:
+                    if isinstance(frame, CloseFrame):
+                        if self.websocket.client_state != WebSocketState.DISCONNECTED:
+                            await self.websocket.close(frame.code, frame.reason)
+                        return
+                    await self.websocket.send_text(frame.text)
+                except Exception:
+                    # El cliente ya no está conectado; la desconexión la registra quien escucha la conexión
+                    self.frames.clear()
+                    self.closing = True
+                    return
+            self.ready.clear()
+
+    def _call_in_loop(self, callback, *args) -> None:
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self.loop:
+            callback(*args)
+        elif not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(callback, *args)
+
+    def _put(self, frame: Frame) -> None:
+        if self.closing:
+            return
+        if len(self.frames) >= self.maxsize and not self._make_room(frame):
+            self.slow_consumer = True
+            self.frames.clear()
+            self._close(SLOW_CONSUMER_CLOSE_CODE, SLOW_CONSUMER_CLOSE_REASON)
+            return
+        self.frames.append(frame)
+        self.peak_depth = max(self.peak_depth, len(self.frames))
+        self.ready.set()
+
+    def _make_room(self, frame: Frame) -> bool:
+        if self.policy != SlowConsumerPolicy.DROP_OLDEST:
+            return False
+        statuses = [
+            i
+            for i, queued in enumerate(self.frames)
+            if isinstance(queued, Frame) and queued.type == DROPPABLE_MESSAGE_TYPE
+        ]
+        if not statuses or (len(statuses) == 1 and frame.type != DROPPABLE_MESSAGE_TYPE):
+            return False
+        del self.frames[statuses[0]]
+        self.dropped += 1
+        return True
+
+    def _close(self, code: int, reason: Optional[str]) -> None:
+        if self.closing:
+            return
+        self.closing = True
+        self.frames.append(CloseFrame(code, reason))
+        self.ready.set()
+
+
+class OutboundConnections:
+    """Colas de salida de las conexiones de un administrador de websockets"""
+
+    outbound: Dict[WebSocket, OutboundQueue]
+
+    def __init__(self):
+        self.outbound = {}
+        self.slow_consumer_disconnects = 0
+
+    def open_outbound(self, websocket: WebSocket) -> None:
+        self.outbound[websocket] = OutboundQueue(websocket)
+
+    def send(self, websocket: WebSocket, message: Union[Dict[str, Any], Frame]) -> None:
+        """Encola un mensaje para el cliente. Si la conexión no tiene cola (ya se cerró), el mensaje se descarta.
+        Para enviar el mismo mensaje a varios clientes conviene serializarlo antes con `Frame.encode`
+        """
+        queue = self.outbound.get(websocket)
+        if queue is not None:
+            queue.put(message if isinstance(message, Frame) else Frame.encode(message))
+
+    async def close_connection(self, websocket: WebSocket, code: int = 1000, reason: Optional[str] = None) -> None:
+        """Cierra la conexión con el cliente, luego de enviarle los mensajes pendientes"""
+        queue = self.outbound.pop(websocket, None)
+        if queue is not None:
+            if queue.slow_consumer:
+                self.slow_consumer_disconnects += 1
+            queue.close(code, reason)
+        elif websocket.client_state != WebSocketState.DISCONNECTED:
+            await websocket.close(code, reason)
+
+    def clean_up_outbound(self) -> None:
+        for queue in self.outbound.values():
+            queue.writer.cancel()
+        self.outbound.clear()
+
+    def queue_metrics(self) -> Dict[str, int]:
+        """Métricas de las colas de salida: mensajes pendientes en total y en la cola más cargada,
+        mensajes de estado descartados y clientes desconectados por lentos
+        """
+        depths = [queue.depth for queue in self.outbound.values()]
+        return {
+            "connections": len(depths),
+            "pending": sum(depths),
+            "max_depth": max(depths, default=0),
+            "peak_depth": max((queue.peak_depth for queue in self.outbound.values()), default=0),
+            "dropped": sum(queue.dropped for queue in self.outbound.values()),
+            "slow_consumer_disconnects": self.slow_consumer_disconnects,
+        }